@@ -54,6 +54,20 @@ def sanitize_key_name(name: str) -> str:
     return re.sub(r"[^a-zA-Z0-9_]", "_", name.lower().strip())
 
 
+# Fields every closing cost submission must include, in error-reporting order
+CLOSING_COST_REQUIRED_FIELDS = ("name", "type", "value", "calculation_base", "description")
+_CLOSING_COST_REQUIRED_SET = frozenset(CLOSING_COST_REQUIRED_FIELDS)
+
+
+def validate_closing_cost_fields(data) -> Optional[str]:
+    """Return an error for the first required closing cost field missing from ``data``."""
+    missing = _CLOSING_COST_REQUIRED_SET.difference(data.keys())
+    if not missing:
+        return None
+    field = next(f for f in CLOSING_COST_REQUIRED_FIELDS if f in missing)
+    return f"Missing required field: {field}"
+
+
 def update_closing_cost_logic(costs, n, data):
     """Update an existing closing cost in the costs dict. Returns (updated_costs, error_message)."""
     if not isinstance(costs, dict):
@@ -66,10 +80,9 @@ def update_closing_cost_logic(costs, n, data):
         return costs, "Invalid data provided"
 
     # Validate required fields
-    required_fields = ["name", "type", "value", "calculation_base", "description"]
-    for field in required_fields:
-        if field not in data:
-            return costs, f"Missing required field: {field}"
+    fields_error = validate_closing_cost_fields(data)
+    if fields_error:
+        return costs, fields_error
 
     # Validate name
     name_error = validate_string_field(data["name"], "Name", max_length=100)
@@ -204,6 +217,9 @@ def delete_fee_logic(fees, fee_type):
 
 def add_closing_cost_logic(costs, data):
     """Add a new closing cost to the costs dict. Returns (updated_costs, error_message)."""
+    fields_error = validate_closing_cost_fields(data)
+    if fields_error:
+        return costs, fields_error
     name = data["name"].lower().replace(" ", "_")
     if name in costs:
         return costs, "Closing cost already exists"
@@ -257,18 +273,23 @@ def delete_template_logic(templates, template_name):
     return templates, None
 
 
-def update_mortgage_config_logic(config, data):
-    """Update allowed fields in the mortgage config dict. Returns (updated_config, error_message)."""
-    # Example: update allowed fields only
-    allowed_fields = [
+MORTGAGE_CONFIG_UPDATABLE_FIELDS = frozenset(
+    {
         "max_loan_amount",
         "min_down_payment",
         "interest_rate",
         "prepaid_items",
-    ]
-    for field in allowed_fields:
-        if field in data:
-            config[field] = data[field]
+    }
+)
+
+
+def update_mortgage_config_logic(config, data):
+    """Update allowed fields in the mortgage config dict. Returns (updated_config, error_message)."""
+    fields = MORTGAGE_CONFIG_UPDATABLE_FIELDS.intersection(data)
+    if not fields:
+        return config, "No updatable fields provided"
+    for field in fields:
+        config[field] = data[field]
     return config, None
 
 
@@ -4,14 +4,16 @@ Admin routes for managing counties, fees, closing costs, templates, compliance t
 All endpoints are protected and require admin authentication.
 """
 import copy
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
-from functools import wraps
+from functools import lru_cache
 from statistics import StatisticsManager
 
 from flask import (
@@ -19,6 +21,7 @@ from flask import (
     current_app,
     flash,
     jsonify,
+    make_response,
     redirect,
     render_template,
     request,
@@ -26,6 +29,8 @@ from flask import (
     session,
     url_for,
 )
+from flask_wtf.csrf import generate_csrf
+from jinja2.filters import do_title
 
 import admin_logic
 from admin_logic import (
@@ -43,6 +48,8 @@ from admin_logic import (
     update_pmi_rates_logic,
     update_prepaid_items_logic,
 )
+from config_manager import ConfigManager
+from json_provider import ok_response
 
 # Import version directly
 from VERSION import VERSION
@@ -71,8 +78,6 @@ def record_login_attempt(ip_address):
 
 def log_admin_action(action, details, user="admin", ip_address=None):
     """Log admin actions for audit trail."""
-    from datetime import datetime
-
     audit_entry = {
         "timestamp": datetime.now().isoformat(),
         "user": user,
@@ -155,9 +160,11 @@ admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 # Configure logging
 logger = logging.getLogger(__name__)
 
-# Constants
-CLOSING_COSTS_FILE = "config/closing_costs.json"
-SELLER_CONTRIBUTIONS_FILE = "config/seller_contributions.json"
+# Constants. The data files live in the same config directory ConfigManager reads,
+# resolved once at import instead of against the working directory on every access
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "config")
+CLOSING_COSTS_FILE = os.path.join(CONFIG_DIR, "closing_costs.json")
+SELLER_CONTRIBUTIONS_FILE = os.path.join(CONFIG_DIR, "seller_contributions.json")
 
 
 def load_templates():
@@ -170,20 +177,80 @@ def save_templates(templates):
     current_app.config_manager.config["output_templates"] = templates
 
 
-def load_closing_costs():
-    """Load closing costs data from storage."""
+# Parsed JSON data files, keyed on each file's (mtime_ns, size)
+_closing_costs_cache = {"stamp": None, "data": {}}
+_seller_contributions_cache = {"stamp": None, "data": {}}
+# Serializes re-reads and saves, so threads that miss together parse the file once
+_data_file_lock = threading.Lock()
+
+
+def _file_stamp(path):
+    """Return (mtime_ns, size) of ``path``."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _load_cached_json(path, cache):
+    """Return the parsed JSON in ``path``, re-reading it only when the file changes."""
     try:
-        with open(CLOSING_COSTS_FILE, "r") as f:
-            return json.load(f)
+        stamp = _file_stamp(path)
     except FileNotFoundError:
         return {}
+    if stamp != cache["stamp"]:
+        with _data_file_lock:
+            # Another thread may have loaded this version while we waited
+            if stamp != cache["stamp"]:
+                with open(path, "r") as f:
+                    cache["data"] = json.load(f)
+                cache["stamp"] = stamp
+    return cache["data"]
+
+
+def _save_cached_json(path, cache, data, indent):
+    """
+    Atomically write ``data`` to ``path`` and make it the cached copy.
+
+    The calculator reloads closing_costs.json when its mtime changes, so the file
+    is replaced in one rename and never seen half-written.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    content = json.dumps(data, indent=indent)
+    with _data_file_lock:
+        ConfigManager._write_file_atomic(path, content)
+        cache["data"] = data
+        cache["stamp"] = _file_stamp(path)
+
+
+def load_closing_costs():
+    """
+    Load closing costs data from storage, re-reading the file only when it changes.
+
+    The returned dict is shared between requests and must not be mutated; edit a
+    copy and pass that to save_closing_costs.
+    """
+    return _load_cached_json(CLOSING_COSTS_FILE, _closing_costs_cache)
 
 
 def save_closing_costs(costs):
     """Save closing costs data to storage."""
-    os.makedirs(os.path.dirname(CLOSING_COSTS_FILE), exist_ok=True)
-    with open(CLOSING_COSTS_FILE, "w") as f:
-        json.dump(costs, f, indent=4)
+    _save_cached_json(CLOSING_COSTS_FILE, _closing_costs_cache, costs, indent=4)
+
+
+def load_seller_contributions():
+    """
+    Load seller contribution limits, re-reading the file only when it changes.
+
+    The returned dict is shared between requests and must not be mutated; edit a
+    copy and pass that to save_seller_contributions_data.
+    """
+    return _load_cached_json(SELLER_CONTRIBUTIONS_FILE, _seller_contributions_cache)
+
+
+def save_seller_contributions_data(contributions):
+    """Save seller contribution limits to storage."""
+    _save_cached_json(
+        SELLER_CONTRIBUTIONS_FILE, _seller_contributions_cache, contributions, indent=2
+    )
 
 
 def load_fees():
@@ -212,10 +279,59 @@ def get_admin_context(**kwargs):
     return context
 
 
-# Admin login check decorator
-def admin_required(f):
+@admin_bp.app_template_filter("humanize")
+@lru_cache(maxsize=256)
+def humanize_key(key):
+    """Turn a snake_case config key into a display label, e.g. "loan_amount" -> "Loan Amount"."""
+    return do_title(str(key).replace("_", " "))
+
+
+# Seconds an admin page ETag stays valid; pages embed a CSRF token, so this must stay
+# well below WTF_CSRF_TIME_LIMIT (one hour by default)
+ADMIN_PAGE_ETAG_TTL = 1800
+
+
+def render_admin_page(template_name, **kwargs):
     """
-    Decorator that requires admin authentication for a route with session timeout handling.
+    Render an admin page with an ETag, answering 304 when the browser's copy is current.
+
+    The ETag covers the template, its context, the session's CSRF token and a
+    time bucket, so a config edit, a new login or an ageing CSRF token all
+    produce a fresh page. Pages with pending flash messages are always rendered.
+    """
+    context = get_admin_context(**kwargs)
+    # Make sure the session's CSRF token exists before it goes into the ETag
+    generate_csrf()
+    fingerprint = json.dumps(
+        [
+            template_name,
+            context,
+            session.get("csrf_token"),
+            int(time.time()) // ADMIN_PAGE_ETAG_TTL,
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    etag = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+
+    if "_flashes" not in session and etag in request.if_none_match:
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(render_template(template_name, **context))
+    response.set_etag(etag)
+    return response
+
+
+# Admin endpoints that are reachable without logging in
+PUBLIC_ADMIN_ENDPOINTS = frozenset(
+    {"admin.login", "admin.test_login", "admin.logout", "admin.index"}
+)
+
+
+@admin_bp.before_request
+def require_admin_login():
+    """
+    Require admin authentication for every admin route with session timeout handling.
 
     Features:
     - Checks if user is logged in
@@ -223,41 +339,36 @@ def admin_required(f):
     - Updates last activity timestamp on each request
     - Redirects to login page if authentication fails
     """
+    if request.endpoint in PUBLIC_ADMIN_ENDPOINTS:
+        return None
 
-    @wraps(f)
-    def decorated_function(*args, **kwargs):
-        # Check if user is logged in
-        if not session.get("admin_logged_in"):
-            logger.warning(f"Unauthorized admin access attempt to {request.path}")
-            return redirect(url_for("admin.login"))
+    # Check if user is logged in
+    if not session.get("admin_logged_in"):
+        logger.warning(f"Unauthorized admin access attempt to {request.path}")
+        return redirect(url_for("admin.login"))
 
-        # Check session timeout (30 minutes of inactivity)
-        from datetime import datetime, timedelta
-
-        last_activity = session.get("admin_last_activity")
-        session_timeout = timedelta(minutes=30)
-
-        if last_activity:
-            try:
-                last_activity_time = datetime.fromisoformat(last_activity)
-                if datetime.now() - last_activity_time > session_timeout:
-                    logger.info("Admin session expired due to inactivity")
-                    session.clear()
-                    flash("Your session has expired. Please log in again.", "warning")
-                    return redirect(url_for("admin.login"))
-            except (ValueError, TypeError):
-                # Invalid timestamp, clear session
-                logger.warning("Invalid session timestamp detected, clearing session")
+    # Check session timeout (30 minutes of inactivity)
+    last_activity = session.get("admin_last_activity")
+    session_timeout = timedelta(minutes=30)
+
+    if last_activity:
+        try:
+            last_activity_time = datetime.fromisoformat(last_activity)
+            if datetime.now() - last_activity_time > session_timeout:
+                logger.info("Admin session expired due to inactivity")
                 session.clear()
+                flash("Your session has expired. Please log in again.", "warning")
                 return redirect(url_for("admin.login"))
+        except (ValueError, TypeError):
+            # Invalid timestamp, clear session
+            logger.warning("Invalid session timestamp detected, clearing session")
+            session.clear()
+            return redirect(url_for("admin.login"))
 
-        # Update last activity time
-        session["admin_last_activity"] = datetime.now().isoformat()
-        session.permanent = True
-
-        return f(*args, **kwargs)
-
-    return decorated_function
+    # Update last activity time
+    session["admin_last_activity"] = datetime.now().isoformat()
+    session.permanent = True
+    return None
 
 
 @admin_bp.route("/test-login", methods=["GET", "POST"])
@@ -334,8 +445,6 @@ def login():
 
         if username == valid_username and password == valid_password:
             # Set session variable and ensure it persists
-            from datetime import datetime
-
             session["admin_logged_in"] = True
             session["admin_last_activity"] = datetime.now().isoformat()
             session.permanent = True
@@ -381,7 +490,6 @@ def index():
 
 
 @admin_bp.route("/dashboard")
-@admin_required
 def dashboard():
     """Admin dashboard page."""
     # Initialize statistics manager if not already done
@@ -400,19 +508,40 @@ def dashboard():
 
 
 @admin_bp.route("/dashboard/data", methods=["GET"])
-@admin_required
 def dashboard_data():
-    """Return JSON data for admin dashboard statistics."""
+    """Return JSON data for admin dashboard statistics.
+
+    The dashboard polls this endpoint, so it carries an ETag built from the
+    config file mtimes, the calculation count and the latest change; an
+    unchanged poll gets a 304 without gathering the health information.
+    """
     try:
+        config_manager = current_app.config_manager
+        changes = config_manager.get_recent_changes()
+        calculation_count = len(config_manager.calculation_history)
+        fingerprint = json.dumps(
+            [
+                config_manager.get_config_version(),
+                calculation_count,
+                changes[-1] if changes else None,
+            ],
+            default=str,
+        )
+        etag = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+        if etag in request.if_none_match:
+            response = current_app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
         # Get statistics
-        config = current_app.config_manager.config
-        health_info = current_app.config_manager.get_system_health()
+        config = config_manager.config
+        health_info = config_manager.get_system_health()
 
         # Calculate statistics
         stats = {
-            "total_calculations": len(current_app.config_manager.calculation_history),
-            "output_templates": len(config.get("output_templates", {})),
-            "total_fees": len(config.get("closing_costs", {})),
+            "total_calculations": calculation_count,
+            "output_templates": len(config.get("output_templates") or ()),
+            "total_fees": len(config.get("closing_costs") or ()),
         }
 
         # System health checks
@@ -425,7 +554,7 @@ def dashboard_data():
 
         # Recent changes
         recent_changes = []
-        for change in current_app.config_manager.get_recent_changes()[-5:]:
+        for change in changes[-5:]:
             recent_changes.append(
                 {
                     "timestamp": change.get("timestamp", ""),
@@ -438,7 +567,9 @@ def dashboard_data():
         # Reverse to show newest first
         recent_changes.reverse()
 
-        return jsonify({"stats": stats, "health": health, "recent_changes": recent_changes})
+        response = jsonify({"stats": stats, "health": health, "recent_changes": recent_changes})
+        response.set_etag(etag)
+        return response
 
     except Exception as e:
         logger.error(f"Error getting dashboard data: {e}")
@@ -464,74 +595,55 @@ def dashboard_data():
 
 
 @admin_bp.route("/compliance")
-@admin_required
 def compliance():
     """Admin page for compliance text management."""
     compliance_text = current_app.config_manager.config.get("compliance_text", {})
-    return render_template(
-        "admin/compliance.html", compliance_text=compliance_text, **get_admin_context()
-    )
-
-
-@admin_bp.route("/compliance/add", methods=["POST"])
-@admin_required
-def add_compliance_text():
-    """Add a new compliance text section."""
-    data = request.get_json()
-    if not data:
-        return jsonify({"success": False, "error": "No data provided"}), 400
-
-    # Get current compliance text
-    compliance_text = current_app.config_manager.config.get("compliance_text", {})
-
-    section_name = data.get("section")
-    if not section_name:
-        return jsonify({"success": False, "error": "Section name is required"}), 400
-
-    if section_name in compliance_text:
-        return jsonify({"success": False, "error": "Section already exists"}), 400
+    return render_admin_page("admin/compliance.html", compliance_text=compliance_text)
 
-    # Validate required fields
-    if "text" not in data:
-        return jsonify({"success": False, "error": "Compliance text is required"}), 400
-
-    # Add new section
-    compliance_text[section_name] = data.get("text")
-
-    # Audit log the action
-    log_admin_action("COMPLIANCE_ADD", f"Added compliance text section: {section_name}")
 
-    # Save updated config
+def _save_compliance_text(compliance_text, verb, section_name):
+    """Persist compliance text and record the change in the audit trail."""
     current_app.config_manager.config["compliance_text"] = compliance_text
     current_app.config_manager.save_config()
     current_app.config_manager.add_change(
-        description=f"Added compliance text: {section_name}",
-        details=f"Added compliance text section: {section_name}",
+        description=f"{verb} compliance text: {section_name}",
+        details=f"{verb} compliance text section: {section_name}",
         user="admin",
     )
+    return ok_response()
 
-    return jsonify({"success": True})
 
+@admin_bp.route(
+    "/compliance/add", methods=["POST"], defaults={"action": "add", "section_name": None}
+)
+@admin_bp.route("/compliance/<any(edit, delete):action>/<section_name>", methods=["POST"])
+def modify_compliance_text(action, section_name):
+    """Add, edit or delete a compliance text section."""
+    compliance_text = current_app.config_manager.config.get("compliance_text", {})
+
+    if action == "delete":
+        if section_name not in compliance_text:
+            return jsonify({"success": False, "error": "Section not found"}), 404
+        del compliance_text[section_name]
+        return _save_compliance_text(compliance_text, "Deleted", section_name)
 
-@admin_bp.route("/compliance/edit/<section_name>", methods=["POST"])
-@admin_required
-def edit_compliance_text(section_name):
-    """Edit an existing compliance text section."""
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True) or {}
     if not data:
         return jsonify({"success": False, "error": "No data provided"}), 400
 
-    # Get current compliance text
-    compliance_text = current_app.config_manager.config.get("compliance_text", {})
-
-    if section_name not in compliance_text:
+    if action == "add":
+        section_name = data.get("section")
+        if not section_name:
+            return jsonify({"success": False, "error": "Section name is required"}), 400
+        if section_name in compliance_text:
+            return jsonify({"success": False, "error": "Section already exists"}), 400
+    elif section_name not in compliance_text:
         return jsonify({"success": False, "error": "Section not found"}), 404
 
     # Validate required fields
     if "text" not in data:
         return jsonify({"success": False, "error": "Compliance text is required"}), 400
 
-    # Update section
     compliance_text[section_name] = data.get("text")
 
     # Validate before saving
@@ -540,123 +652,71 @@ def edit_compliance_text(section_name):
         logger.error(f"Configuration validation failed: {error_msg}")
         return jsonify({"success": False, "error": f"Validation failed: {error_msg}"}), 400
 
-    # Save updated config
-    current_app.config_manager.config["compliance_text"] = compliance_text
-    current_app.config_manager.save_config()
-    current_app.config_manager.add_change(
-        description=f"Updated compliance text: {section_name}",
-        details=f"Updated compliance text section: {section_name}",
-        user="admin",
-    )
-
-    return jsonify({"success": True})
-
-
-@admin_bp.route("/compliance/delete/<section_name>", methods=["POST"])
-@admin_required
-def delete_compliance_text(section_name):
-    """Delete a compliance text section."""
-    # Get current compliance text
-    compliance_text = current_app.config_manager.config.get("compliance_text", {})
-
-    if section_name not in compliance_text:
-        return jsonify({"success": False, "error": "Section not found"}), 404
-
-    # Delete section
-    del compliance_text[section_name]
-
-    # Save updated config
-    current_app.config_manager.config["compliance_text"] = compliance_text
-    current_app.config_manager.save_config()
-    current_app.config_manager.add_change(
-        description=f"Deleted compliance text: {section_name}",
-        details=f"Deleted compliance text section: {section_name}",
-        user="admin",
-    )
-
-    return jsonify({"success": True})
+    if action == "add":
+        log_admin_action("COMPLIANCE_ADD", f"Added compliance text section: {section_name}")
+        return _save_compliance_text(compliance_text, "Added", section_name)
+    return _save_compliance_text(compliance_text, "Updated", section_name)
 
 
 @admin_bp.route("/templates")
-@admin_required
 def templates():
     """Admin page for managing output templates."""
     output_templates = current_app.config_manager.config.get("output_templates", {})
-    return render_template(
-        "admin/templates.html", output_templates=output_templates, **get_admin_context()
-    )
-
-
-@admin_bp.route("/templates/add", methods=["POST"])
-@admin_required
-def add_template():
-    """Add a new output template via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
-    templates = load_templates()
-    updated_templates, error = admin_logic.add_template_logic(templates, data)
-    if error:
-        return jsonify({"success": False, "error": error}), 400
-    save_templates(updated_templates)
-    return jsonify({"success": True})
+    return render_admin_page("admin/templates.html", output_templates=output_templates)
 
 
-@admin_bp.route("/templates/edit/<template_name>", methods=["POST"])
-@admin_required
-def edit_template(template_name):
-    """Edit an existing output template via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
-    templates = load_templates()
-    updated_templates, error = admin_logic.edit_template_logic(templates, template_name, data)
-    if error:
-        return jsonify({"success": False, "error": error}), 404
-    save_templates(updated_templates)
-    return jsonify({"success": True})
-
-
-@admin_bp.route("/templates/delete/<template_name>", methods=["POST"])
-@admin_required
-def delete_template(template_name):
-    """Delete an output template via the admin interface."""
+@admin_bp.route(
+    "/templates/add", methods=["POST"], defaults={"action": "add", "template_name": None}
+)
+@admin_bp.route("/templates/<any(edit, delete):action>/<template_name>", methods=["POST"])
+def modify_template(action, template_name):
+    """Add, edit or delete an output template via the admin interface."""
     templates = load_templates()
-    updated_templates, error = admin_logic.delete_template_logic(templates, template_name)
+    if action == "delete":
+        updated_templates, error = admin_logic.delete_template_logic(templates, template_name)
+    else:
+        data = request.get_json(cache=False, silent=True) or request.form.to_dict()
+        if action == "add":
+            updated_templates, error = admin_logic.add_template_logic(templates, data)
+        else:
+            updated_templates, error = admin_logic.edit_template_logic(
+                templates, template_name, data
+            )
     if error:
-        return jsonify({"success": False, "error": error}), 404
+        return jsonify({"success": False, "error": error}), 400 if action == "add" else 404
     save_templates(updated_templates)
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/fees", methods=["GET", "POST"])
-@admin_required
 def fees():
     """Admin page for managing fees."""
     if request.method == "POST":
-        data = request.get_json() or request.form.to_dict()
+        data = request.get_json(cache=False, silent=True) or request.form.to_dict()
         fees = load_fees()
         updated_fees, error = admin_logic.add_fee_logic(fees, data)
         if error:
             return jsonify({"success": False, "error": error}), 400
         save_fees(updated_fees)
-        return jsonify({"success": True})
+        return ok_response()
 
     closing_costs = current_app.config_manager.config.get("closing_costs", {})
-    return render_template("admin/fees.html", fees=closing_costs, **get_admin_context())
+    return render_admin_page("admin/fees.html", fees=closing_costs)
 
 
 @admin_bp.route("/fees/edit/<fee_type>", methods=["POST"])
-@admin_required
 def edit_fee(fee_type):
     """Edit an existing fee via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
+    data = request.get_json(cache=False, silent=True) or request.form.to_dict()
     fees = load_fees()
     updated_fees, error = admin_logic.edit_fee_logic(fees, fee_type, data)
     if error:
         return jsonify({"success": False, "error": error}), 404
     save_fees(updated_fees)
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/fees/delete/<fee_type>", methods=["POST"])
-@admin_required
 def delete_fee(fee_type):
     """Delete a fee via the admin interface."""
     fees = load_fees()
@@ -664,11 +724,10 @@ def delete_fee(fee_type):
     if error:
         return jsonify({"success": False, "error": error}), 404
     save_fees(updated_fees)
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/maintenance")
-@admin_required
 def maintenance():
     """Admin maintenance and backup page."""
     # Get system health information
@@ -690,14 +749,13 @@ def maintenance():
 
 
 @admin_bp.route("/maintenance/backup", methods=["POST"])
-@admin_required
 def create_backup():
     """Create a backup of the application data."""
     try:
         success = current_app.config_manager.backup_config()
         if success:
             flash("Backup created successfully", "success")
-            return jsonify({"success": True})
+            return ok_response()
         else:
             flash("Error creating backup", "error")
             return jsonify({"success": False, "error": "Error creating backup"}), 500
@@ -708,7 +766,6 @@ def create_backup():
 
 
 @admin_bp.route("/statistics")
-@admin_required
 def statistics():
     """Admin statistics page."""
     # Initialize statistics manager if needed
@@ -722,7 +779,6 @@ def statistics():
 
 
 @admin_bp.route("/api/statistics/data", methods=["GET"])
-@admin_required
 def statistics_data():
     """Return JSON data for admin statistics."""
     # Initialize statistics manager if needed
@@ -741,7 +797,6 @@ def statistics_data():
 
 
 @admin_bp.route("/api/statistics/export", methods=["GET"])
-@admin_required
 def export_statistics():
     """Export statistics data as a downloadable file."""
     # Initialize statistics manager if needed
@@ -775,7 +830,6 @@ def export_statistics():
 
 
 @admin_bp.route("/api/statistics/purge", methods=["POST"])
-@admin_required
 def purge_statistics():
     """Delete all statistics data."""
     # Initialize statistics manager if needed
@@ -784,7 +838,7 @@ def purge_statistics():
 
     try:
         # Get number of days from request, default to 365
-        days = request.json.get("days", 365)
+        days = (request.get_json(cache=False, silent=True) or {}).get("days", 365)
 
         # Validate days parameter
         try:
@@ -810,20 +864,17 @@ def purge_statistics():
 
 
 @admin_bp.route("/closing-costs")
-@admin_required
 def closing_costs():
     """Admin page for managing closing costs."""
     costs = load_closing_costs()
-    return render_template(
+    return render_admin_page(
         "admin/closing_costs.html",
         active_page="closing_costs",
         closing_costs=costs,
-        **get_admin_context(),
     )
 
 
 @admin_bp.route("/closing-costs/<name>")
-@admin_required
 def get_closing_cost(name):
     """Get a specific closing cost by name via the admin interface."""
     costs = load_closing_costs()
@@ -833,37 +884,36 @@ def get_closing_cost(name):
 
 
 @admin_bp.route("/closing-costs/add", methods=["POST"])
-@admin_required
 def add_closing_cost():
     """Add a new closing cost via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
-    costs = load_closing_costs()
+    data = request.get_json(cache=False, silent=True) or request.form.to_dict()
+    # The cached dict is shared with concurrent requests; only edit a copy
+    costs = dict(load_closing_costs())
     updated_costs, error = admin_logic.add_closing_cost_logic(costs, data)
     if error:
         return jsonify({"success": False, "error": error}), 400
     save_closing_costs(updated_costs)
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/closing-costs/<n>", methods=["DELETE"])
-@admin_required
 def delete_closing_cost(n):
     """Delete a closing cost via the admin interface."""
-    costs = load_closing_costs()
+    # The cached dict is shared with concurrent requests; only edit a copy
+    costs = dict(load_closing_costs())
     updated_costs, error = admin_logic.delete_closing_cost_logic(costs, n)
     if error:
         return jsonify({"success": False, "error": error}), 404
     save_closing_costs(updated_costs)
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/closing-costs/<n>", methods=["PUT", "POST"])  # Support both PUT and POST methods
-@admin_required
 def update_closing_cost(n):
     """Update an existing closing cost via the admin interface."""
     # Handle both JSON and form data for better compatibility
     if request.is_json:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         current_app.logger.info(f"Received JSON data: {data}")
     else:
         data = request.form.to_dict()
@@ -874,19 +924,25 @@ def update_closing_cost(n):
         return jsonify({"success": False, "error": "Invalid data"}), 400
 
     current_app.logger.info(f"Updating closing cost {n} with data: {data}")
-    costs = load_closing_costs()
+    # The cached dict is shared with concurrent requests and is never edited in place;
+    # the update goes into a deep copy because it changes nested entries
+    original_costs = load_closing_costs()
+    costs = copy.deepcopy(original_costs)
 
     updated_costs, error = admin_logic.update_closing_cost_logic(costs, n, data)
     if error:
         status = 404 if error == "Cost not found" else 400
         return jsonify({"success": False, "error": error}), status
 
+    # Re-submitted forms often change nothing; skip rewriting the file
+    if updated_costs == original_costs:
+        return ok_response(unchanged=True)
+
     save_closing_costs(updated_costs)
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/mortgage-config")
-@admin_required
 def mortgage_config():
     """Admin page for viewing and editing mortgage configuration."""
     # Get mortgage configuration from config
@@ -899,41 +955,36 @@ def mortgage_config():
     # Load seller contributions data
     seller_contributions = {}
     try:
-        if os.path.exists(SELLER_CONTRIBUTIONS_FILE):
-            with open(SELLER_CONTRIBUTIONS_FILE, "r") as f:
-                seller_contributions = json.load(f)
+        seller_contributions = load_seller_contributions()
     except Exception as e:
         logger.error(f"Error loading seller contributions: {e}")
         flash(f"Error loading seller contributions: {e}", "error")
 
-    return render_template(
+    return render_admin_page(
         "admin/mortgage_config.html",
         mortgage_config=mortgage_config,
         seller_contributions=seller_contributions,
         active_page="mortgage_config",
-        **get_admin_context(),
     )
 
 
 @admin_bp.route("/mortgage-config/update", methods=["POST"])
-@admin_required
 def update_mortgage_config():
     """Update mortgage configuration via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
+    data = request.get_json(cache=False, silent=True) or request.form.to_dict()
     config = current_app.config_manager.config
     updated_config, error = admin_logic.update_mortgage_config_logic(config, data)
     if error:
         return jsonify({"success": False, "error": error}), 400
     current_app.config_manager.config = updated_config
     current_app.config_manager.save_config()
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/mortgage-config/prepaid/update", methods=["POST"])
-@admin_required
 def update_prepaid_items():
     """Update prepaid items in the mortgage configuration via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
+    data = request.get_json(cache=False, silent=True) or request.form.to_dict()
     config = current_app.config_manager.config
     updated_config, error = admin_logic.update_prepaid_items_logic(
         config, data.get("prepaid_items")
@@ -942,25 +993,23 @@ def update_prepaid_items():
         return jsonify({"success": False, "error": error}), 400
     current_app.config_manager.config = updated_config
     current_app.config_manager.save_config()
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/mortgage-config/limits/update", methods=["POST"])
-@admin_required
 def update_loan_limits():
     """Update loan limits in the mortgage configuration via the admin interface."""
-    data = request.get_json() or request.form.to_dict()
+    data = request.get_json(cache=False, silent=True) or request.form.to_dict()
     config = current_app.config_manager.config
     updated_config, error = admin_logic.update_loan_limits_logic(config, data.get("loan_limits"))
     if error:
         return jsonify({"success": False, "error": error}), 400
     current_app.config_manager.config = updated_config
     current_app.config_manager.save_config()
-    return jsonify({"success": True})
+    return ok_response()
 
 
 @admin_bp.route("/pmi-rates")
-@admin_required
 def pmi_rates():
     """Admin page for managing PMI rates."""
     # Get PMI rates from config
@@ -1058,16 +1107,14 @@ def pmi_rates():
             "high_cost_loan_limit": 1089300,
         }
 
-    return render_template(
+    return render_admin_page(
         "admin/pmi_rates.html",
         pmi_rates=pmi_rates,
         active_page="pmi_rates",
-        **get_admin_context(),
     )
 
 
 @admin_bp.route("/pmi-rates/data")
-@admin_required
 def get_pmi_rates():
     """Get PMI rates data via the admin interface."""
     pmi_rates = current_app.config_manager.config.get("pmi_rates", {})
@@ -1075,13 +1122,12 @@ def get_pmi_rates():
 
 
 @admin_bp.route("/pmi-rates/update", methods=["POST"])
-@admin_required
 def update_pmi_rates():
     """Update PMI rates via the admin interface."""
     current_app.logger.info("PMI rates update request received")
 
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         if not data:
             current_app.logger.error("No data provided in PMI rates update")
             return jsonify({"success": False, "error": "No data provided"}), 400
@@ -1105,7 +1151,7 @@ def update_pmi_rates():
             user="admin",
         )
         current_app.logger.info("PMI rates updated successfully")
-        return jsonify({"success": True})
+        return ok_response()
     except Exception as e:
         import traceback
 
@@ -1116,32 +1162,30 @@ def update_pmi_rates():
 
 
 @admin_bp.route("/save_seller_contributions", methods=["POST"])
-@admin_required
 def save_seller_contributions():
     """Save seller contribution data via the admin interface."""
     try:
-        data = request.json
+        data = request.get_json(cache=False, silent=True) or {}
         loan_type = data.get("loan_type")
         contributions = data.get("contributions", {})
 
         if not loan_type:
             return jsonify({"success": False, "error": "Loan type is required"}), 400
 
-        # Load current seller contributions
-        seller_contributions = {}
-        if os.path.exists(SELLER_CONTRIBUTIONS_FILE):
-            with open(SELLER_CONTRIBUTIONS_FILE, "r") as f:
-                seller_contributions = json.load(f)
+        # Load current seller contributions; the cached dict is shared, so edit a copy
+        seller_contributions = dict(load_seller_contributions())
+
+        # Re-submitted forms often change nothing; skip rewriting the file
+        if seller_contributions.get(loan_type) == contributions:
+            return ok_response(unchanged=True)
 
         # Update the specific loan type's contributions
         seller_contributions[loan_type] = contributions
 
-        # Save back to file
-        with open(SELLER_CONTRIBUTIONS_FILE, "w") as f:
-            json.dump(seller_contributions, f, indent=2)
+        save_seller_contributions_data(seller_contributions)
 
         logger.info(f"Updated seller contributions for {loan_type}")
-        return jsonify({"success": True})
+        return ok_response()
 
     except Exception as e:
         logger.error(f"Error saving seller contributions: {e}")
@@ -1152,18 +1196,16 @@ def save_seller_contributions():
 
 
 @admin_bp.route("/title-insurance", methods=["GET"])
-@admin_required
 def title_insurance_config():
     """Display title insurance configuration management page."""
     try:
         # Deep copy to avoid modifying the loaded config directly if template manipulates it
         title_config = copy.deepcopy(current_app.config_manager.config.get("title_insurance", {}))
         logger.debug(f"Loaded title insurance config for admin page: {title_config}")
-        return render_template(
+        return render_admin_page(
             "admin/title_insurance.html",
             active_page="title_insurance",  # For sidebar highlighting
             title_config=title_config,
-            **get_admin_context(),
         )
     except Exception as e:
         logger.error(f"Error loading title insurance config page: {e}")
@@ -1172,7 +1214,6 @@ def title_insurance_config():
 
 
 @admin_bp.route("/title-insurance/update", methods=["POST"])
-@admin_required
 def update_title_insurance_config():
     """Update title insurance configuration."""
     try:
@@ -1286,7 +1327,6 @@ def update_title_insurance_config():
 
 
 @admin_bp.route("/validation")
-@admin_required
 def validation_dashboard():
     """Admin page for viewing configuration validation status."""
     try:
@@ -1303,7 +1343,6 @@ def validation_dashboard():
 
 
 @admin_bp.route("/validation/run", methods=["POST"])
-@admin_required
 def run_validation():
     """Run configuration validation and return results."""
     try:
@@ -1343,7 +1382,6 @@ def run_validation():
 
 
 @admin_bp.route("/validation/details/<filename>", methods=["GET"])
-@admin_required
 def validation_file_details(filename):
     """Get detailed validation information for a specific file."""
     try:
@@ -1380,7 +1418,6 @@ def validation_file_details(filename):
 
 
 @admin_bp.route("/validation/schema/<filename>", methods=["GET"])
-@admin_required
 def get_config_schema(filename):
     """Get the JSON schema for a specific configuration file."""
     try:
@@ -1399,11 +1436,10 @@ def get_config_schema(filename):
 
 
 @admin_bp.route("/validation/fix-suggestions", methods=["POST"])
-@admin_required
 def get_validation_fix_suggestions():
     """Get suggestions for fixing validation errors."""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or {}
         filename = data.get("filename")
         error_message = data.get("error")
 
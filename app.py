@@ -1,14 +1,20 @@
 """Flask application entry point for the Mortgage Calculator web app."""
+import copy
+import functools
+import gzip
+import hashlib
 import importlib
 import logging
 import os
 import sys
-import traceback
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, render_template, request, send_from_directory
-from flask_wtf.csrf import CSRFProtect
+from flask import Flask, jsonify, make_response, render_template, request, session
+from flask_wtf.csrf import CSRFProtect, generate_csrf
 
 # Set up Python path to handle both direct running and module imports
 base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -17,9 +23,6 @@ if base_dir not in sys.path:
 # Set MortgageCalc module for absolute imports
 sys.modules["MortgageCalc"] = sys.modules["__main__"]
 
-# Add current directory to path to ensure imports work properly
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from flask_login import LoginManager  # noqa: E402
 
 import admin_routes  # noqa: E402
@@ -29,48 +32,210 @@ import beta_routes  # noqa: E402
 import database  # noqa: E402
 import health_check  # noqa: E402
 from calculator import MortgageCalculator  # noqa: E402
+from coalescer import RequestCoalescer  # noqa: E402
 from config_factory import get_config  # noqa: E402
 from config_manager import ConfigManager  # noqa: E402
 
 # Now that paths are set up, we can safely import local modules
 from constants import TRANSACTION_TYPE  # noqa: E402
 from error_handling import ValidationError, handle_errors, validate_request_data  # noqa: E402
+from json_provider import error_response, init_json_provider, success_response  # noqa: E402
 from models import db  # noqa: E402
 
 # Configure logging early
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
 logger = logging.getLogger(__name__)
 logger.info("Application module loading")
 
+# The market data client is optional; /api/market-data serves fallback data without it
+try:
+    from market_data_api import market_data_api
+except ImportError as e:
+    logger.warning("market_data_api not available, market data will use fallback: %s", e)
+    market_data_api = None
+
+# Allowed values for the refinance endpoint's loan_type and refinance_type
+VALID_LOAN_TYPES = frozenset({"conventional", "fha", "va", "usda"})
+VALID_REFINANCE_TYPES = frozenset({"rate_term", "cash_out", "streamline"})
+VALID_LOAN_TYPES_LIST = tuple(sorted(VALID_LOAN_TYPES))
+VALID_REFINANCE_TYPES_LIST = tuple(sorted(VALID_REFINANCE_TYPES))
+
+# Fields every /calculate request body must contain
+CALCULATE_REQUIRED_FIELDS = (
+    "purchase_price",
+    "down_payment_percentage",
+    "annual_rate",
+    "loan_term",
+    "annual_tax_rate",
+    "annual_insurance_rate",
+    "loan_type",
+)
 
-def force_reload_version():
-    """Force reload the VERSION module to get the latest version info."""
-    try:
-        # Clear any cached version module
-        if "VERSION" in sys.modules:
-            logger.info("Reloading VERSION module to ensure correct version")
-            importlib.reload(sys.modules["VERSION"])
-        else:
-            logger.info("Importing VERSION module for the first time")
+# Maximum number of scenarios accepted by /calculate/batch
+BATCH_MAX_SCENARIOS = 50
+
+# Numeric /calculate inputs as (field, converter, default); a default of None means required
+CALCULATE_NUMERIC_FIELDS = (
+    ("purchase_price", float, None),
+    ("down_payment_percentage", float, None),
+    ("annual_rate", float, None),
+    ("loan_term", int, None),
+    ("annual_tax_rate", float, None),
+    ("annual_insurance_rate", float, None),
+    ("annual_tax_amount", float, 0),
+    ("annual_insurance_amount", float, 0),
+    ("monthly_hoa_fee", float, 0),
+    ("seller_credit", float, 0),
+    ("lender_credit", float, 0),
+    ("discount_points", float, 0),
+)
 
-        # Get and log the version number
-        from VERSION import VERSION as app_version
+# /refinance numeric inputs: (field, converter, default); a default of None marks
+# a required field. Empty optional fields and unparseable ones fall back to the default.
+REFINANCE_NUMERIC_FIELDS = (
+    ("appraised_value", float, None),
+    ("original_loan_balance", float, None),
+    ("original_interest_rate", float, None),
+    ("original_loan_term", int, 30),
+    ("manual_current_balance", float, 0),
+    ("target_ltv_value", float, 80),
+    ("cash_back_amount", float, 0),
+    ("new_interest_rate", float, None),
+    ("new_loan_term", int, 30),
+    ("annual_taxes", float, None),
+    ("annual_insurance", float, None),
+    ("monthly_hoa_fee", float, 0),
+    ("extra_monthly_savings", float, 0),
+    ("refinance_lender_credit", float, 0),
+    ("tax_escrow_months", int, 3),
+    ("insurance_escrow_months", int, 2),
+    ("new_discount_points", float, 0),
+)
+
+# Lower-cased transaction_type request values mapped to their enum member
+TRANSACTION_TYPES_BY_VALUE = {t.value.lower(): t for t in TRANSACTION_TYPE}
+
+# Legacy refinance closing_costs line items: (response key, closing_costs_details key, default)
+LEGACY_CLOSING_COST_ITEMS = (
+    ("appraisal_fee", "appraisal_fee", 675),
+    ("credit_report_fee", "credit_report_fee", 249),
+    ("processing_fee", "processing_fee", 575),
+    ("underwriting_fee", "underwriting_fee", 675),
+    ("title_fees", "lender_title_insurance", 825),
+    ("recording_fee", "recording_fee", 60),
+    ("other_fees", "other_fees", 0),
+)
+
+# Default calculator inputs rendered into the index page (read-only)
+DEFAULT_INDEX_PARAMS = MappingProxyType(
+    {
+        "purchase_price": 400000,
+        "down_payment_percentage": 20,
+        "annual_rate": 6.5,
+        "loan_term": 30,
+        "annual_tax_rate": 1.0,
+        "annual_insurance_rate": 0.35,
+        "loan_type": "conventional",
+        "hoa_fee": 0,
+        "seller_credit": 0,
+        "lender_credit": 0,
+        "discount_points": 0,
+    }
+)
+
+# String values accepted as boolean true in request payloads
+_TRUTHY = frozenset({"true", "yes", "1"})
+
+
+def _to_bool(value):
+    """Convert a request value (bool or string like "true"/"false") to a boolean."""
+    return value if isinstance(value, bool) else str(value).lower() in _TRUTHY
+
+
+def _coerce_fields(data, schema):
+    """
+    Convert request fields according to a (field, converter, default) schema.
+
+    Raises:
+        ValidationError: naming the first field that is missing or can't be converted.
+    """
+    values = {}
+    for field, convert, default in schema:
+        raw = data.get(field, default)
+        try:
+            values[field] = convert(raw)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                f"Invalid numeric value provided for {field}", field=field, value=raw
+            )
+    return values
+
+
+def _coerce_refinance_fields(data):
+    """
+    Convert /refinance fields according to REFINANCE_NUMERIC_FIELDS.
+
+    Raises:
+        ValueError: if a required field is missing, empty or can't be converted.
+    """
+    values = {}
+    for field, convert, default in REFINANCE_NUMERIC_FIELDS:
+        raw = data.get(field)
+        if raw is None or (isinstance(raw, str) and not raw.strip()):
+            if default is None:
+                app.logger.warning("Required parameter %s is missing or empty", field)
+                raise ValueError(f"Required parameter {field} is missing or empty")
+            values[field] = default
+            continue
+        try:
+            values[field] = convert(raw)
+        except Exception as e:
+            app.logger.warning("Error converting %s=%r: %s", field, raw, e)
+            if default is None:
+                raise ValueError(f"Invalid value for {field}: {raw!r}. Error: {e}")
+            values[field] = default
+    return values
+
+
+@functools.lru_cache(maxsize=1)
+def _iso_timestamp(second):
+    """Format a Unix second as a local ISO-8601 timestamp."""
+    return datetime.fromtimestamp(second).isoformat()
 
-        logger.info(f"Application version: {app_version}.")
-        return app_version
-    except Exception as e:
-        logger.error(f"Error loading version information: {str(e)}")
-        return "unknown"
 
+def iso_now():
+    """Return the current local time as an ISO-8601 string, formatted once per second."""
+    return _iso_timestamp(int(time.time()))
+
+
+# Load the version once at import; workers forked from a preloaded master share it
+try:
+    from VERSION import VERSION as current_version
+except ImportError as e:
+    logger.error("Error loading version information: %s", e)
+    current_version = "unknown"
+logger.info("Application version: %s.", current_version)
+
+
+def force_reload_version():
+    """Return the application version, re-reading VERSION.py only in debug mode."""
+    if not app.debug:
+        return current_version
+    try:
+        logger.info("Reloading VERSION module to pick up local edits")
+        return importlib.reload(sys.modules["VERSION"]).VERSION
+    except Exception as e:
+        logger.error("Error loading version information: %s", e)
+        return current_version
 
-# Force reload VERSION to ensure we have the correct version
-current_version = force_reload_version()
 
 # Create timestamp for cache busting
 cache_timestamp = int(datetime.now().timestamp())
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once; re-imports in respawned workers inherit them
+if not os.environ.get("FLASK_ENV_LOADED"):
+    load_dotenv()
+    os.environ["FLASK_ENV_LOADED"] = "1"
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -78,6 +243,13 @@ app.version = current_version  # Store version in app object for template access
 app.config["VERSION"] = current_version  # Also store in config
 app.config["CACHE_BUSTER"] = f"{current_version}.{cache_timestamp}"  # Create cache buster string
 
+# Use orjson for request parsing and jsonify() when it is installed
+init_json_provider(app)
+# Responses are read by the frontend, not people: never indent them (even in debug
+# mode) and skip the key sort
+app.json.compact = True
+app.json.sort_keys = False
+
 # Configure secret key for sessions
 app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY", "dev-key-change-in-production")
 
@@ -103,23 +275,24 @@ logger.debug("Flask app initialization completed")
 logger.info("Database and authentication system initialized")
 
 # Log at the top level to confirm app.py is loaded and what template folder is used
-logger.info(f"[TOP-LEVEL] app.py loaded. Flask template_folder: {app.template_folder}")
+logger.info("[TOP-LEVEL] app.py loaded. Flask template_folder: %s", app.template_folder)
+
+# The template folder is fixed at startup, so resolve the index template path once
+_INDEX_TEMPLATE_ABS = os.path.abspath(
+    os.path.join(app.root_path, app.template_folder or "templates", "index.html")
+)
 
 
 # Load configuration based on environment
 app_config = get_config()
 logger.debug("Configuration loading completed")
 
-# Ensure proper MIME types for static files
-app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0  # During development
-logger.debug("MIME type configuration completed")
-
-
-# Add proper MIME type handling for static files
-@app.route("/static/<path:filename>")
-def serve_static(filename):
-    """Serve static files from the static directory."""
-    return send_from_directory(app.static_folder, filename)
+# Static files are served by Flask's built-in static route (or nginx in front of it).
+# Disable browser caching only in development so edits show up immediately.
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = (
+    0 if os.getenv("FLASK_ENV") == "development" else 3600
+)
+logger.debug("Static file configuration completed")
 
 
 # Apply configuration from the selected environment
@@ -142,54 +315,96 @@ app.config["SESSION_FILE_DIR"] = os.path.join(
 os.makedirs(app.config["SESSION_FILE_DIR"], exist_ok=True)
 
 
+# Security headers that are the same on every dynamic response, built once
+SECURITY_HEADERS = {
+    "Content-Security-Policy": (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
+        "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
+        "style-src-elem 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com; "  # Allow Font Awesome
+        "img-src 'self' data: https:; "
+        "font-src 'self' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com; "  # Allow Font Awesome
+        "connect-src 'self' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com"
+    ),
+    "X-Content-Type-Options": "nosniff",
+    # DENY rather than SAMEORIGIN for better security unless framing is needed
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block",
+    "Referrer-Policy": "strict-origin-when-cross-origin",  # Recommended modern policy
+}
+HSTS_HEADER = "max-age=31536000; includeSubDomains"
+NO_STORE_CACHE_CONTROL = "no-store, no-cache, must-revalidate, max-age=0"
+REVALIDATE_CACHE_CONTROL = "private, max-age=0, must-revalidate"
+
+
 # Add response header to prevent caching
 @app.after_request
 def add_header(response):
     """Add CORS and security headers to the response."""
+    path = request.path
     # Skip adding headers for static files to avoid conflicts
-    if request.path.startswith("/static/") or request.path.startswith("/favicon.ico"):
-        logger.debug(f"Skipping headers for static path: {request.path}")
+    if path.startswith(("/static/", "/favicon.ico")):
         return response
 
-    # Security Headers
+    headers = response.headers
     # Strict-Transport-Security (HSTS) - Enable in production with HTTPS
     if app.config.get("SESSION_COOKIE_SECURE") or os.getenv("FLASK_ENV") == "production":
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+        headers["Strict-Transport-Security"] = HSTS_HEADER
+    headers.update(SECURITY_HEADERS)
 
-    # Content Security Policy (CSP)
-    csp_policy = (
-        "default-src 'self'; "
-        "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-        "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-        "style-src-elem 'self' 'unsafe-inline' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com; "  # Allow Font Awesome
-        "img-src 'self' data: https:; "
-        "font-src 'self' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com; "  # Allow Font Awesome
-        "connect-src 'self' https://cdn.jsdelivr.net https://cdnjs.cloudflare.com"
-    )
-    response.headers["Content-Security-Policy"] = csp_policy
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers[
-        "X-Frame-Options"
-    ] = "DENY"  # Changed from SAMEORIGIN for better security unless framing needed
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers[
-        "Referrer-Policy"
-    ] = "strict-origin-when-cross-origin"  # Recommended modern policy
-
-    # Cache-Control Headers
-    response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"  # For HTTP/1.0 compatibility
-    response.headers["Expires"] = "0"  # Proxies
+    # Cache-Control Headers. GETs may be stored privately but must be revalidated on
+    # every use; mutating requests and admin pages without an ETag are never stored.
+    if request.method in ("GET", "HEAD") and (
+        response.get_etag()[0] or not path.startswith("/admin")
+    ):
+        headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+    else:
+        headers["Cache-Control"] = NO_STORE_CACHE_CONTROL
+        headers["Pragma"] = "no-cache"  # For HTTP/1.0 compatibility
+        headers["Expires"] = "0"  # Proxies
 
     # Conditionally add CORS header for API routes
-    if request.path.startswith("/api/"):
-        response.headers[
-            "Access-Control-Allow-Origin"
-        ] = "*"  # Adjust as needed for specific origins
+    if path.startswith("/api/"):
+        headers["Access-Control-Allow-Origin"] = "*"  # Adjust as needed for specific origins
 
     return response
 
 
+# JSON responses at least this many bytes are gzipped for clients that accept it.
+# Level 4 keeps most of the size reduction at a fraction of level 9's CPU cost.
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 4
+
+
+@app.after_request
+def compress_json_response(response):
+    """Gzip large JSON responses when the client sends Accept-Encoding: gzip."""
+    if (
+        response.mimetype != "application/json"
+        or response.status_code != 200
+        or response.direct_passthrough
+        or "Content-Encoding" in response.headers
+        # A strong ETag names one representation; don't reuse it for the gzipped body
+        or "ETag" in response.headers
+    ):
+        return response
+
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+
+    response.vary.add("Accept-Encoding")
+    if not request.accept_encodings["gzip"]:
+        return response
+
+    response.set_data(gzip.compress(body, compresslevel=COMPRESS_LEVEL))
+    response.headers["Content-Encoding"] = "gzip"
+    return response
+
+
+# Shares in-flight /calculate computations between identical concurrent requests
+calculation_coalescer = RequestCoalescer()
+
 # Initialize CSRF protection after CORS initialization
 csrf = CSRFProtect(app)
 
@@ -215,121 +430,94 @@ def csrf_exempt_admin_routes(response):
     return response
 
 
-# CSRF protection enabled - token must be provided in X-CSRFToken header
-@app.route("/calculate", methods=["POST"])
-@validate_request_data(
-    required_fields=[
-        "purchase_price",
-        "down_payment_percentage",
-        "annual_rate",
-        "loan_term",
-        "annual_tax_rate",
-        "annual_insurance_rate",
-        "loan_type",
-    ]
-)
-@handle_errors
-def calculate():
-    """Perform the main calculation and return complete mortgage details."""
-    app.logger.info(f"Calculate route accessed with method: {request.method}")
-    data = request.get_json()
-    app.logger.info(f"Received calculation request with data: {data}")
+def _calculate_scenario(data):
+    """
+    Validate one /calculate request body and return its formatted response dict.
 
+    Raises:
+        ValidationError: if a field is missing, malformed or out of range.
+    """
     # Extract and validate basic loan parameters
-    try:
-        purchase_price = float(data.get("purchase_price"))
-        if purchase_price <= 0:
-            raise ValidationError(
-                "Purchase price must be greater than 0",
-                field="purchase_price",
-                value=purchase_price,
-            )
-
-        down_payment_percentage = float(data.get("down_payment_percentage"))
-        if not (0 <= down_payment_percentage <= 100):
-            raise ValidationError(
-                "Down payment percentage must be between 0 and 100",
-                field="down_payment_percentage",
-                value=down_payment_percentage,
-            )
-
-        annual_rate = float(data.get("annual_rate"))
-        if not (0 <= annual_rate <= 30):
-            raise ValidationError(
-                "Interest rate must be between 0 and 30", field="annual_rate", value=annual_rate
-            )
-
-        loan_term = int(data.get("loan_term"))
-        if not (1 <= loan_term <= 50):
-            raise ValidationError(
-                "Loan term must be between 1 and 50 years", field="loan_term", value=loan_term
-            )
-
-        annual_tax_rate = float(data.get("annual_tax_rate"))
-        if annual_tax_rate < 0:
-            raise ValidationError(
-                "Property tax rate cannot be negative",
-                field="annual_tax_rate",
-                value=annual_tax_rate,
-            )
-
-        annual_insurance_rate = float(data.get("annual_insurance_rate"))
-        if annual_insurance_rate < 0:
-            raise ValidationError(
-                "Insurance rate cannot be negative",
-                field="annual_insurance_rate",
-                value=annual_insurance_rate,
-            )
-
-        # Handle tax and insurance method overrides
-        tax_method = data.get("tax_method", "percentage")
-        insurance_method = data.get("insurance_method", "percentage")
-        annual_tax_amount = float(data.get("annual_tax_amount", 0))
-        annual_insurance_amount = float(data.get("annual_insurance_amount", 0))
-
-        if tax_method == "amount" and annual_tax_amount < 0:
-            raise ValidationError(
-                "Annual tax amount cannot be negative",
-                field="annual_tax_amount",
-                value=annual_tax_amount,
-            )
-        if insurance_method == "amount" and annual_insurance_amount < 0:
-            raise ValidationError(
-                "Annual insurance amount cannot be negative",
-                field="annual_insurance_amount",
-                value=annual_insurance_amount,
-            )
+    numbers = _coerce_fields(data, CALCULATE_NUMERIC_FIELDS)
+    purchase_price = numbers["purchase_price"]
+    down_payment_percentage = numbers["down_payment_percentage"]
+    annual_rate = numbers["annual_rate"]
+    loan_term = numbers["loan_term"]
+    annual_tax_rate = numbers["annual_tax_rate"]
+    annual_insurance_rate = numbers["annual_insurance_rate"]
+    annual_tax_amount = numbers["annual_tax_amount"]
+    annual_insurance_amount = numbers["annual_insurance_amount"]
+    monthly_hoa_fee = numbers["monthly_hoa_fee"]
+    seller_credit = numbers["seller_credit"]
+    lender_credit = numbers["lender_credit"]
+    discount_points = numbers["discount_points"]
+
+    if purchase_price <= 0:
+        raise ValidationError(
+            "Purchase price must be greater than 0",
+            field="purchase_price",
+            value=purchase_price,
+        )
+    if not (0 <= down_payment_percentage <= 100):
+        raise ValidationError(
+            "Down payment percentage must be between 0 and 100",
+            field="down_payment_percentage",
+            value=down_payment_percentage,
+        )
+    if not (0 <= annual_rate <= 30):
+        raise ValidationError(
+            "Interest rate must be between 0 and 30", field="annual_rate", value=annual_rate
+        )
+    if not (1 <= loan_term <= 50):
+        raise ValidationError(
+            "Loan term must be between 1 and 50 years", field="loan_term", value=loan_term
+        )
+    if annual_tax_rate < 0:
+        raise ValidationError(
+            "Property tax rate cannot be negative",
+            field="annual_tax_rate",
+            value=annual_tax_rate,
+        )
+    if annual_insurance_rate < 0:
+        raise ValidationError(
+            "Insurance rate cannot be negative",
+            field="annual_insurance_rate",
+            value=annual_insurance_rate,
+        )
 
-    except (ValueError, TypeError) as e:
-        raise ValidationError(f"Invalid numeric value provided: {str(e)}")
+    # Handle tax and insurance method overrides
+    tax_method = data.get("tax_method", "percentage")
+    insurance_method = data.get("insurance_method", "percentage")
+    if tax_method == "amount" and annual_tax_amount < 0:
+        raise ValidationError(
+            "Annual tax amount cannot be negative",
+            field="annual_tax_amount",
+            value=annual_tax_amount,
+        )
+    if insurance_method == "amount" and annual_insurance_amount < 0:
+        raise ValidationError(
+            "Annual insurance amount cannot be negative",
+            field="annual_insurance_amount",
+            value=annual_insurance_amount,
+        )
 
     # Parse loan_type from request
-    loan_type = request.json.get("loan_type", "conventional").lower()
-    app.logger.info(f"Request for loan_type: {loan_type}")
+    loan_type = data.get("loan_type", "conventional").lower()
+    app.logger.info("Request for loan_type: %s", loan_type)
 
     # Use shared utility to parse transaction type (default to PURCHASE for this route)
     transaction_type_enum = parse_transaction_type(data, TRANSACTION_TYPE.PURCHASE)
-    app.logger.info(f"Using transaction type: {transaction_type_enum}")
-
-    monthly_hoa_fee = float(data.get("monthly_hoa_fee", 0))
-    seller_credit = float(data.get("seller_credit", 0))
-    lender_credit = float(data.get("lender_credit", 0))
-    discount_points = float(data.get("discount_points", 0))
+    app.logger.info("Using transaction type: %s", transaction_type_enum)
 
     # Get title insurance preferences
     include_owners_title_val = data.get("include_owners_title", "true")
     # Convert string "true"/"false" to Python boolean - handle various formats
-    if isinstance(include_owners_title_val, bool):
-        include_owners_title = include_owners_title_val
-    else:
-        include_owners_title = str(include_owners_title_val).lower() in [
-            "true",
-            "yes",
-            "1",
-        ]
+    include_owners_title = _to_bool(include_owners_title_val)
 
     app.logger.info(
-        f"Include owner's title insurance: {include_owners_title} (from value: {include_owners_title_val})"
+        "Include owner's title insurance: %s (from value: %s)",
+        include_owners_title,
+        include_owners_title_val,
     )
 
     # Get optional closing date
@@ -337,49 +525,46 @@ def calculate():
     closing_date = None
     if closing_date_str:
         try:
-            # Parse ISO format date string (YYYY-MM-DD)
-            from datetime import datetime
-
-            app.logger.info(f"Attempting to parse closing date: '{closing_date_str}'")
+            app.logger.info("Attempting to parse closing date: '%s'", closing_date_str)
 
             # Handle different possible date formats
             if "-" in closing_date_str:
-                # ISO format: YYYY-MM-DD
-                closing_date = datetime.strptime(closing_date_str, "%Y-%m-%d").date()
+                # ISO format: YYYY-MM-DD. fromisoformat is a C parser with no format
+                # string; strptime still accepts unpadded input like 2025-7-4
+                try:
+                    closing_date = date.fromisoformat(closing_date_str)
+                except ValueError:
+                    closing_date = datetime.strptime(closing_date_str, "%Y-%m-%d").date()
             elif "/" in closing_date_str:
                 # US format: MM/DD/YYYY
                 closing_date = datetime.strptime(closing_date_str, "%m/%d/%Y").date()
             else:
-                app.logger.warning(f"Unknown date format: {closing_date_str}")
+                app.logger.warning("Unknown date format: %s", closing_date_str)
 
-            app.logger.info(f"Successfully parsed closing date: {closing_date}")
+            app.logger.info("Successfully parsed closing date: %s", closing_date)
         except Exception as e:
-            app.logger.error(f"Could not parse closing date '{closing_date_str}': {str(e)}")
+            app.logger.error("Could not parse closing date '%s': %s", closing_date_str, e)
             # Don't set closing date if parsing fails
             closing_date = None
 
     # Extract specific parameters for different loan types
     va_params = {}
-    if loan_type.lower() == "va":
+    if loan_type == "va":
         app.logger.info(
-            f"Processing VA loan with parameters: service_type={data.get('va_service_type')}, "
-            f"usage={data.get('va_usage')}, "
-            f"disability_exempt={data.get('va_disability_exempt')}"
+            "Processing VA loan with parameters: service_type=%s, usage=%s, disability_exempt=%s",
+            data.get("va_service_type"),
+            data.get("va_usage"),
+            data.get("va_disability_exempt"),
         )
 
         # Get VA disability exempt value and convert from string to boolean if needed
         va_disability_exempt_val = data.get("va_disability_exempt", False)
-        if isinstance(va_disability_exempt_val, bool):
-            va_disability_exempt = va_disability_exempt_val
-        else:
-            va_disability_exempt = str(va_disability_exempt_val).lower() in [
-                "true",
-                "yes",
-                "1",
-            ]
+        va_disability_exempt = _to_bool(va_disability_exempt_val)
 
         app.logger.info(
-            f"VA disability exempt: {va_disability_exempt} (from value: {va_disability_exempt_val})"
+            "VA disability exempt: %s (from value: %s)",
+            va_disability_exempt,
+            va_disability_exempt_val,
         )
 
         va_params = {
@@ -388,111 +573,161 @@ def calculate():
             "va_disability_exempt": va_disability_exempt,
         }
 
-    # Create a fresh calculator instance with latest config
-    calculator_instance = MortgageCalculator()
-    calculator_instance.config_manager.load_config()
-    calculator_instance.config = calculator_instance.config_manager.get_config()
-    app.logger.info("Using freshly loaded configuration for main calculation")
+    # Shared calculator; its config is reloaded only when a config file changes
+    calculator_instance, config_version = _get_calculator_and_version()
 
-    # Log all parameters before calculation
-    app.logger.info(
-        f"Calculating with the following parameters: \n"
-        f"Purchase price: ${purchase_price:,.2f}\n"
-        f"Down payment: {down_payment_percentage}%\n"
-        f"Interest rate: {annual_rate}%\n"
-        f"Loan term: {loan_term} years\n"
-        f"Loan type: {loan_type}\n"
-        f"Property tax rate: {annual_tax_rate}%\n"
-        f"Insurance rate: {annual_insurance_rate}%\n"
-        f"HOA fee: ${monthly_hoa_fee}/mo\n"
-        f"Closing date: {closing_date}\n"
-        f"VA parameters: {va_params}\n"
-        f"Include owner's title: {include_owners_title}\n"
-        f"Seller credit: ${seller_credit}\n"
-        f"Lender credit: ${lender_credit}\n"
-        f"Discount points: {discount_points}%"
-    )
+    # Log all parameters before calculation (only build the message if INFO is enabled)
+    if app.logger.isEnabledFor(logging.INFO):
+        app.logger.info(
+            f"Calculating with the following parameters: \n"
+            f"Purchase price: ${purchase_price:,.2f}\n"
+            f"Down payment: {down_payment_percentage}%\n"
+            f"Interest rate: {annual_rate}%\n"
+            f"Loan term: {loan_term} years\n"
+            f"Loan type: {loan_type}\n"
+            f"Property tax rate: {annual_tax_rate}%\n"
+            f"Insurance rate: {annual_insurance_rate}%\n"
+            f"HOA fee: ${monthly_hoa_fee}/mo\n"
+            f"Closing date: {closing_date}\n"
+            f"VA parameters: {va_params}\n"
+            f"Include owner's title: {include_owners_title}\n"
+            f"Seller credit: ${seller_credit}\n"
+            f"Lender credit: ${lender_credit}\n"
+            f"Discount points: {discount_points}%"
+        )
 
-    # Use calculator_instance to perform all calculations
-    result = calculator_instance.calculate_all(
-        purchase_price=purchase_price,
-        down_payment_percentage=down_payment_percentage,
-        annual_rate=annual_rate,
-        loan_term=loan_term,
-        loan_type=loan_type,
-        annual_tax_rate=annual_tax_rate,
-        annual_insurance_rate=annual_insurance_rate,
-        monthly_hoa_fee=monthly_hoa_fee,
-        seller_credit=seller_credit,
-        lender_credit=lender_credit,
-        closing_date=closing_date,  # Make sure this is passed
-        include_owners_title=include_owners_title,
-        discount_points=discount_points,  # Pass discount points
-        transaction_type=TRANSACTION_TYPE.PURCHASE,  # Explicitly use enum for transaction type
+    calculation_params = {
+        "purchase_price": purchase_price,
+        "down_payment_percentage": down_payment_percentage,
+        "annual_rate": annual_rate,
+        "loan_term": loan_term,
+        "loan_type": loan_type,
+        "annual_tax_rate": annual_tax_rate,
+        "annual_insurance_rate": annual_insurance_rate,
+        "monthly_hoa_fee": monthly_hoa_fee,
+        "seller_credit": seller_credit,
+        "lender_credit": lender_credit,
+        "closing_date": closing_date,  # Make sure this is passed
+        "include_owners_title": include_owners_title,
+        "discount_points": discount_points,  # Pass discount points
+        "transaction_type": TRANSACTION_TYPE.PURCHASE,  # Explicitly use enum for transaction type
         # Tax and insurance method overrides
-        tax_method=tax_method,
-        insurance_method=insurance_method,
-        annual_tax_amount=annual_tax_amount,
-        annual_insurance_amount=annual_insurance_amount,
+        "tax_method": tax_method,
+        "insurance_method": insurance_method,
+        "annual_tax_amount": annual_tax_amount,
+        "annual_insurance_amount": annual_insurance_amount,
         **va_params,  # Pass VA-specific parameters if applicable
-    )
+    }
+
+    # Identical resubmissions are served from the cache and concurrent duplicates
+    # share a single computation. The result is shared, so it is only read below.
+    frozen_params = _freeze_params(calculation_params)
+    if frozen_params is None:
+        result = _calculate_purchase(calculator_instance, calculation_params)
+    else:
+        result = calculation_coalescer.run(
+            (frozen_params, config_version),
+            lambda: _cached_calculation(frozen_params, config_version),
+        )
 
     # Format the response for the frontend
-    # Build the response
+    mb = result["monthly_breakdown"]
+    ld = result["loan_details"]
+    cc = result["closing_costs"]
+    pp = result["prepaid_items"]
+
+    # Only build the fallback credits when calculate_all didn't return them
+    credits = result.get("credits")
+    if credits is None:
+        credits_total = seller_credit + lender_credit
+        credits = {
+            "seller_credit": seller_credit,
+            "lender_credit": lender_credit,
+            "total": round(credits_total, 2),
+        }
+    else:
+        credits_total = credits.get("total", seller_credit + lender_credit)
+
+    total_cash_needed = result.get("total_cash_needed")
+    if total_cash_needed is None:
+        # Subtract all credits from the cash needed at closing
+        total_cash_needed = (
+            ld["down_payment"] + cc.get("total", 0) + pp.get("total", 0) - credits_total
+        )
+
+    # Build the response; each monthly amount appears once, under monthly_breakdown
     formatted_result = {
         "success": True,
-        "monthly_payment": result["monthly_breakdown"]["total"],
-        "loan_amount": result["loan_details"]["loan_amount"],
-        "down_payment": result["loan_details"]["down_payment"],
-        "monthly_mortgage": result["monthly_breakdown"]["principal_interest"],
-        "monthly_tax": result["monthly_breakdown"]["property_tax"],
-        "monthly_insurance": result["monthly_breakdown"]["insurance"],
-        "monthly_pmi": result["monthly_breakdown"]["pmi"],
-        "monthly_hoa": result["monthly_breakdown"]["hoa"],
-        "closing_costs": result["closing_costs"],
-        "prepaids": result["prepaid_items"],
+        "monthly_payment": mb["total"],
+        "loan_amount": ld["loan_amount"],
+        "down_payment": ld["down_payment"],
+        "closing_costs": cc,
+        "prepaids": pp,
         "monthly_breakdown": {
-            "principal_interest": result["monthly_breakdown"]["principal_interest"],
-            "property_tax": result["monthly_breakdown"]["property_tax"],
-            "home_insurance": result["monthly_breakdown"]["insurance"],
-            "mortgage_insurance": result["monthly_breakdown"]["pmi"],
-            "hoa_fee": result["monthly_breakdown"]["hoa"],
-            "total": result["monthly_breakdown"]["total"],
+            "principal_interest": mb["principal_interest"],
+            "property_tax": mb["property_tax"],
+            "home_insurance": mb["insurance"],
+            "mortgage_insurance": mb["pmi"],
+            "hoa_fee": mb["hoa"],
+            "total": mb["total"],
         },
-        "loan_details": {
-            "purchase_price": result["loan_details"].get("purchase_price"),
-            "down_payment": result["loan_details"].get("down_payment"),
-            "down_payment_percentage": result["loan_details"].get("down_payment_percentage"),
-            "loan_amount": result["loan_details"].get("loan_amount"),
-            "original_loan_amount": result["loan_details"].get("original_loan_amount"),
-            "financed_fees": result["loan_details"].get("financed_fees"),
-            "loan_term_years": result["loan_details"].get("loan_term_years"),
-            "interest_rate": result["loan_details"].get("interest_rate"),
-            "loan_type": result["loan_details"].get("loan_type"),
-            "ltv_ratio": result["loan_details"].get("ltv_ratio"),
-            "transaction_type": TRANSACTION_TYPE.PURCHASE.value,  # Add transaction type to response
-            "max_seller_contribution": result["loan_details"].get("max_seller_contribution"),
-            "seller_credit_exceeds_max": result["loan_details"].get("seller_credit_exceeds_max"),
-        },
-        "credits": result.get(
-            "credits",
-            {
-                "seller_credit": seller_credit,
-                "lender_credit": lender_credit,
-                "total": round(seller_credit + lender_credit, 2),
-            },
-        ),
-        # Calculate total cash needed if not in the result, making sure to subtract all credits
-        "total_cash_needed": result.get(
-            "total_cash_needed",
-            result["loan_details"]["down_payment"]
-            + result["closing_costs"].get("total", 0)
-            + result["prepaid_items"].get("total", 0)
-            - result.get("credits", {}).get("total", seller_credit + lender_credit),
-        ),
+        # Already tagged with the purchase transaction_type by _calculate_purchase
+        "loan_details": ld,
+        "credits": credits,
+        "total_cash_needed": total_cash_needed,
     }
 
-    return jsonify(formatted_result)
+    return formatted_result
+
+
+# CSRF protection enabled - token must be provided in X-CSRFToken header
+@app.route("/calculate", methods=["POST"])
+@validate_request_data(required_fields=list(CALCULATE_REQUIRED_FIELDS))
+@handle_errors
+def calculate():
+    """Perform the main calculation and return complete mortgage details."""
+    app.logger.info("Calculate route accessed with method: %s", request.method)
+    # validate_request_data already parsed the body; reuse the request's cached copy
+    data = request.get_json()
+    app.logger.info("Received calculation request with data: %s", data)
+    return jsonify(_calculate_scenario(data))
+
+
+# CSRF protection enabled - token must be provided in X-CSRFToken header
+@app.route("/calculate/batch", methods=["POST"])
+def calculate_batch():
+    """
+    Run several /calculate scenarios in one request, e.g. a rate or down-payment table.
+
+    Each scenario goes through the same validation and result cache as /calculate;
+    the results are returned in request order.
+    """
+    data = request.get_json(cache=False, silent=True) or {}
+    if not isinstance(data, dict):
+        return error_response("Request body must be a JSON object")
+    scenarios = data.get("scenarios")
+    if not isinstance(scenarios, list) or not scenarios:
+        return error_response("scenarios must be a non-empty list")
+    if len(scenarios) > BATCH_MAX_SCENARIOS:
+        return error_response(f"At most {BATCH_MAX_SCENARIOS} scenarios are allowed per request")
+
+    results = []
+    for index, scenario in enumerate(scenarios):
+        if not isinstance(scenario, dict):
+            return error_response(f"Scenario {index} must be an object")
+        missing_fields = [field for field in CALCULATE_REQUIRED_FIELDS if field not in scenario]
+        if missing_fields:
+            return error_response(
+                f"Scenario {index}: missing required fields: {', '.join(missing_fields)}"
+            )
+        try:
+            results.append(_calculate_scenario(scenario))
+        except ValidationError as e:
+            return error_response(f"Scenario {index}: {e.message}")
+        except (ValueError, TypeError, AttributeError) as e:
+            app.logger.warning("Invalid batch scenario %s: %s", index, e)
+            return error_response(f"Scenario {index}: invalid input")
+    return success_response(results)
 
 
 # API endpoint to calculate the maximum allowed seller contribution
@@ -501,7 +736,7 @@ def calculate():
 def max_seller_contribution_api():
     """Calculate the maximum allowed seller contribution."""
     try:
-        data = request.get_json()
+        data = request.get_json(cache=False, silent=True) or request.form
         loan_type = data.get("loan_type")
         purchase_price = float(data.get("purchase_price"))
         down_payment_amount = float(data.get("down_payment_amount"))
@@ -509,13 +744,12 @@ def max_seller_contribution_api():
         loan_amount = purchase_price - down_payment_amount
         ltv_ratio = (loan_amount / purchase_price) * 100
         # Use MortgageCalculator method
-        calculator_instance = MortgageCalculator()
-        max_contribution = calculator_instance._calculate_max_seller_contribution(
+        max_contribution = _get_calculator()._calculate_max_seller_contribution(
             loan_type, ltv_ratio, purchase_price
         )
         return jsonify({"max_seller_contribution": max_contribution})
     except Exception as e:
-        app.logger.error(f"Error calculating max seller contribution: {str(e)}")
+        app.logger.error("Error calculating max seller contribution: %s", e)
         return jsonify({"error": str(e)}), 400
 
 
@@ -533,18 +767,68 @@ def parse_transaction_type(request_data, default_type=TRANSACTION_TYPE.PURCHASE)
     """
     transaction_type = request_data.get("transaction_type", "").lower()
     if not transaction_type:
-        transaction_type = default_type.value
+        return default_type
 
     # Map the transaction_type string to enum value
-    try:
-        transaction_type_enum = TRANSACTION_TYPE(transaction_type)
-        app.logger.info(f"Mapped transaction_type to enum: {transaction_type_enum}")
-        return transaction_type_enum
-    except ValueError:
+    transaction_type_enum = TRANSACTION_TYPES_BY_VALUE.get(transaction_type)
+    if transaction_type_enum is None:
         app.logger.warning(
-            f"Invalid transaction_type: {transaction_type}, defaulting to {default_type}"
+            "Invalid transaction_type: %s, defaulting to %s", transaction_type, default_type
         )
         return default_type
+    app.logger.debug("Mapped transaction_type to enum: %s", transaction_type_enum)
+    return transaction_type_enum
+
+
+def _freeze_params(params):
+    """Return a hashable, order-independent form of ``params``, or None if a value is unhashable."""
+    frozen = tuple(sorted(params.items()))
+    try:
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+
+def _calculate_purchase(calculator_instance, params):
+    """
+    Run calculate_all for /calculate, tagging the loan details as a purchase.
+
+    The tag is added once here, so the route can return the (possibly cached)
+    loan_details dict as-is instead of copying it into the response per request.
+    """
+    result = calculator_instance.calculate_all(**params)
+    result["loan_details"]["transaction_type"] = TRANSACTION_TYPE.PURCHASE.value
+    return result
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_calculation(frozen_params, config_version):
+    """
+    Run calculate_all once per distinct set of inputs.
+
+    ``config_version`` is part of the cache key so results computed before an
+    admin config change are never returned afterwards. The caller has already
+    refreshed the shared calculator to at least that version, so it is used
+    directly. The returned dict is shared between callers and must not be mutated.
+    """
+    return _calculate_purchase(calculator, dict(frozen_params))
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_refinance(frozen_params, transaction_type_value, config_version, today):
+    """
+    Run calculate_refinance once per distinct set of inputs.
+
+    ``config_version`` is part of the cache key so results computed before an
+    admin config change are never returned afterwards. ``today`` is too, because
+    the current loan balance is amortized up to today's date. The caller has
+    already refreshed the shared calculator to at least ``config_version``. Callers
+    must copy the returned dict before mutating it.
+    """
+    return calculator.calculate_refinance(
+        **dict(frozen_params), transaction_type=TRANSACTION_TYPE(transaction_type_value)
+    )
 
 
 # --- Add refinance calculation API endpoint ---
@@ -556,121 +840,66 @@ def refinance():
     Perform a refinance analysis and return results (no prepaids, just loan, closing costs, and savings).
     """
     try:
-        app.logger.info(f"Refinance route accessed with method: {request.method}")
-        data = request.get_json()
-        app.logger.info(f"Received refinance request with data: {data}")
+        app.logger.info("Refinance route accessed with method: %s", request.method)
+        data = request.get_json(cache=False, silent=True) or request.form
+        app.logger.info("Received refinance request with data: %s", data)
 
         # Print each key/value for debugging
-        for key, value in data.items():
-            app.logger.info(f"Parameter: {key} = {repr(value)} (Type: {type(value).__name__})")
-
-        # Create a complete set of validated parameters to pass to the calculator
-        validated_params = {}
+        if app.logger.isEnabledFor(logging.INFO):
+            for key, value in data.items():
+                app.logger.info(
+                    "Parameter: %s = %r (Type: %s)", key, value, type(value).__name__
+                )
 
         try:
-            # Function to safely convert values with detailed error logging
-            def validate_param(key, default_value=0, converter=float, required=False):
-                value = data.get(key)
-                app.logger.info(f"Processing parameter {key}: {repr(value)}")
-
-                # Handle empty strings and None values
-                if value is None or value == "" or (isinstance(value, str) and value.strip() == ""):
-                    if required:
-                        app.logger.warning(f"Required parameter {key} is missing or empty")
-                        raise ValueError(f"Required parameter {key} is missing or empty")
-                    app.logger.info(f"Using default for {key}: {default_value}")
-                    return default_value
-
-                try:
-                    converted = converter(value)
-                    app.logger.info(f"Converted {key}: {converted}")
-                    return converted
-                except Exception as e:
-                    app.logger.error(f"Error converting {key}={repr(value)}: {str(e)}")
-                    if required:
-                        raise ValueError(f"Invalid value for {key}: {repr(value)}. Error: {str(e)}")
-                    return default_value
-
-            # Validate all parameters
-            validated_params["appraised_value"] = validate_param("appraised_value", required=True)
-            validated_params["original_loan_balance"] = validate_param(
-                "original_loan_balance", required=True
-            )
-            validated_params["original_interest_rate"] = validate_param(
-                "original_interest_rate", required=True
-            )
-            validated_params["original_loan_term"] = validate_param("original_loan_term", 30, int)
-            validated_params["use_manual_balance"] = data.get("use_manual_balance", False)
-            validated_params["manual_current_balance"] = validate_param(
-                "manual_current_balance", 0, float
-            )
+            # Numeric parameters are converted in one pass over a declarative schema
+            validated_params = _coerce_refinance_fields(data)
+            validated_params["use_manual_balance"] = _to_bool(data.get("use_manual_balance", False))
             cash_option_value = data.get("cash_option", "finance_all")
             # Handle empty string as default to finance_all
             validated_params["cash_option"] = (
                 cash_option_value if cash_option_value else "finance_all"
             )
-            validated_params["target_ltv_value"] = validate_param("target_ltv_value", 80, float)
-            validated_params["cash_back_amount"] = validate_param("cash_back_amount", 0, float)
 
-            # Handle date with special case
+            # Handle date with special case; today's date is computed at most once
+            today = None
             original_closing_date = data.get("original_closing_date")
             if not original_closing_date:
-                original_closing_date = datetime.now().strftime("%Y-%m-%d")
-                app.logger.info(f"Using today as original_closing_date: {original_closing_date}")
+                today = date.today().isoformat()
+                original_closing_date = today
+                app.logger.info("Using today as original_closing_date: %s", original_closing_date)
             validated_params["original_closing_date"] = original_closing_date
 
-            validated_params["new_interest_rate"] = validate_param(
-                "new_interest_rate", required=True
-            )
-            validated_params["new_loan_term"] = validate_param("new_loan_term", 30, int)
-
             # We no longer need to validate closing_costs or new_loan_amount
             # These will be calculated automatically by the calculator
 
             # Prepaid calculation parameters
-            validated_params["new_closing_date"] = data.get(
-                "new_closing_date", datetime.now().strftime("%Y-%m-%d")
-            )
-            validated_params["annual_taxes"] = validate_param("annual_taxes", required=True)
-            validated_params["annual_insurance"] = validate_param("annual_insurance", required=True)
-            validated_params["monthly_hoa_fee"] = validate_param("monthly_hoa_fee", 0, float)
-            validated_params["extra_monthly_savings"] = validate_param(
-                "extra_monthly_savings", 0, float
-            )
-            validated_params["refinance_lender_credit"] = validate_param(
-                "refinance_lender_credit", 0, float
-            )
-            validated_params["tax_escrow_months"] = validate_param("tax_escrow_months", 3, int)
-            validated_params["insurance_escrow_months"] = validate_param(
-                "insurance_escrow_months", 2, int
-            )
+            if "new_closing_date" in data:
+                validated_params["new_closing_date"] = data["new_closing_date"]
+            else:
+                validated_params["new_closing_date"] = today or date.today().isoformat()
 
             # Add tax and insurance method parameters
             validated_params["tax_method"] = data.get("tax_method", "percentage")
             validated_params["insurance_method"] = data.get("insurance_method", "percentage")
 
             # Zero cash to close mode
-            validated_params["zero_cash_to_close"] = data.get("zero_cash_to_close", False)
-
-            # Optional parameters
-            validated_params["new_discount_points"] = validate_param("new_discount_points", 0)
+            validated_params["zero_cash_to_close"] = _to_bool(data.get("zero_cash_to_close", False))
 
             # New refinance parameters
             validated_params["loan_type"] = data.get("loan_type", "conventional").lower()
             validated_params["refinance_type"] = data.get("refinance_type", "rate_term").lower()
 
             # Validate loan type
-            valid_loan_types = ["conventional", "fha", "va", "usda"]
-            if validated_params["loan_type"] not in valid_loan_types:
+            if validated_params["loan_type"] not in VALID_LOAN_TYPES:
                 raise ValueError(
-                    f"Invalid loan type: {validated_params['loan_type']}. Must be one of: {valid_loan_types}"
+                    f"Invalid loan type: {validated_params['loan_type']}. Must be one of: {', '.join(VALID_LOAN_TYPES_LIST)}"
                 )
 
             # Validate refinance type
-            valid_refinance_types = ["rate_term", "cash_out", "streamline"]
-            if validated_params["refinance_type"] not in valid_refinance_types:
+            if validated_params["refinance_type"] not in VALID_REFINANCE_TYPES:
                 raise ValueError(
-                    f"Invalid refinance type: {validated_params['refinance_type']}. Must be one of: {valid_refinance_types}"
+                    f"Invalid refinance type: {validated_params['refinance_type']}. Must be one of: {', '.join(VALID_REFINANCE_TYPES_LIST)}"
                 )
 
             # Handle streamline refinance special cases
@@ -695,47 +924,46 @@ def refinance():
             # Final validation checks
             if validated_params["appraised_value"] <= 0:
                 app.logger.error("Appraised value must be > 0")
-                return (
-                    jsonify(
-                        {"success": False, "error": "Appraised value must be greater than zero"}
-                    ),
-                    400,
-                )
+                return error_response("Appraised value must be greater than zero")
 
             if validated_params["original_loan_balance"] <= 0:
                 app.logger.error("Original loan balance must be > 0")
-                return (
-                    jsonify(
-                        {
-                            "success": False,
-                            "error": "Original loan balance must be greater than zero",
-                        }
-                    ),
-                    400,
-                )
+                return error_response("Original loan balance must be greater than zero")
 
-            app.logger.info(f"Final validated parameters: {validated_params}")
+            app.logger.info("Final validated parameters: %s", validated_params)
 
         except ValueError as e:
-            app.logger.error(f"Parameter validation error: {str(e)}")
-            return jsonify({"success": False, "error": str(e)}), 400
+            app.logger.warning("Refinance parameter validation error: %s", e)
+            return error_response(str(e))
         except Exception as e:
-            app.logger.error(f"Unexpected validation error: {str(e)}")
-            app.logger.error(traceback.format_exc())
-            return jsonify({"success": False, "error": f"Validation error: {str(e)}"}), 400
+            app.logger.exception("Refinance failed at validation")
+            return error_response(f"Validation error: {str(e)}")
 
         # Parse transaction type (default to REFINANCE for this route)
         transaction_type_enum = parse_transaction_type(data, TRANSACTION_TYPE.REFINANCE)
-        app.logger.info(f"Using transaction type: {transaction_type_enum}")
+        app.logger.info("Using transaction type: %s", transaction_type_enum)
 
         # Calculate refinance with validated parameters
-        calculator_instance = MortgageCalculator()
         try:
             app.logger.info("Calling calculate_refinance with validated parameters")
             # The transaction_type is now explicitly passed from our utility function
-            result = calculator_instance.calculate_refinance(
-                **validated_params, transaction_type=transaction_type_enum
-            )
+            calculator_instance, config_version = _get_calculator_and_version()
+            frozen_params = _freeze_params(validated_params)
+            if frozen_params is None:
+                result = calculator_instance.calculate_refinance(
+                    **validated_params, transaction_type=transaction_type_enum
+                )
+            else:
+                # Identical resubmissions are served from the cache; copy because the
+                # result is modified below
+                result = copy.deepcopy(
+                    _cached_refinance(
+                        frozen_params,
+                        transaction_type_enum.value,
+                        config_version,
+                        date.today(),
+                    )
+                )
             app.logger.info("Refinance calculation success")
 
             # Add transaction_type to result for consistent frontend handling
@@ -743,56 +971,41 @@ def refinance():
                 result["loan_details"] = {}
             result["loan_details"]["transaction_type"] = transaction_type_enum.value
         except Exception as calc_error:
-            app.logger.error(f"Error in calculate_refinance: {str(calc_error)}")
-            app.logger.error(traceback.format_exc())
-            return (
-                jsonify({"success": False, "error": f"Calculation error: {str(calc_error)}"}),
-                400,
-            )
+            app.logger.exception("Refinance failed at calculate_refinance")
+            return error_response(f"Calculation error: {str(calc_error)}")
 
         # The closing costs are now calculated by the calculator and included in the result
         # We don't need to add any additional structure as the calculator already provides
         # detailed closing costs in the closing_costs_details field
-        app.logger.info(f"Closing costs details: {result.get('closing_costs_details', {})}")
+        app.logger.info("Closing costs details: %s", result.get("closing_costs_details", {}))
 
         # For backward compatibility, ensure we have a structured closing_costs field
         if "closing_costs" not in result and "total_closing_costs" in result:
+            details = result.get("closing_costs_details") or {}
             result["closing_costs"] = {
                 "total": result["total_closing_costs"],
                 "financed_amount": result["financed_closing_costs"],
                 "cash_to_close": result["cash_to_close"],
                 # Add default line items based on the closing_costs_details
-                "appraisal_fee": result.get("closing_costs_details", {}).get("appraisal_fee", 675),
-                "credit_report_fee": result.get("closing_costs_details", {}).get(
-                    "credit_report_fee", 249
-                ),
-                "processing_fee": result.get("closing_costs_details", {}).get(
-                    "processing_fee", 575
-                ),
-                "underwriting_fee": result.get("closing_costs_details", {}).get(
-                    "underwriting_fee", 675
-                ),
-                "title_fees": result.get("closing_costs_details", {}).get(
-                    "lender_title_insurance", 825
-                ),
-                "recording_fee": result.get("closing_costs_details", {}).get("recording_fee", 60),
-                "other_fees": result.get("closing_costs_details", {}).get("other_fees", 0),
+                **{
+                    key: details.get(detail_key, default)
+                    for key, detail_key, default in LEGACY_CLOSING_COST_ITEMS
+                },
             }
 
         # The new_loan_amount is calculated automatically by the calculator and included in the result
         app.logger.info(
-            f"new_loan_amount in response: {result.get('new_loan_amount', 'not found')}"
+            "new_loan_amount in response: %s", result.get("new_loan_amount", "not found")
         )
 
         # Log the full result for debugging
-        app.logger.info(f"Final refinance result: {result}")
+        app.logger.info("Final refinance result: %s", result)
 
         app.logger.info("Refinance calculation complete. Returning result")
-        return jsonify({"success": True, "result": result})
+        return success_response(result)
     except Exception as e:
-        app.logger.error(f"Unhandled error in refinance endpoint: {str(e)}")
-        app.logger.error(traceback.format_exc())
-        return jsonify({"success": False, "error": str(e)}), 400
+        app.logger.exception("Refinance failed with an unhandled error")
+        return error_response(str(e))
 
 
 # Configure logging
@@ -803,16 +1016,45 @@ try:
     from VERSION import LAST_UPDATED
 
     app.logger.info(
-        f"Starting Mortgage Calculator version {current_version} (last updated: {LAST_UPDATED})"
+        "Starting Mortgage Calculator version %s (last updated: %s)", current_version, LAST_UPDATED
     )
 except ImportError:
     app.logger.warning("VERSION module not found, version tracking not enabled")
 
 # Load calculator configuration
 calculator = MortgageCalculator()
+_calculator_config_version = calculator.config_manager.get_config_version()
+_calculator_lock = threading.Lock()
+# Input limits for the index page, refreshed together with the calculator config
+_calculator_limits = calculator.config.get("limits", {})
+# Separate manager for the admin blueprint, so unsaved admin edits never reach the
+# calculator; ConfigManager loads the config files when it is constructed
 config_manager = ConfigManager()
-config_manager.load_config()  # Load the config
-config = config_manager.get_config()  # Get the loaded config
+
+
+def _get_calculator_and_version():
+    """Return the shared MortgageCalculator and the config version it is loaded from.
+
+    The config files are stat'ed once; the calculator config is reloaded only if
+    one of them changed.
+    """
+    global _calculator_config_version, _calculator_limits
+    version = calculator.config_manager.get_config_version()
+    if version != _calculator_config_version:
+        with _calculator_lock:
+            if version != _calculator_config_version:
+                app.logger.info("Configuration changed on disk, reloading calculator config")
+                calculator.config_manager.load_config()
+                calculator.config = calculator.config_manager.get_config()
+                _calculator_limits = calculator.config.get("limits", {})
+                _calculator_config_version = version
+    return calculator, version
+
+
+def _get_calculator():
+    """Return the shared MortgageCalculator, reloading its config if a config file changed."""
+    return _get_calculator_and_version()[0]
+
 
 # Register blueprints
 try:
@@ -829,30 +1071,37 @@ try:
     app.register_blueprint(health_check.health_bp)
     logger.debug("Health check blueprint registered successfully")
 except Exception as e:
-    logger.error(f"Exception during blueprint registration: {e}")
+    logger.error("Exception during blueprint registration: %s", e)
 
 app.config_manager = config_manager
 
 logger.debug("Starting route definitions")
 
+# Seconds the index page's version and cache buster are reused
+INDEX_CACHE_BUSTER_TTL = 60
+
+
+@functools.lru_cache(maxsize=1)
+def _index_version_info(time_bucket):
+    """Return (version, cache_buster) for one TTL bucket."""
+    version = force_reload_version()
+    return version, f"{version}.{time_bucket * INDEX_CACHE_BUSTER_TTL}"
+
+
+def get_index_version_info():
+    """Return the version and cache buster used to render the index page."""
+    if app.debug:
+        # Pick up local VERSION.py edits on every reload while developing
+        version = force_reload_version()
+        return version, f"{version}.{int(time.time())}"
+    return _index_version_info(int(time.time()) // INDEX_CACHE_BUSTER_TTL)
+
 
 # Main calculator route
 @app.route("/", methods=["GET", "POST"])
 def index():
-    logger.debug("Index route accessed")
-    app.logger.info(f"Index route accessed with method: {request.method}")
-
-    # Print out the template folder and absolute path for index.html for debugging
-    app.logger.info(f"Flask template_folder: {app.template_folder}")
-    import os
-
-    template_abs_path = os.path.abspath(
-        os.path.join(app.template_folder or "templates", "index.html")
-    )
-    app.logger.warning(f"[DEBUG] Attempting to render template at: {template_abs_path}")
-    app.logger.info(
-        f"[DEBUG] Absolute path of index.html template being rendered: {template_abs_path}"
-    )
+    app.logger.debug("Index route accessed with method: %s", request.method)
+    app.logger.debug("Rendering index template at %s", _INDEX_TEMPLATE_ABS)
 
     # If it's a POST request, redirect to calculate endpoint
     if request.method == "POST":
@@ -868,81 +1117,98 @@ def index():
         )
 
     try:
-        # Get configuration limits
-        limits = config.get("limits", {})
-
-        # Default parameters
-        params = {
-            "purchase_price": 400000,
-            "down_payment_percentage": 20,
-            "annual_rate": 6.5,
-            "loan_term": 30,
-            "annual_tax_rate": 1.0,
-            "annual_insurance_rate": 0.35,
-            "loan_type": "conventional",
-            "hoa_fee": 0,
-            "seller_credit": 0,
-            "lender_credit": 0,
-            "discount_points": 0,
-        }
-
-        # Explicitly fetch the latest version right before rendering
-        latest_version = force_reload_version()
-        # Update cache buster based on potentially reloaded version
-        latest_cache_buster = f"{latest_version}.{int(datetime.now().timestamp())}"
-
-        return render_template(
-            "index.html",
-            params=params,
-            limits=limits,
-            version=latest_version,  # Use the freshly loaded version
-            cache_buster=latest_cache_buster,  # Use updated cache buster
+        latest_version, latest_cache_buster = get_index_version_info()
+
+        # The page varies by cache buster, the session's CSRF token and what base.html
+        # reads from the session and config, so a browser holding the same combination
+        # can reuse its copy. Pages with pending flash messages are always rendered.
+        generate_csrf()
+        fingerprint = (
+            f"{latest_cache_buster}:{session.get('csrf_token')}:"
+            f"{bool(session.get('admin_logged_in'))}:{bool(app.config.get('BETA_ENABLED'))}"
         )
+        etag = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()
+        if "_flashes" not in session and etag in request.if_none_match:
+            response = app.response_class(status=304)
+        else:
+            response = make_response(
+                render_template(
+                    "index.html",
+                    params=DEFAULT_INDEX_PARAMS,
+                    # index.html doesn't read limits, so skip the per-GET config-mtime check
+                    # and pass the binding as of the calculator's last reload
+                    limits=_calculator_limits,
+                    version=latest_version,  # Use the freshly loaded version
+                    cache_buster=latest_cache_buster,  # Use updated cache buster
+                )
+            )
+        response.set_etag(etag)
+        return response
     except Exception as e:
-        app.logger.error(f"Error in index route: {str(e)}")
+        app.logger.error("Error in index route: %s", e)
         return f"Error rendering calculator: {str(e)}", 500
 
 
-def get_fallback_market_data():
-    """Fallback market data when market_data_api is not available"""
-    return {
-        "mortgage_rate_30y": {
-            "current": 7.15,
-            "previous": 7.08,
-            "change": 0.07,
-            "change_direction": "up",
-            "date": "2025-07-18",
+# Static part of the fallback market data; only last_updated changes per call
+_FALLBACK_MARKET_DATA = {
+    "mortgage_rate_30y": {
+        "current": 7.15,
+        "previous": 7.08,
+        "change": 0.07,
+        "change_direction": "up",
+        "date": "2025-07-18",
+    },
+    "treasury_10y": {
+        "current": 4.23,
+        "previous": 4.18,
+        "change": 0.05,
+        "change_direction": "up",
+        "date": "2025-07-18",
+    },
+    "mbs_data": {
+        "spread": 2.92,
+        "description": "Mortgage-Treasury Spread: 2.92%",
+        "date": "2025-07-18",
+    },
+    "news_headlines": [
+        {
+            "title": "View Current Mortgage Rates & Market Analysis",
+            "link": "https://www.mortgagenewsdaily.com/mortgage-rates",
+            "published": "2025-07-18T10:30:00Z",
+            "source": "Mortgage News Daily",
         },
-        "treasury_10y": {
-            "current": 4.23,
-            "previous": 4.18,
-            "change": 0.05,
-            "change_direction": "up",
-            "date": "2025-07-18",
+        {
+            "title": "Browse Housing Wire - Industry News & Updates",
+            "link": "https://www.housingwire.com/",
+            "published": "2025-07-18T09:15:00Z",
+            "source": "Housing Wire",
         },
-        "mbs_data": {
-            "spread": 2.92,
-            "description": "Mortgage-Treasury Spread: 2.92%",
-            "date": "2025-07-18",
-        },
-        "news_headlines": [
-            {
-                "title": "View Current Mortgage Rates & Market Analysis",
-                "link": "https://www.mortgagenewsdaily.com/mortgage-rates",
-                "published": "2025-07-18T10:30:00Z",
-                "source": "Mortgage News Daily",
-            },
-            {
-                "title": "Browse Housing Wire - Industry News & Updates",
-                "link": "https://www.housingwire.com/",
-                "published": "2025-07-18T09:15:00Z",
-                "source": "Housing Wire",
-            },
-        ],
-        "rate_trend": "rising",
-        "last_updated": datetime.now().isoformat(),
-        "data_sources": ["Fallback Demo Data"],
-    }
+    ],
+    "rate_trend": "rising",
+    "data_sources": ["Fallback Demo Data"],
+}
+
+
+def get_fallback_market_data():
+    """Fallback market data when market_data_api is not available"""
+    return {**_FALLBACK_MARKET_DATA, "last_updated": iso_now()}
+
+
+# Seconds a serialized fallback market-data response is reused
+FALLBACK_MARKET_DATA_TTL = 60
+
+
+@functools.lru_cache(maxsize=1)
+def _fallback_market_data_body(time_bucket):
+    """Serialize the fallback market-data response once per TTL bucket."""
+    data = get_fallback_market_data()
+    return app.json.dumps({"success": True, "data": data, "timestamp": data["last_updated"]})
+
+
+def fallback_market_data_response():
+    """Return the cached, pre-serialized fallback market-data response."""
+    body = _fallback_market_data_body(int(time.time()) // FALLBACK_MARKET_DATA_TTL)
+    return app.response_class(body, mimetype="application/json")
 
 
 # Market data API endpoint for loan officer banner
@@ -955,85 +1221,66 @@ def market_data():
     try:
         app.logger.info("Market data API endpoint called")
 
-        # Try to import market_data_api, fall back to embedded fallback if not available
-        try:
-            from market_data_api import market_data_api
+        # Use the embedded fallback if market_data_api could not be imported
+        if market_data_api is None:
+            return fallback_market_data_response()
 
+        try:
             market_summary = market_data_api.get_market_summary()
-            app.logger.info(
-                f"Market data retrieved from API: {len(str(market_summary))} characters"
-            )
-        except ImportError as import_error:
-            app.logger.warning(
-                f"market_data_api not available, using fallback: {str(import_error)}"
-            )
-            market_summary = get_fallback_market_data()
+            if app.logger.isEnabledFor(logging.INFO):
+                app.logger.info(
+                    "Market data retrieved from API: %d characters", len(str(market_summary))
+                )
         except Exception as api_error:
-            app.logger.warning(f"market_data_api failed, using fallback: {str(api_error)}")
-            market_summary = get_fallback_market_data()
+            app.logger.warning("market_data_api failed, using fallback: %s", api_error)
+            return fallback_market_data_response()
 
         return jsonify(
-            {"success": True, "data": market_summary, "timestamp": datetime.now().isoformat()}
+            {"success": True, "data": market_summary, "timestamp": iso_now()}
         )
 
-    except Exception as e:
-        app.logger.error(f"Critical error in market data endpoint: {str(e)}")
-        import traceback
-
-        app.logger.error(f"Traceback: {traceback.format_exc()}")
+    except Exception:
+        app.logger.exception("Critical error in market data endpoint")
 
         # Even if everything fails, return basic fallback data
-        fallback_data = get_fallback_market_data()
-        return jsonify(
-            {"success": True, "data": fallback_data, "timestamp": datetime.now().isoformat()}
-        )
+        return fallback_market_data_response()
+
+
+# Static 404 body for unknown paths; scanner traffic hits this often, so nothing is built per request
+NOT_FOUND_BODY = b"Page not found. Try accessing the root URL instead."
+NOT_FOUND_HEADERS = {"Content-Type": "text/plain; charset=utf-8"}
 
 
 # Catch-all route to diagnose 404 issues
 @app.route("/<path:path>")
 def catch_all(path):
-    app.logger.warning(f"[CATCH_ALL] 404 Not Found: /{path} (catch_all route hit!)")
-    return f"Page not found: /{path}. Try accessing the root URL instead.", 404
-
-
-# Health check endpoint for monitoring
-@app.route("/health")
-def health_check():
-    """Get health and version information about the application."""
-    try:
-        from VERSION import FEATURES, LAST_UPDATED
-
-        return jsonify(
-            {
-                "status": "healthy",
-                "version": current_version,
-                "features": FEATURES,
-                "last_updated": LAST_UPDATED,
-                "environment": os.environ.get("FLASK_ENV", "development"),
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
-    except ImportError:
-        return jsonify(
-            {
-                "status": "healthy",
-                "version": current_version,
-                "features": [],
-                "last_updated": "unknown",
-                "environment": os.environ.get("FLASK_ENV", "development"),
-                "timestamp": datetime.now().isoformat(),
-            }
-        )
+    """Return the static 404 body for any unmatched path."""
+    # Logged at DEBUG only, so random-URL floods don't generate log I/O in production
+    app.logger.debug("[CATCH_ALL] 404 Not Found: /%s", path)
+    return NOT_FOUND_BODY, 404, NOT_FOUND_HEADERS
 
 
 # Print all registered routes for debugging (after all routes are defined)
-with app.app_context():
-    logger.info("=== REGISTERED ROUTES ===")
-    for rule in app.url_map.iter_rules():
-        logger.info(f"Route: {rule} -> Endpoint: {rule.endpoint} Methods: {rule.methods}")
-    logger.info("=========================")
+if logger.isEnabledFor(logging.INFO):
+    logger.info(
+        "=== REGISTERED ROUTES ===\n%s",
+        "\n".join(
+            f"Route: {rule} -> Endpoint: {rule.endpoint} Methods: {sorted(rule.methods)}"
+            for rule in app.url_map.iter_rules()
+        ),
+    )
+
+# Compile the URL matcher now; gunicorn preloads the app, so forked workers
+# inherit it instead of each building it on their first request
+app.url_map.update()
 
 # Main entry point
 if __name__ == "__main__":
     app.logger.info("Starting development server")
-    app.run(debug=True, host="0.0.0.0", port=3333)
+    # The Werkzeug debugger wraps every request; opt in with FLASK_DEBUG=1
+    app.run(
+        debug=os.environ.get("FLASK_DEBUG", "0") == "1",
+        host="0.0.0.0",
+        port=3333,
+        threaded=True,
+    )
@@ -1,37 +1,60 @@
 import logging
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+_HUNDRED = Decimal("100")
+
+
+@lru_cache(maxsize=32)
+def _parse_rate_tiers(tiers):
+    """
+    Convert ``(up_to, rate_percentage)`` pairs into sorted ``(threshold, rate)`` Decimals.
+
+    The open-ended tier (``up_to`` of None) keeps a None threshold and sorts last, so a
+    lookup stops at the first tier that covers the amount. Tier tables only change
+    with the config, so each distinct table is sorted and converted once.
+    """
+    ordered = sorted(tiers, key=lambda t: (t[0] is None, t[0] or 0))
+    return tuple(
+        (None if up_to is None else Decimal(str(up_to)), Decimal(str(rate)) / _HUNDRED)
+        for up_to, rate in ordered
+    )
+
+
+def _tier_rate(tiers, amount_d):
+    """
+    Return the rate (as a fraction) of the tier covering ``amount_d``, or None without tiers.
+
+    Amounts above every threshold use the last tier's rate.
+    """
+    parsed = _parse_rate_tiers(
+        tuple((tier.get("up_to"), tier.get("rate_percentage", 0)) for tier in tiers)
+    )
+    if not parsed:
+        return None
+    for threshold, rate in parsed:
+        if threshold is None or amount_d <= threshold:
+            return rate
+    return parsed[-1][1]
+
 
 def calculate_total_title_insurance(purchase_price: float, title_config: dict) -> float:
     """Calculate total title insurance premium using tiered rates from config."""
     try:
-        logger.info(f"Calculating total title insurance for purchase price: ${purchase_price:,.2f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Calculating total title insurance for purchase price: ${purchase_price:,.2f}"
+            )
         purchase_price_d = Decimal(str(purchase_price))
-        rate = Decimal("0.0")  # Default rate
-
-        # Get rates from config, sort by 'up_to' threshold
-        rate_tiers = sorted(
-            title_config.get("total_rates_tiers", []),
-            key=lambda x: x.get("up_to") if x.get("up_to") is not None else float("inf"),
-        )
 
-        if not rate_tiers:
+        # Find the rate of the 'up_to' tier covering the purchase price
+        rate = _tier_rate(title_config.get("total_rates_tiers", []), purchase_price_d)
+        if rate is None:
             logger.warning("No total_rates_tiers found in title_insurance config.")
             return 0.0
 
-        # Find the correct rate based on purchase price
-        for tier in rate_tiers:
-            threshold = tier.get("up_to")
-            tier_rate = Decimal(str(tier.get("rate_percentage", 0))) / Decimal("100")
-            if threshold is None or purchase_price_d <= Decimal(str(threshold)):
-                rate = tier_rate
-                break
-        else:
-            # If purchase price exceeds all defined 'up_to' values, use the last tier's rate
-            rate = Decimal(str(rate_tiers[-1].get("rate_percentage", 0))) / Decimal("100")
-
         base_premium_d = purchase_price_d * rate
 
         # Get flat fee from config, default to 150.00 if not found
@@ -39,8 +62,11 @@ def calculate_total_title_insurance(purchase_price: float, title_config: dict) -
         total_premium_d = base_premium_d + flat_fee_d
 
         logger.info(
-            f"Total title insurance: ${total_premium_d:.2f} "
-            + f"(base=${base_premium_d:.2f} at rate={rate:.5f}, flat fee=${flat_fee_d:.2f})"
+            "Total title insurance: $%.2f (base=$%.2f at rate=%.5f, flat fee=$%.2f)",
+            total_premium_d,
+            base_premium_d,
+            rate,
+            flat_fee_d,
         )
 
         # Round to 2 decimal places
@@ -48,7 +74,7 @@ def calculate_total_title_insurance(purchase_price: float, title_config: dict) -
         return rounded_premium
 
     except Exception as e:
-        logger.error(f"Error calculating total title insurance: {e}")
+        logger.error("Error calculating total title insurance: %s", e)
         return 0.0
 
 
@@ -63,35 +89,19 @@ def calculate_lenders_title_insurance(
     # NOTE: Reads rates and multiplier from title_config dictionary.
     try:
         loan_amount_d = Decimal(str(loan_amount))
-        logger.info(
-            f"Calculating lender's title insurance for loan amount: ${loan_amount_d:,.2f}, include_owners_title={include_owners_title}"
-        )
-
-        rate_d = Decimal("0.0")  # Default rate
-
-        # Get rates from config, sort by 'up_to' threshold
-        # Assumes structure like: title_config['lender_rates_simultaneous_tiers']
-        rate_tiers = sorted(
-            title_config.get("lender_rates_simultaneous_tiers", []),
-            key=lambda x: x.get("up_to") if x.get("up_to") is not None else float("inf"),
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Calculating lender's title insurance for loan amount: ${loan_amount_d:,.2f}, "
+                f"include_owners_title={include_owners_title}"
+            )
 
-        if not rate_tiers:
+        # Find the rate of the 'up_to' tier covering the loan amount
+        rate_d = _tier_rate(title_config.get("lender_rates_simultaneous_tiers", []), loan_amount_d)
+        if rate_d is None:
             logger.warning("No lender_rates_simultaneous_tiers found in title_insurance config.")
             # Fallback to simpler logic or return 0? For now, return 0.
             return 0.0
 
-        # Find the correct rate based on loan amount
-        for tier in rate_tiers:
-            threshold = tier.get("up_to")
-            tier_rate = Decimal(str(tier.get("rate_percentage", 0))) / Decimal("100")
-            if threshold is None or loan_amount_d <= Decimal(str(threshold)):
-                rate_d = tier_rate
-                break
-        else:
-            # If loan amount exceeds all defined 'up_to' values, use the last tier's rate
-            rate_d = Decimal(str(rate_tiers[-1].get("rate_percentage", 0))) / Decimal("100")
-
         # If owner's title is not included, apply the waiver multiplier from config
         if not include_owners_title:
             waiver_multiplier_d = Decimal(
@@ -99,7 +109,7 @@ def calculate_lenders_title_insurance(
             )
             rate_d *= waiver_multiplier_d
             logger.info(
-                f"Applied waiver multiplier ({waiver_multiplier_d}), new rate: {rate_d:.5f}"
+                "Applied waiver multiplier (%s), new rate: %.5f", waiver_multiplier_d, rate_d
             )
 
         lenders_title_d = loan_amount_d * rate_d
@@ -108,14 +118,16 @@ def calculate_lenders_title_insurance(
         rounded_premium = float(lenders_title_d.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
 
         logger.info(
-            f"Lender's title insurance: ${rounded_premium:.2f} (rate={rate_d:.5f}, "
-            + f"discount={(include_owners_title and 'Applied' or 'Not Applied')})"
+            "Lender's title insurance: $%.2f (rate=%.5f, discount=%s)",
+            rounded_premium,
+            rate_d,
+            include_owners_title and "Applied" or "Not Applied",
         )
 
         return rounded_premium
 
     except Exception as e:
-        logger.error(f"Error calculating lender's title insurance: {e}")
+        logger.error("Error calculating lender's title insurance: %s", e)
         return 0.0
 
 
@@ -159,11 +171,14 @@ def calculate_owners_title_insurance(
         rounded_premium = float(owners_title_d.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP))
 
         logger.info(
-            f"Owner's title insurance: ${rounded_premium:.2f} (from total ${total_title_d:.2f} - discounted lender's ${lenders_title_discounted_d:.2f})"
+            "Owner's title insurance: $%.2f (from total $%.2f - discounted lender's $%.2f)",
+            rounded_premium,
+            total_title_d,
+            lenders_title_discounted_d,
         )
 
         return rounded_premium
 
     except Exception as e:
-        logger.error(f"Error calculating owner's title insurance: {e}")
+        logger.error("Error calculating owner's title insurance: %s", e)
         return 0.0
@@ -9,6 +9,7 @@ import math
 from calendar import monthrange  # Import monthrange
 from datetime import date, datetime
 from decimal import ROUND_HALF_UP, Decimal
+from functools import lru_cache
 from typing import Any, Dict, Optional, Union
 
 from calculations.title_insurance import (
@@ -22,6 +23,42 @@ from financed_fees import calculate_va_funding_fee as calculate_external_va_fund
 from mortgage_insurance import calculate_conventional_pmi, calculate_fha_mip, calculate_usda_fee
 
 
+@lru_cache(maxsize=1024)
+def _amortization_factor(annual_rate_d: Decimal, years_d: Decimal):
+    """
+    Return the monthly rate and ``(1 + monthly_rate) ** payments`` for a rate and term.
+
+    Callers usually vary the principal with the rate and term fixed, so the
+    Decimal power is computed once per (rate, term) pair.
+    """
+    monthly_rate_d = annual_rate_d / Decimal("12") / Decimal("100")
+    return monthly_rate_d, (Decimal("1") + monthly_rate_d) ** (years_d * Decimal("12"))
+
+
+def _parse_iso_date(value: str) -> date:
+    """
+    Parse a ``YYYY-MM-DD`` date string.
+
+    ``date.fromisoformat`` is a C parser with no format string; strptime is only
+    used for input it rejects, such as unpadded ``2025-7-4``.
+
+    Raises:
+        ValueError: if ``value`` is not a valid date.
+    """
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+# Maximum seller contribution (percent of purchase price) for loan types with a flat limit
+SELLER_CONTRIBUTION_PERCENT = {"fha": 6.0, "va": 4.0, "usda": 6.0}
+# Conventional limits as (LTV above which the limit applies, percent), highest LTV first;
+# LTVs at or below the last threshold get CONVENTIONAL_MAX_SELLER_CONTRIBUTION_PERCENT
+CONVENTIONAL_SELLER_CONTRIBUTION_TIERS = ((90.0, 3.0), (75.0, 6.0))
+CONVENTIONAL_MAX_SELLER_CONTRIBUTION_PERCENT = 9.0
+
+
 class MortgageCalculator:
     """Compute mortgage payments, insurance, closing costs, and related values."""
 
@@ -50,25 +87,26 @@ class MortgageCalculator:
             annual_rate_d = Decimal(str(annual_rate))
             years_d = Decimal(str(years))
             self.logger.info(
-                f"Calculating monthly payment: principal={principal_d}, rate={annual_rate_d.quantize(Decimal('0.001'))}, years={years_d}."
+                "Calculating monthly payment: principal=%s, rate=%s, years=%s.",
+                principal_d,
+                annual_rate_d.quantize(Decimal("0.001")),
+                years_d,
             )
             if annual_rate_d == Decimal("0"):
                 payment_d = (principal_d / (years_d * Decimal("12"))).quantize(
                     Decimal("0.01"), rounding=ROUND_HALF_UP
                 )
-                self.logger.info(f"Zero interest rate, monthly payment: {payment_d}.")
+                self.logger.info("Zero interest rate, monthly payment: %s.", payment_d)
                 return float(payment_d)
-            monthly_rate_d = annual_rate_d / Decimal("12") / Decimal("100")
-            num_payments_d = years_d * Decimal("12")
+            monthly_rate_d, factor = _amortization_factor(annual_rate_d, years_d)
             if monthly_rate_d == Decimal("0"):
-                payment_d = (principal_d / num_payments_d).quantize(
+                payment_d = (principal_d / (years_d * Decimal("12"))).quantize(
                     Decimal("0.01"), rounding=ROUND_HALF_UP
                 )
             else:
-                factor = (Decimal("1") + monthly_rate_d) ** num_payments_d
                 payment_d = principal_d * (monthly_rate_d * factor) / (factor - Decimal("1"))
             rounded_payment_d = payment_d.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-            self.logger.info(f"Monthly payment calculated: {rounded_payment_d}.")
+            self.logger.info("Monthly payment calculated: %s.", rounded_payment_d)
             return float(rounded_payment_d)
         except Exception as e:
             self.logger.error(f"Error calculating monthly payment: {e}.")
@@ -97,10 +135,11 @@ class MortgageCalculator:
             float: Monthly mortgage insurance premium.
         """
         try:
-            self.logger.info(
-                f"Calculating mortgage insurance: loan_amount=${loan_amount:,.0f}, "
-                f"home_value=${home_value:,.0f}, loan_type={loan_type}."
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Calculating mortgage insurance: loan_amount=${loan_amount:,.0f}, "
+                    f"home_value=${home_value:,.0f}, loan_type={loan_type}."
+                )
 
             loan_type = loan_type.lower()
             # Get relevant configurations
@@ -136,7 +175,8 @@ class MortgageCalculator:
             else:
                 # Handle unknown or types without monthly MI
                 self.logger.info(
-                    f"No monthly mortgage insurance configured or needed for loan type: {loan_type}."
+                    "No monthly mortgage insurance configured or needed for loan type: %s.",
+                    loan_type,
                 )
                 return 0.0
 
@@ -169,9 +209,10 @@ class MortgageCalculator:
             float: Total financed fees to be added to the loan.
         """
         try:
-            self.logger.info(
-                f"Calculating financed fees: loan_type={loan_type}, loan_amount=${loan_amount:,.2f}."
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Calculating financed fees: loan_type={loan_type}, loan_amount=${loan_amount:,.2f}."
+                )
             loan_type = loan_type.lower()
 
             # Fetch relevant config sections needed by helper functions
@@ -195,8 +236,10 @@ class MortgageCalculator:
                 )
 
                 self.logger.info(
-                    f"Dispatching VA funding fee calculation: service_type={va_service_type}, "
-                    f"va_usage={va_usage}, disability_exempt={va_disability_exempt}."
+                    "Dispatching VA funding fee calculation: service_type=%s, va_usage=%s, disability_exempt=%s.",
+                    va_service_type,
+                    va_usage,
+                    va_disability_exempt,
                 )
 
                 va_config = pmi_rates_config.get("va", {})  # Get VA specific config from pmi_rates
@@ -210,7 +253,7 @@ class MortgageCalculator:
                     self.logger,
                 )
                 # Log result (previously inside the old calculate_financed_fees)
-                self.logger.info(f"VA funding fee result: ${total_financed_fees: .2f}.")
+                self.logger.info("VA funding fee result: $% .2f.", total_financed_fees)
                 return total_financed_fees
 
             elif loan_type == "usda":
@@ -284,18 +327,24 @@ class MortgageCalculator:
         """
         try:
             self.logger.info(
-                f"Calculating all: price={purchase_price}, dp%={down_payment_percentage}, "
-                f"rate={annual_rate}%, term={loan_term}y, type={loan_type}, tax={annual_tax_rate}%, ins={annual_insurance_rate}%. "
+                "Calculating all: price=%s, dp%%=%s, rate=%s%%, term=%sy, type=%s, tax=%s%%, ins=%s%%. ",
+                purchase_price,
+                down_payment_percentage,
+                annual_rate,
+                loan_term,
+                loan_type,
+                annual_tax_rate,
+                annual_insurance_rate,
             )
 
             # Ensure closing date has the right type
             if closing_date and isinstance(closing_date, str):
                 try:
                     self.logger.info(
-                        f"Converting closing date string {closing_date} to date object."
+                        "Converting closing date string %s to date object.", closing_date
                     )
-                    closing_date = datetime.strptime(closing_date, "%Y-%m-%d").date()
-                    self.logger.info(f"Converted closing date: {closing_date}.")
+                    closing_date = _parse_iso_date(closing_date)
+                    self.logger.info("Converted closing date: %s.", closing_date)
                 except ValueError:
                     self.logger.error(f"Invalid closing date format: {closing_date}.")
                     closing_date = None
@@ -304,31 +353,40 @@ class MortgageCalculator:
             if down_payment_percentage is not None:
                 down_payment_amount = purchase_price * (down_payment_percentage / 100)
                 self.logger.info(
-                    f"Using provided down payment percentage: {down_payment_percentage}% = ${down_payment_amount: .2f}."
+                    "Using provided down payment percentage: %s%% = $% .2f.",
+                    down_payment_percentage,
+                    down_payment_amount,
                 )
             elif down_payment is not None:
                 down_payment_amount = down_payment
                 down_payment_percentage = (down_payment / purchase_price) * 100
                 self.logger.info(
-                    f"Using provided down payment amount: ${down_payment} = {down_payment_percentage: .2f}%. "
+                    "Using provided down payment amount: $%s = % .2f%%. ",
+                    down_payment,
+                    down_payment_percentage,
                 )
             else:
                 # Default to 20% down if nothing provided
                 down_payment_percentage = 20
                 down_payment_amount = purchase_price * 0.2
                 self.logger.info(
-                    f"No down payment specified, using default: {down_payment_percentage}% = ${down_payment_amount: .2f}. "
+                    "No down payment specified, using default: %s%% = $% .2f. ",
+                    down_payment_percentage,
+                    down_payment_amount,
                 )
 
             # Calculate loan amount
             loan_amount = purchase_price - down_payment_amount
             self.logger.info(
-                f"Calculated loan amount: {purchase_price} - {down_payment_amount} = {loan_amount}. "
+                "Calculated loan amount: %s - %s = %s. ",
+                purchase_price,
+                down_payment_amount,
+                loan_amount,
             )
 
             # Calculate LTV (Loan-to-Value) ratio
             ltv_ratio = (loan_amount / purchase_price) * 100
-            self.logger.info(f"Calculated LTV ratio: {ltv_ratio: .2f}%. ")
+            self.logger.info("Calculated LTV ratio: % .2f%%. ", ltv_ratio)
 
             # Add financed fees to loan amount for government loans
             financed_fees = self.calculate_financed_fees(
@@ -339,39 +397,46 @@ class MortgageCalculator:
                 va_usage,
                 va_disability_exempt,
             )
-            self.logger.info(f"Calculated financed fees: ${financed_fees: .2f}. ")
+            self.logger.info("Calculated financed fees: $% .2f. ", financed_fees)
 
             original_loan_amount = loan_amount
             if financed_fees > 0:
                 loan_amount += financed_fees
                 self.logger.info(
-                    f"Added financed fees to loan amount: {original_loan_amount} + {financed_fees} = {loan_amount}. "
+                    "Added financed fees to loan amount: %s + %s = %s. ",
+                    original_loan_amount,
+                    financed_fees,
+                    loan_amount,
                 )
 
             # Calculate monthly P&I
             principal_interest = self.calculate_monthly_payment(loan_amount, annual_rate, loan_term)
-            self.logger.info(f"Calculated P&I: ${principal_interest: .2f}. ")
+            self.logger.info("Calculated P&I: $% .2f. ", principal_interest)
 
             # Calculate monthly tax (with override support)
             if tax_method == "amount" and annual_tax_amount > 0:
                 monthly_tax = annual_tax_amount / 12
                 self.logger.info(
-                    f"Using actual tax amount: ${annual_tax_amount:.2f}/year = ${monthly_tax:.2f}/month"
+                    "Using actual tax amount: $%.2f/year = $%.2f/month",
+                    annual_tax_amount,
+                    monthly_tax,
                 )
             else:
                 monthly_tax = (purchase_price * annual_tax_rate / 100) / 12
-                self.logger.info(f"Calculated monthly tax: ${monthly_tax:.2f} (percentage method)")
+                self.logger.info("Calculated monthly tax: $%.2f (percentage method)", monthly_tax)
 
             # Calculate monthly insurance (with override support)
             if insurance_method == "amount" and annual_insurance_amount > 0:
                 monthly_insurance = annual_insurance_amount / 12
                 self.logger.info(
-                    f"Using actual insurance amount: ${annual_insurance_amount:.2f}/year = ${monthly_insurance:.2f}/month"
+                    "Using actual insurance amount: $%.2f/year = $%.2f/month",
+                    annual_insurance_amount,
+                    monthly_insurance,
                 )
             else:
                 monthly_insurance = (loan_amount * annual_insurance_rate / 100) / 12
                 self.logger.info(
-                    f"Calculated monthly insurance: ${monthly_insurance:.2f} (percentage method)"
+                    "Calculated monthly insurance: $%.2f (percentage method)", monthly_insurance
                 )
 
             # Calculate monthly mortgage insurance
@@ -383,7 +448,7 @@ class MortgageCalculator:
                 loan_term * 12,
                 base_loan_amount=original_loan_amount,
             )
-            self.logger.info(f"Calculated mortgage insurance: ${mortgage_insurance: .2f}. ")
+            self.logger.info("Calculated mortgage insurance: $% .2f. ", mortgage_insurance)
 
             # Calculate total monthly payment
             total_payment = (
@@ -393,7 +458,7 @@ class MortgageCalculator:
                 + monthly_hoa_fee
                 + mortgage_insurance
             )
-            self.logger.info(f"Calculated total monthly payment: ${total_payment: .2f}. ")
+            self.logger.info("Calculated total monthly payment: $% .2f. ", total_payment)
 
             # Calculate Closing Costs *before* adjusting loan amount for financed fees
             # Note: Closing costs are based on the *original* loan amount
@@ -411,7 +476,8 @@ class MortgageCalculator:
                     discount_points=discount_points,  # Pass discount points here
                 )
                 self.logger.info(
-                    f"Calculated purchase closing costs: ${closing_costs_details.get('total', 0.0): .2f}"
+                    "Calculated purchase closing costs: $% .2f",
+                    closing_costs_details.get("total", 0.0),
                 )
             else:  # Refinance
                 # For refinance, we might need different parameters or logic
@@ -426,7 +492,8 @@ class MortgageCalculator:
                     discount_points=discount_points,
                 )
                 self.logger.info(
-                    f"Calculated refinance closing costs: ${closing_costs_details.get('total', 0.0): .2f}"
+                    "Calculated refinance closing costs: $% .2f",
+                    closing_costs_details.get("total", 0.0),
                 )
 
             # Calculate prepaid items
@@ -442,13 +509,12 @@ class MortgageCalculator:
                 annual_insurance_amount,
                 purchase_price,
             )
-            self.logger.info(f"Calculated prepaid items: ${prepaid_items['total']: .2f}. ")
+            self.logger.info("Calculated prepaid items: $% .2f. ", prepaid_items["total"])
 
             # Calculate maximum seller contribution based on loan type and LTV
             max_seller_contribution = self._calculate_max_seller_contribution(
                 loan_type, ltv_ratio, purchase_price
             )
-            self.logger.info(f"Maximum seller contribution: ${max_seller_contribution: .2f}. ")
 
             # Check if the seller credit exceeds the maximum allowed
             seller_credit_exceeds_max = seller_credit > max_seller_contribution
@@ -461,13 +527,16 @@ class MortgageCalculator:
             seller_tax_credit = 0
             if "tax_escrow_adjustment" in prepaid_items:
                 seller_tax_credit = abs(prepaid_items["tax_escrow_adjustment"])
-                self.logger.info(f"Seller tax credit (proration): ${seller_tax_credit: .2f}. ")
+                self.logger.info("Seller tax credit (proration): $% .2f. ", seller_tax_credit)
 
             # Credits are only seller and lender credits (tax proration is handled in prepaids)
             total_credits = seller_credit + lender_credit
             self.logger.info(
-                f"Total credits: Seller (${seller_credit: .2f}) + Lender (${lender_credit: .2f}) = ${total_credits: .2f}. "
-                f"Tax Proration (${seller_tax_credit: .2f}) handled separately in prepaids."
+                "Total credits: Seller ($% .2f) + Lender ($% .2f) = $% .2f. Tax Proration ($% .2f) handled separately in prepaids.",
+                seller_credit,
+                lender_credit,
+                total_credits,
+                seller_tax_credit,
             )
 
             # Calculate total cash needed at closing
@@ -478,10 +547,12 @@ class MortgageCalculator:
                 - total_credits
             )
             self.logger.info(
-                f"Total cash needed: Down payment (${down_payment_amount: .2f}) + "
-                f"Closing costs (${closing_costs_details['total']: .2f}) + "
-                f"Prepaid items (${prepaid_items['total']: .2f}) - "
-                f"Credits (${total_credits: .2f}) = ${total_cash_needed: .2f}. "
+                "Total cash needed: Down payment ($% .2f) + Closing costs ($% .2f) + Prepaid items ($% .2f) - Credits ($% .2f) = $% .2f. ",
+                down_payment_amount,
+                closing_costs_details["total"],
+                prepaid_items["total"],
+                total_credits,
+                total_cash_needed,
             )
 
             # Format result into nicely structured dictionary
@@ -536,10 +607,11 @@ class MortgageCalculator:
     ) -> Dict[str, float]:
         """Calculate itemized closing costs based on configuration and transaction type."""
         try:
-            self.logger.info(
-                f"Calculating closing costs for purchase price: ${purchase_price:,.2f}, loan amount: ${loan_amount:,.2f}, "
-                f"transaction_type: {transaction_type}, include_owners: {include_owners_title}, discount_points: {discount_points}."
-            )
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    f"Calculating closing costs for purchase price: ${purchase_price:,.2f}, loan amount: ${loan_amount:,.2f}, "
+                    f"transaction_type: {transaction_type}, include_owners: {include_owners_title}, discount_points: {discount_points}."
+                )
 
             # Initialize with empty structure
             closing_costs = {}
@@ -551,13 +623,13 @@ class MortgageCalculator:
             title_config = main_config.get("title_insurance", {})
 
             # For debugging
-            self.logger.debug(f"Closing costs config type: {type(closing_costs_config).__name__}.")
+            self.logger.debug("Closing costs config type: %s.", type(closing_costs_config).__name__)
             if isinstance(closing_costs_config, dict):
                 self.logger.debug(
-                    f"Closing costs config keys: {list(closing_costs_config.keys())}."
+                    "Closing costs config keys: %s.", list(closing_costs_config.keys())
                 )
             elif isinstance(closing_costs_config, list):
-                self.logger.debug(f"Closing costs config length: {len(closing_costs_config)}.")
+                self.logger.debug("Closing costs config length: %s.", len(closing_costs_config))
             else:
                 self.logger.warning(
                     f"Unexpected closing costs config type: {type(closing_costs_config).__name__}."
@@ -568,7 +640,7 @@ class MortgageCalculator:
                 # Try to use the closing costs from the main config dictionary
                 closing_costs_config = self.config.get("closing_costs", {})
                 self.logger.info(
-                    f"Using closing costs from main config: {type(closing_costs_config).__name__}."
+                    "Using closing costs from main config: %s.", type(closing_costs_config).__name__
                 )
 
             # Special handling for dictionary format from closing_costs.json
@@ -603,7 +675,10 @@ class MortgageCalculator:
                         and tx_type_norm.capitalize() not in applies_to
                     ):
                         self.logger.debug(
-                            f"Setting cost '{item_name}' to $0 as it does not apply to transaction type '{tx_type_str}'. Applies to: {applies_to}"
+                            "Setting cost '%s' to $0 as it does not apply to transaction type '%s'. Applies to: %s",
+                            item_name,
+                            tx_type_str,
+                            applies_to,
                         )
                         # Instead of skipping, add the item with $0 value for frontend display
                         cost_key = item_name.replace(" ", "_").lower()
@@ -620,7 +695,7 @@ class MortgageCalculator:
                         )
                         closing_costs["lender_title_insurance"] = round(amount, 2)
                         total += amount
-                        self.logger.info(f"Added lender's title insurance: ${amount: .2f}.")
+                        self.logger.info("Added lender's title insurance: $% .2f.", amount)
                         continue  # Go to next item after handling title insurance
 
                     elif (
@@ -640,7 +715,7 @@ class MortgageCalculator:
                             if amount > 0:
                                 closing_costs["owner_title_insurance"] = round(amount, 2)
                                 total += amount
-                                self.logger.info(f"Added owner's title insurance: ${amount: .2f}.")
+                                self.logger.info("Added owner's title insurance: $% .2f.", amount)
                             else:
                                 closing_costs["owner_title_insurance"] = 0.0  # Ensure key exists
                                 self.logger.info(
@@ -708,14 +783,14 @@ class MortgageCalculator:
                     if amount > 0:
                         closing_costs[cost_key] = round(amount, 2)
                         total += amount
-                        self.logger.info(f"Added cost '{item_name}': ${amount: .2f}.")
+                        self.logger.info("Added cost '%s': $% .2f.", item_name, amount)
                     elif cost_key in always_include_items:
                         # Include important items even when $0 for frontend display
                         closing_costs[cost_key] = 0.0
-                        self.logger.info(f"Added {item_name} as $0.00 (always include).")
+                        self.logger.info("Added %s as $0.00 (always include).", item_name)
                     else:
                         self.logger.debug(
-                            f"Calculated amount for '{item_name}' is zero or negative. Not adding."
+                            "Calculated amount for '%s' is zero or negative. Not adding.", item_name
                         )
 
             # Handle Discount Points separately as they depend on direct input
@@ -723,7 +798,7 @@ class MortgageCalculator:
             if points_cost > 0:
                 closing_costs["discount_points"] = round(points_cost, 2)
                 total += points_cost
-                self.logger.info(f"Added discount points cost: ${points_cost: .2f}.")
+                self.logger.info("Added discount points cost: $% .2f.", points_cost)
             else:
                 # Ensure the key exists for the frontend table if needed, even if 0
                 closing_costs["discount_points"] = 0.0
@@ -739,7 +814,7 @@ class MortgageCalculator:
 
             # Ensure total is included in the returned dictionary
             closing_costs["total"] = round(total, 2)
-            self.logger.info(f"Total calculated closing costs: ${total: .2f}")
+            self.logger.info("Total calculated closing costs: $% .2f", total)
 
             return closing_costs
 
@@ -793,11 +868,12 @@ class MortgageCalculator:
             prepaid_tax = annual_tax - (monthly_tax * accrued_escrow_payments)
 
             self.logger.info(
-                f"Prepaid tax calculation: Closing date={closing_date}, "
-                f"First payment month={first_payment_month}, "
-                f"Annual tax=${annual_tax: .2f}, "
-                f"Accrued escrow payments={accrued_escrow_payments}, "
-                f"Prepaid tax amount=${prepaid_tax: .2f}. "
+                "Prepaid tax calculation: Closing date=%s, First payment month=%s, Annual tax=$% .2f, Accrued escrow payments=%s, Prepaid tax amount=$% .2f. ",
+                closing_date,
+                first_payment_month,
+                annual_tax,
+                accrued_escrow_payments,
+                prepaid_tax,
             )
 
             return round(prepaid_tax, 2)
@@ -822,10 +898,16 @@ class MortgageCalculator:
         """Calculate prepaid items (taxes, insurance, interest)."""
         try:
             self.logger.info(
-                f"Calculating prepaid items with loan={loan_amount}, tax_rate={annual_tax_rate}, insurance_rate={annual_insurance_rate}, interest_rate={annual_interest_rate}. "
+                "Calculating prepaid items with loan=%s, tax_rate=%s, insurance_rate=%s, interest_rate=%s. ",
+                loan_amount,
+                annual_tax_rate,
+                annual_insurance_rate,
+                annual_interest_rate,
             )
             self.logger.info(
-                f"Closing date provided: {closing_date} (type: {type(closing_date).__name__ if closing_date else None}). "
+                "Closing date provided: %s (type: %s). ",
+                closing_date,
+                type(closing_date).__name__ if closing_date else None,
             )
 
             # Make a deep copy of the config to avoid modifying the original
@@ -839,12 +921,16 @@ class MortgageCalculator:
                 loan_amount * annual_interest_rate / 100
             ) / CalculationConstants.DAYS_IN_STANDARD_YEAR
             self.logger.info(
-                f"Daily interest calculation: {loan_amount} * {annual_interest_rate}% / {CalculationConstants.DAYS_IN_STANDARD_YEAR} = ${daily_interest: .2f}/day. "
+                "Daily interest calculation: %s * %s%% / %s = $% .2f/day. ",
+                loan_amount,
+                annual_interest_rate,
+                CalculationConstants.DAYS_IN_STANDARD_YEAR,
+                daily_interest,
             )
 
             # Default to 30 days if no closing date is provided (only as fallback)
             days_of_interest = CalculationConstants.DEFAULT_PREPAID_INTEREST_DAYS
-            self.logger.info(f"Default days of interest (fallback): {days_of_interest}. ")
+            self.logger.info("Default days of interest (fallback): %s. ", days_of_interest)
 
             # If we have a closing date, calculate the actual days remaining in the month
             if closing_date:
@@ -857,7 +943,10 @@ class MortgageCalculator:
                     days_of_interest = (last_date_of_month - closing_date).days + 1
 
                     self.logger.info(
-                        f"Calculated {days_of_interest} days from closing date {closing_date} to end of month {last_date_of_month}. "
+                        "Calculated %s days from closing date %s to end of month %s. ",
+                        days_of_interest,
+                        closing_date,
+                        last_date_of_month,
                     )
                 except Exception as e:
                     self.logger.error(f"Error calculating days from closing date: {str(e)}. ")
@@ -868,7 +957,10 @@ class MortgageCalculator:
             # Calculate the prepaid interest amount
             prepaid_interest = round(daily_interest * days_of_interest, 2)
             self.logger.info(
-                f"Prepaid interest calculation: ${daily_interest: .2f}/day × {days_of_interest} days = ${prepaid_interest: .2f}. "
+                "Prepaid interest calculation: $% .2f/day × %s days = $% .2f. ",
+                daily_interest,
+                days_of_interest,
+                prepaid_interest,
             )
             prepaid["prepaid_interest"] = prepaid_interest
 
@@ -876,14 +968,18 @@ class MortgageCalculator:
             if tax_method == "amount" and annual_tax_amount > 0:
                 monthly_tax = annual_tax_amount / 12
                 self.logger.info(
-                    f"Using actual tax amount for prepaids: ${annual_tax_amount:.2f}/year = ${monthly_tax:.2f}/month"
+                    "Using actual tax amount for prepaids: $%.2f/year = $%.2f/month",
+                    annual_tax_amount,
+                    monthly_tax,
                 )
             else:
                 # Use purchase_price for tax calculation if available, otherwise fallback to loan_amount
                 tax_base = purchase_price if purchase_price > 0 else loan_amount
                 monthly_tax = (tax_base * annual_tax_rate / 100) / 12
                 self.logger.info(
-                    f"Calculated monthly tax for prepaids: ${monthly_tax:.2f} (percentage method on ${tax_base:.2f})"
+                    "Calculated monthly tax for prepaids: $%.2f (percentage method on $%.2f)",
+                    monthly_tax,
+                    tax_base,
                 )
 
             # Prepaid property tax is always 12 months regardless of closing date
@@ -901,7 +997,7 @@ class MortgageCalculator:
                     closing_date=closing_date, monthly_tax=monthly_tax
                 )
                 self.logger.info(
-                    f"Seller tax escrow adjustment calculated: ${tax_adjustment: .2f}. "
+                    "Seller tax escrow adjustment calculated: $% .2f. ", tax_adjustment
                 )
                 if tax_adjustment != 0:
                     prepaid["tax_escrow_adjustment"] = tax_adjustment
@@ -911,25 +1007,33 @@ class MortgageCalculator:
                     closing_date=closing_date, monthly_tax=monthly_tax
                 )
                 self.logger.info(
-                    f"Borrower escrow credit calculated: ${borrower_escrow_credit: .2f}. "
+                    "Borrower escrow credit calculated: $% .2f. ", borrower_escrow_credit
                 )
                 if borrower_escrow_credit != 0:
                     prepaid["borrower_escrow_credit"] = borrower_escrow_credit
 
             self.logger.info(
-                f"Property tax calculations: monthly=${monthly_tax: .2f}, prepaid=${prepaid['prepaid_tax']: .2f}, escrow=${prepaid['tax_escrow']: .2f}, seller_adjustment=${tax_adjustment: .2f}, borrower_credit=${borrower_escrow_credit: .2f}. "
+                "Property tax calculations: monthly=$% .2f, prepaid=$% .2f, escrow=$% .2f, seller_adjustment=$% .2f, borrower_credit=$% .2f. ",
+                monthly_tax,
+                prepaid["prepaid_tax"],
+                prepaid["tax_escrow"],
+                tax_adjustment,
+                borrower_escrow_credit,
             )
 
             # 3. Calculate prepaid homeowner's insurance (with method override support)
             if insurance_method == "amount" and annual_insurance_amount > 0:
                 monthly_insurance = annual_insurance_amount / 12
                 self.logger.info(
-                    f"Using actual insurance amount for prepaids: ${annual_insurance_amount:.2f}/year = ${monthly_insurance:.2f}/month"
+                    "Using actual insurance amount for prepaids: $%.2f/year = $%.2f/month",
+                    annual_insurance_amount,
+                    monthly_insurance,
                 )
             else:
                 monthly_insurance = (loan_amount * annual_insurance_rate / 100) / 12
                 self.logger.info(
-                    f"Calculated monthly insurance for prepaids: ${monthly_insurance:.2f} (percentage method)"
+                    "Calculated monthly insurance for prepaids: $%.2f (percentage method)",
+                    monthly_insurance,
                 )
 
             prepaid["prepaid_insurance"] = round(
@@ -939,7 +1043,10 @@ class MortgageCalculator:
                 monthly_insurance * config["months_insurance_escrow"], 2
             )
             self.logger.info(
-                f"Insurance calculations: monthly=${monthly_insurance: .2f}, prepaid=${prepaid['prepaid_insurance']: .2f}, escrow=${prepaid['insurance_escrow']: .2f}. "
+                "Insurance calculations: monthly=$% .2f, prepaid=$% .2f, escrow=$% .2f. ",
+                monthly_insurance,
+                prepaid["prepaid_insurance"],
+                prepaid["insurance_escrow"],
             )
 
             # 4. Calculate total - only sum monetary amounts, not non-monetary values
@@ -957,7 +1064,7 @@ class MortgageCalculator:
                 monetary_fields.append("borrower_escrow_credit")
 
             prepaid["total"] = sum(prepaid.get(field, 0) for field in monetary_fields)
-            self.logger.info(f"Total prepaid items: ${prepaid['total']: .2f}. ")
+            self.logger.info("Total prepaid items: $% .2f. ", prepaid["total"])
 
             return prepaid
         except Exception as e:
@@ -1005,10 +1112,12 @@ class MortgageCalculator:
 
             # Log the calculation process
             self.logger.info(
-                f"Tax proration calculation: Closing={closing_date}, "
-                f"Days in year={days_in_year}, Days seller owned={days_seller_owned}, "
-                f"Seller's tax portion=${seller_tax_responsibility: .2f}, "
-                f"Buyer credit=${abs(adjustment): .2f}. "
+                "Tax proration calculation: Closing=%s, Days in year=%s, Days seller owned=%s, Seller's tax portion=$% .2f, Buyer credit=$% .2f. ",
+                closing_date,
+                days_in_year,
+                days_seller_owned,
+                seller_tax_responsibility,
+                abs(adjustment),
             )
 
             return adjustment
@@ -1052,8 +1161,6 @@ class MortgageCalculator:
                 first_payment_year += 1
 
             # First payment date is the 1st of that month
-            from datetime import date
-
             first_payment_date = date(first_payment_year, first_payment_month, 1)
 
             # Tax due date (assume November 1st of the tax year)
@@ -1080,10 +1187,13 @@ class MortgageCalculator:
             credit_amount = -(months_count * monthly_tax)
 
             self.logger.info(
-                f"Borrower escrow credit calculation: Closing={closing_date}, "
-                f"First payment={first_payment_date}, Tax due={tax_due_date}, "
-                f"Months of escrow payments={months_count}, "
-                f"Monthly tax=${monthly_tax: .2f}, Credit=${abs(credit_amount): .2f}"
+                "Borrower escrow credit calculation: Closing=%s, First payment=%s, Tax due=%s, Months of escrow payments=%s, Monthly tax=$% .2f, Credit=$% .2f",
+                closing_date,
+                first_payment_date,
+                tax_due_date,
+                months_count,
+                monthly_tax,
+                abs(credit_amount),
             )
 
             return round(credit_amount, 2)
@@ -1227,7 +1337,7 @@ class MortgageCalculator:
                         f"Loan amount exceeds maximum allowed for {loan_type.upper()} cash-out refinance"
                     )
 
-            self.logger.info(f"Refinance validation complete: {len(errors)} errors found")
+            self.logger.info("Refinance validation complete: %s errors found", len(errors))
 
         except Exception as e:
             self.logger.error(f"Error in refinance parameter validation: {str(e)}")
@@ -1239,7 +1349,10 @@ class MortgageCalculator:
         """Generate amortization data for yearly principal balance over the loan term."""
         try:
             self.logger.info(
-                f"Generating amortization data: principal={principal}, rate={annual_rate}, years={years}. "
+                "Generating amortization data: principal=%s, rate=%s, years=%s. ",
+                principal,
+                annual_rate,
+                years,
             )
 
             if annual_rate == 0:
@@ -1259,32 +1372,18 @@ class MortgageCalculator:
                 / ((1 + monthly_rate) ** num_payments - 1)
             )
 
-            # Calculate balance at the end of each year
+            # Balance at the end of each year from the closed-form remaining-balance formula,
+            # B_k = P(1 + r)^k - payment * ((1 + r)^k - 1) / r, instead of stepping month by month
+            annual_growth = (1 + monthly_rate) ** 12
+            growth = 1.0
             balances = []
-            balance = principal
-
-            for year in range(1, years + 1):
-                for month in range(1, 13):
-                    # Skip if we've already reached the end of the loan term
-                    if year * 12 + month > num_payments:
-                        break
+            for _ in range(years):
+                growth *= annual_growth
+                balance = principal * growth - payment * (growth - 1) / monthly_rate
+                # Ensure we don't go below zero due to rounding
+                balances.append(round(max(0, balance), 2))
 
-                    # Calculate interest for this month
-                    monthly_interest = balance * monthly_rate
-
-                    # Calculate principal payment for this month
-                    principal_payment = payment - monthly_interest
-
-                    # Update balance
-                    balance -= principal_payment
-
-                    # Ensure we don't go below zero due to rounding
-                    balance = max(0, balance)
-
-                # Add balance at the end of the year to our list
-                balances.append(round(balance, 2))
-
-            self.logger.info(f"Generated {len(balances)} yearly balance data points. ")
+            self.logger.info("Generated %s yearly balance data points. ", len(balances))
             return balances
 
         except Exception as e:
@@ -1316,44 +1415,28 @@ class MortgageCalculator:
         try:
             loan_type = loan_type.lower() if isinstance(loan_type, str) else "conventional"
 
-            if loan_type == "fha":
-                # FHA allows up to 6% of purchase price
-                max_percent = 6.0
-                self.logger.info("FHA loan: Maximum seller contribution is 6% of purchase price.")
-            elif loan_type == "va":
-                # VA allows up to 4% for certain closing costs
-                max_percent = 4.0
-                self.logger.info("VA loan: Maximum seller contribution is 4% of purchase price.")
-            elif loan_type == "usda":
-                # USDA typically follows similar guidelines to FHA
-                max_percent = 6.0
-                self.logger.info("USDA loan: Maximum seller contribution is 6% of purchase price.")
-            else:
+            max_percent = SELLER_CONTRIBUTION_PERCENT.get(loan_type)
+            if max_percent is None:
                 # Conventional loan - based on LTV ratio
-                if ltv_ratio > 90:
-                    max_percent = 3.0
-                    self.logger.info(
-                        "Conventional loan with LTV > 90%: Maximum seller contribution is 3% of purchase price."
-                    )
-                elif ltv_ratio > 75:
-                    max_percent = 6.0
-                    self.logger.info(
-                        "Conventional loan with 75% < LTV ≤ 90%: Maximum seller contribution is 6% of purchase price."
-                    )
-                else:
-                    max_percent = 9.0
-                    self.logger.info(
-                        "Conventional loan with LTV ≤ 75%: Maximum seller contribution is 9% of purchase price."
-                    )
+                max_percent = CONVENTIONAL_MAX_SELLER_CONTRIBUTION_PERCENT
+                for min_ltv, percent in CONVENTIONAL_SELLER_CONTRIBUTION_TIERS:
+                    if ltv_ratio > min_ltv:
+                        max_percent = percent
+                        break
 
             max_contribution = (max_percent / 100) * purchase_price
             self.logger.info(
-                f"Maximum seller contribution: {max_percent}% of ${purchase_price: .2f} = ${max_contribution: .2f}. "
+                "%s loan at %s%% LTV: maximum seller contribution is %s%% of $% .2f = $% .2f. ",
+                loan_type,
+                ltv_ratio,
+                max_percent,
+                purchase_price,
+                max_contribution,
             )
             return round(max_contribution, 2)
 
         except Exception as e:
-            self.logger.error(f"Error calculating maximum seller contribution: {str(e)}. ")
+            self.logger.error("Error calculating maximum seller contribution: %s. ", e)
             # Default to 3% as a safe fallback
             return round(0.03 * purchase_price, 2)
 
@@ -1417,27 +1500,34 @@ class MortgageCalculator:
             if tax_method == "amount" and annual_taxes and annual_taxes > 0:
                 monthly_tax = annual_taxes / 12
                 self.logger.info(
-                    f"Refinance: Using actual tax amount: ${annual_taxes:.2f}/year = ${monthly_tax:.2f}/month"
+                    "Refinance: Using actual tax amount: $%.2f/year = $%.2f/month",
+                    annual_taxes,
+                    monthly_tax,
                 )
             else:
                 # Use percentage method
                 tax_base = appraised_value if appraised_value > 0 else loan_amount
                 monthly_tax = (tax_base * annual_tax_rate / 100) / 12
                 self.logger.info(
-                    f"Refinance: Calculated monthly tax: ${monthly_tax:.2f} (percentage method on ${tax_base:.2f})"
+                    "Refinance: Calculated monthly tax: $%.2f (percentage method on $%.2f)",
+                    monthly_tax,
+                    tax_base,
                 )
 
             # Calculate monthly insurance based on method
             if insurance_method == "amount" and annual_insurance and annual_insurance > 0:
                 monthly_insurance = annual_insurance / 12
                 self.logger.info(
-                    f"Refinance: Using actual insurance amount: ${annual_insurance:.2f}/year = ${monthly_insurance:.2f}/month"
+                    "Refinance: Using actual insurance amount: $%.2f/year = $%.2f/month",
+                    annual_insurance,
+                    monthly_insurance,
                 )
             else:
                 # Use percentage method
                 monthly_insurance = (loan_amount * annual_insurance_rate / 100) / 12
                 self.logger.info(
-                    f"Refinance: Calculated monthly insurance: ${monthly_insurance:.2f} (percentage method)"
+                    "Refinance: Calculated monthly insurance: $%.2f (percentage method)",
+                    monthly_insurance,
                 )
 
             prepaid["tax_escrow"] = monthly_tax * tax_escrow_months
@@ -1461,7 +1551,7 @@ class MortgageCalculator:
                 + prepaid["borrower_escrow_credit"]
             )
 
-            self.logger.info(f"Refinance prepaid items calculated: ${prepaid['total']:.2f}")
+            self.logger.info("Refinance prepaid items calculated: $%.2f", prepaid["total"])
 
             return prepaid
 
@@ -1524,7 +1614,14 @@ class MortgageCalculator:
         """
         try:
             # 1. Calculate current loan balance using amortization
-            orig_closing_date = datetime.strptime(original_closing_date, "%Y-%m-%d").date()
+            orig_closing_date = _parse_iso_date(original_closing_date)
+            # The new closing date defaults to today when it is missing or malformed
+            try:
+                refinance_closing_date = (
+                    _parse_iso_date(new_closing_date) if new_closing_date else date.today()
+                )
+            except ValueError:
+                refinance_closing_date = date.today()
             today = date.today()
             months_elapsed = (today.year - orig_closing_date.year) * 12 + (
                 today.month - orig_closing_date.month
@@ -1537,7 +1634,7 @@ class MortgageCalculator:
             # Use manual balance if provided, otherwise calculate from amortization
             if use_manual_balance and manual_current_balance > 0:
                 current_balance = manual_current_balance
-                self.logger.info(f"Using manual current balance: ${current_balance:.2f}")
+                self.logger.info("Using manual current balance: $%.2f", current_balance)
             else:
                 # Remaining balance after N payments (standard amortization calculation)
                 r = original_interest_rate / 100 / 12
@@ -1549,7 +1646,7 @@ class MortgageCalculator:
                 else:
                     current_balance = p * (((1 + r) ** n - (1 + r) ** k) / ((1 + r) ** n - 1))
 
-                self.logger.info(f"Calculated current loan balance: ${current_balance:.2f}")
+                self.logger.info("Calculated current loan balance: $%.2f", current_balance)
 
             # 2. Validate refinance parameters based on loan type and refinance type
             # Note: LTV validation moved to after loan amount calculation to handle cash contributions
@@ -1588,12 +1685,15 @@ class MortgageCalculator:
             # For refinance, we typically finance all closing costs minus lender credits
             financed_closing_costs = max(0, total_closing_costs - refinance_lender_credit)
 
-            self.logger.info(f"Calculated closing costs: ${financed_closing_costs: .2f}")
+            self.logger.info("Calculated closing costs: $% .2f", financed_closing_costs)
 
             # 3. Calculate preliminary new loan amount as current balance plus financed closing costs
             preliminary_loan_amount = current_balance + financed_closing_costs
             self.logger.info(
-                f"Preliminary loan amount: ${preliminary_loan_amount: .2f} (current balance: ${current_balance: .2f} + financed closing costs: ${financed_closing_costs: .2f})"
+                "Preliminary loan amount: $% .2f (current balance: $% .2f + financed closing costs: $% .2f)",
+                preliminary_loan_amount,
+                current_balance,
+                financed_closing_costs,
             )
 
             # Initialize variables used across different cash modes
@@ -1602,17 +1702,6 @@ class MortgageCalculator:
 
             # For zero cash mode, we need to calculate prepaids first to add them to loan amount
             if zero_cash_to_close:
-                # Calculate prepaid items using preliminary loan amount
-                if new_closing_date:
-                    try:
-                        refinance_closing_date = datetime.strptime(
-                            new_closing_date, "%Y-%m-%d"
-                        ).date()
-                    except ValueError:
-                        refinance_closing_date = date.today()
-                else:
-                    refinance_closing_date = date.today()
-
                 # Calculate prepaid items using actual amounts
                 if annual_taxes is not None and annual_insurance is not None:
                     preliminary_prepaid_items = self._calculate_refinance_prepaids(
@@ -1648,7 +1737,11 @@ class MortgageCalculator:
                 prepaid_total = preliminary_prepaid_items.get("total", 0)
                 new_loan_amount = current_balance + financed_closing_costs + prepaid_total
                 self.logger.info(
-                    f"Zero cash mode - New loan amount: ${new_loan_amount: .2f} (current balance: ${current_balance: .2f} + closing costs: ${financed_closing_costs: .2f} + prepaids: ${prepaid_total: .2f})"
+                    "Zero cash mode - New loan amount: $% .2f (current balance: $% .2f + closing costs: $% .2f + prepaids: $% .2f)",
+                    new_loan_amount,
+                    current_balance,
+                    financed_closing_costs,
+                    prepaid_total,
                 )
             else:
                 # Handle different cash contribution scenarios
@@ -1660,16 +1753,6 @@ class MortgageCalculator:
                     if refinance_type == "cash_out":
                         # Cash-out refinance: closing costs and prepaids are paid from loan proceeds
                         # Need to calculate prepaids first for cash-out calculation
-                        if new_closing_date:
-                            try:
-                                refinance_closing_date = datetime.strptime(
-                                    new_closing_date, "%Y-%m-%d"
-                                ).date()
-                            except ValueError:
-                                refinance_closing_date = date.today()
-                        else:
-                            refinance_closing_date = date.today()
-
                         # Calculate prepaid items for cash-out scenario
                         if annual_taxes is not None and annual_insurance is not None:
                             prepaid_items = self._calculate_refinance_prepaids(
@@ -1716,7 +1799,10 @@ class MortgageCalculator:
                         )
 
                         self.logger.info(
-                            f"Cash-out refinance - Target LTV: {target_ltv_value}%, New loan amount: ${new_loan_amount:.2f}, Cash received: ${cash_received:.2f}"
+                            "Cash-out refinance - Target LTV: %s%%, New loan amount: $%.2f, Cash received: $%.2f",
+                            target_ltv_value,
+                            new_loan_amount,
+                            cash_received,
                         )
                     else:
                         # Rate/term or streamline refinance: borrower may need to bring cash
@@ -1726,12 +1812,17 @@ class MortgageCalculator:
                         if cash_needed > 0:
                             financed_closing_costs = 0  # Closing costs paid out of pocket
                             self.logger.info(
-                                f"Rate/term refinance - Target LTV: {target_ltv_value}%, New loan amount: ${new_loan_amount:.2f}, Cash needed: ${cash_needed:.2f}, Closing costs paid out of pocket"
+                                "Rate/term refinance - Target LTV: %s%%, New loan amount: $%.2f, Cash needed: $%.2f, Closing costs paid out of pocket",
+                                target_ltv_value,
+                                new_loan_amount,
+                                cash_needed,
                             )
                         else:
                             # If no cash needed, closing costs remain financed
                             self.logger.info(
-                                f"Rate/term refinance - Target LTV: {target_ltv_value}%, New loan amount: ${new_loan_amount:.2f}, No cash needed (loan amount sufficient)"
+                                "Rate/term refinance - Target LTV: %s%%, New loan amount: $%.2f, No cash needed (loan amount sufficient)",
+                                target_ltv_value,
+                                new_loan_amount,
                             )
                 elif cash_option == "cash_back":
                     # Cash-out refinance with desired cash back amount
@@ -1739,16 +1830,6 @@ class MortgageCalculator:
                     refinance_type = "cash_out"
 
                     # Calculate loan amount needed to provide desired cash back
-                    if new_closing_date:
-                        try:
-                            refinance_closing_date = datetime.strptime(
-                                new_closing_date, "%Y-%m-%d"
-                            ).date()
-                        except ValueError:
-                            refinance_closing_date = date.today()
-                    else:
-                        refinance_closing_date = date.today()
-
                     # Calculate prepaid items first
                     if annual_taxes is not None and annual_insurance is not None:
                         prepaid_items = self._calculate_refinance_prepaids(
@@ -1791,15 +1872,19 @@ class MortgageCalculator:
                     cash_received = cash_back_amount  # The exact amount the borrower requested
 
                     self.logger.info(
-                        f"Cash back mode - New loan amount: ${new_loan_amount:.2f} "
-                        f"(current balance: ${current_balance:.2f} + closing costs: ${financed_closing_costs:.2f} + "
-                        f"prepaids: ${prepaid_total:.2f} + cash back: ${cash_back_amount:.2f}), Cash received: ${cash_received:.2f}"
+                        "Cash back mode - New loan amount: $%.2f (current balance: $%.2f + closing costs: $%.2f + prepaids: $%.2f + cash back: $%.2f), Cash received: $%.2f",
+                        new_loan_amount,
+                        current_balance,
+                        financed_closing_costs,
+                        prepaid_total,
+                        cash_back_amount,
+                        cash_received,
                     )
                 else:
                     # Standard refinance - finance all costs
                     new_loan_amount = preliminary_loan_amount
                     cash_needed = 0
-                    self.logger.info(f"Standard mode - New loan amount: ${new_loan_amount:.2f}")
+                    self.logger.info("Standard mode - New loan amount: $%.2f", new_loan_amount)
 
             # 3.5. Final recalculation of closing costs using the actual new loan amount
             # This ensures percentage-based fees (like origination fees) are calculated on the correct loan amount
@@ -1807,7 +1892,7 @@ class MortgageCalculator:
                 abs(new_loan_amount - estimated_new_loan_amount) > 1.0
             ):  # Only recalculate if significant difference
                 self.logger.info(
-                    f"Recalculating closing costs with final loan amount: ${new_loan_amount:.2f}"
+                    "Recalculating closing costs with final loan amount: $%.2f", new_loan_amount
                 )
                 closing_costs_details = self.calculate_closing_costs(
                     purchase_price=appraised_value,  # Use appraised value as purchase price
@@ -1819,7 +1904,9 @@ class MortgageCalculator:
                 total_closing_costs = closing_costs_details.get("total", 0.0)
                 financed_closing_costs = max(0, total_closing_costs - refinance_lender_credit)
                 self.logger.info(
-                    f"Final closing costs: ${total_closing_costs:.2f}, Financed: ${financed_closing_costs:.2f}"
+                    "Final closing costs: $%.2f, Financed: $%.2f",
+                    total_closing_costs,
+                    financed_closing_costs,
                 )
 
             # 4. Validate refinance parameters with final loan amount (after cash contributions)
@@ -1837,7 +1924,7 @@ class MortgageCalculator:
 
             # 5. Calculate LTV
             ltv = 100 * new_loan_amount / appraised_value if appraised_value else 0
-            self.logger.info(f"Calculated LTV: {ltv: .2f}%")
+            self.logger.info("Calculated LTV: % .2f%%", ltv)
 
             # 6. Calculate new monthly payment
             new_monthly_payment = self.calculate_monthly_payment(
@@ -1922,17 +2009,6 @@ class MortgageCalculator:
                 prepaid_items = preliminary_prepaid_items
             else:
                 # Standard mode - calculate prepaids with final loan amount
-                # Use the provided closing date or default to today
-                if new_closing_date:
-                    try:
-                        refinance_closing_date = datetime.strptime(
-                            new_closing_date, "%Y-%m-%d"
-                        ).date()
-                    except ValueError:
-                        refinance_closing_date = date.today()
-                else:
-                    refinance_closing_date = date.today()
-
                 # Calculate prepaid items using actual amounts
                 if annual_taxes is not None and annual_insurance is not None:
                     # Use custom calculation for refinance with exact amounts
@@ -1987,14 +2063,20 @@ class MortgageCalculator:
                     -cash_received
                 )  # Negative of cash received (positive means they bring cash)
                 self.logger.info(
-                    f"Cash-out refinance - Cash to close: ${cash_to_close:.2f} (negative of cash received: ${cash_received:.2f})"
+                    "Cash-out refinance - Cash to close: $%.2f (negative of cash received: $%.2f)",
+                    cash_to_close,
+                    cash_received,
                 )
             else:
                 # Standard mode - borrower pays prepaids plus any cash contribution minus credits
                 prepaids_total = prepaid_items.get("total", 0)
                 cash_to_close = prepaids_total + cash_contribution - total_credits
                 self.logger.info(
-                    f"Cash to close: ${cash_to_close:.2f} (prepaids: ${prepaids_total:.2f} + cash contribution: ${cash_contribution:.2f} - credits: ${total_credits:.2f})"
+                    "Cash to close: $%.2f (prepaids: $%.2f + cash contribution: $%.2f - credits: $%.2f)",
+                    cash_to_close,
+                    prepaids_total,
+                    cash_contribution,
+                    total_credits,
                 )
 
             # 18. Calculate minimum appraised values for LTV targets using final loan amount
@@ -2034,7 +2116,7 @@ class MortgageCalculator:
                 ltv_key = f"ltv_{int(ltv_target)}"
                 min_appraised_values[ltv_key] = math.ceil(required_appraised_value / 1000) * 1000
 
-            self.logger.info(f"Minimum appraised values calculated: {min_appraised_values}")
+            self.logger.info("Minimum appraised values calculated: %s", min_appraised_values)
 
             # No acceleration analysis for refinance (removed extra monthly payment field)
 
@@ -0,0 +1,51 @@
+"""Coalescing of concurrent identical computations.
+
+The calculator UI can fire several identical /calculate requests in quick
+succession (debounced keystrokes, auto-save). ``RequestCoalescer`` lets the
+first request run the computation while concurrent duplicates wait for and
+share its result.
+"""
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class RequestCoalescer:
+    """Share the result of an in-flight call with concurrent callers using the same key."""
+
+    def __init__(self):
+        """Initialize an empty in-flight table."""
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def run(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        Run ``func`` once for all concurrent callers with the same ``key``.
+
+        Args:
+            key: Hashable identifier of the computation's inputs.
+            func: Zero-argument callable performing the computation.
+
+        Returns:
+            The value returned by ``func``. Exceptions raised by ``func`` are
+            re-raised in every waiting caller.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+        return future.result()
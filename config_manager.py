@@ -1,7 +1,11 @@
 import json
 import logging
 import os
+import shutil
+import tempfile
+import threading
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 # Import validation components
@@ -12,6 +16,25 @@ try:
 except ImportError:
     HAS_VALIDATION = False
 
+# Configuration files loaded by ConfigManager: (filename, config_key, required)
+CONFIG_FILES = (
+    ("mortgage_config.json", "mortgage_config", True),
+    ("pmi_rates.json", "pmi_rates", True),
+    ("closing_costs.json", "closing_costs", True),
+    ("compliance_text.json", "compliance_text", False),
+    ("output_templates.json", "output_templates", False),
+)
+
+
+@lru_cache(maxsize=8)
+def _config_file_paths(config_dir):
+    """Return the paths of the CONFIG_FILES inside ``config_dir``, joined once per directory."""
+    return tuple(os.path.join(config_dir, filename) for filename, _, _ in CONFIG_FILES)
+
+
+# Serializes config saves across ConfigManager instances and request threads
+_save_lock = threading.Lock()
+
 
 class ConfigManager:
     def __init__(self):
@@ -89,6 +112,15 @@ class ConfigManager:
             self.logger.error(f"Error loading {config_key} from {file_path}: {e}")
             return None
 
+    def get_config_version(self) -> tuple:
+        """Return a token that changes whenever any configuration file is modified.
+
+        Callers can use it as part of a cache key for results derived from the config.
+        """
+        return tuple(
+            self._get_file_mod_time(file_path) for file_path in _config_file_paths(self.config_dir)
+        )
+
     def clear_cache(self):
         """Clear the configuration cache."""
         self._config_cache.clear()
@@ -172,21 +204,9 @@ class ConfigManager:
                 else:
                     self.logger.info("All configuration files passed validation")
 
-            # Define configuration files to load
-            config_files = [
-                (
-                    "mortgage_config.json",
-                    "mortgage_config",
-                    True,
-                ),  # (filename, config_key, required)
-                ("pmi_rates.json", "pmi_rates", True),
-                ("closing_costs.json", "closing_costs", True),
-                ("compliance_text.json", "compliance_text", False),
-                ("output_templates.json", "output_templates", False),
-            ]
-
-            for filename, config_key, required in config_files:
-                file_path = os.path.join(self.config_dir, filename)
+            for (filename, config_key, required), file_path in zip(
+                CONFIG_FILES, _config_file_paths(self.config_dir)
+            ):
                 self.logger.info(f"Loading {config_key} from: {file_path}")
 
                 # Load with caching
@@ -377,6 +397,32 @@ class ConfigManager:
 
         return loan_config
 
+    @staticmethod
+    def _file_has_content(file_path: str, content: str) -> bool:
+        """Return True if ``file_path`` exists and already contains exactly ``content``."""
+        try:
+            with open(file_path, "r") as f:
+                return f.read() == content
+        except (IOError, OSError):
+            return False
+
+    @staticmethod
+    def _write_file_atomic(file_path: str, content: str):
+        """Write ``content`` to a unique temp file and rename it over ``file_path``."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            if os.path.exists(file_path):
+                shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def save_config(self, config=None):
         """Save configuration to files with validation"""
         try:
@@ -423,88 +469,52 @@ class ConfigManager:
                         f"No write permission for PMI rates file: {pmi_rates_path}"
                     )
 
-            # Save mortgage configuration
-            mortgage_config_path = os.path.join(self.config_dir, "mortgage_config.json")
-            self.logger.info(f"Saving mortgage config to: {mortgage_config_path}")
-            try:
-                with open(mortgage_config_path, "w") as f:
-                    mortgage_config = {
-                        k: v
-                        for k, v in self.config.items()
-                        if k
-                        not in [
-                            "pmi_rates",
-                            "closing_costs",
-                            "compliance_text",
-                            "output_templates",
-                        ]
-                    }
-                    json.dump(mortgage_config, f, indent=4)
-                    self.logger.info("Saved mortgage configuration")
-                    modified_sections.append("mortgage_config")
-            except (IOError, PermissionError) as e:
-                self.logger.error(f"Failed to save mortgage config: {e}")
-                raise
-
-            # Save PMI rates
-            self.logger.info(f"Saving PMI rates to: {pmi_rates_path}")
-            try:
-                # Create a backup of the PMI rates file first
-                if os.path.exists(pmi_rates_path):
-                    backup_dir = os.path.join(self.config_dir, "backups")
-                    os.makedirs(backup_dir, exist_ok=True)
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_file = os.path.join(backup_dir, f"pmi_rates_backup_{timestamp}.json")
-                    with open(pmi_rates_path, "r") as src, open(backup_file, "w") as dst:
-                        dst.write(src.read())
-                    self.logger.info(f"Created backup of PMI rates at {backup_file}")
-
-                # Save the new PMI rates
-                with open(pmi_rates_path, "w") as f:
-                    pmi_data = self.config.get("pmi_rates", {})
-                    self.logger.info(f"Writing PMI data: {pmi_data}")
-                    json.dump(pmi_data, f, indent=4)
-                    self.logger.info("Saved PMI rates successfully")
-                    modified_sections.append("pmi_rates")
-            except (IOError, PermissionError) as e:
-                self.logger.error(f"Failed to save PMI rates: {e}")
-                raise
-
-            # Save closing costs
-            closing_costs_path = os.path.join(self.config_dir, "closing_costs.json")
-            self.logger.info(f"Saving closing costs to: {closing_costs_path}")
-            try:
-                with open(closing_costs_path, "w") as f:
-                    json.dump(self.config.get("closing_costs", {}), f, indent=4)
-                    self.logger.info("Saved closing costs")
-                    modified_sections.append("closing_costs")
-            except (IOError, PermissionError) as e:
-                self.logger.error(f"Failed to save closing costs: {e}")
-                raise
-
-            # Save compliance text
-            compliance_path = os.path.join(self.config_dir, "compliance_text.json")
-            self.logger.info(f"Saving compliance text to: {compliance_path}")
-            try:
-                with open(compliance_path, "w") as f:
-                    json.dump(self.config.get("compliance_text", {}), f, indent=4)
-                    self.logger.info("Saved compliance text")
-                    modified_sections.append("compliance_text")
-            except (IOError, PermissionError) as e:
-                self.logger.error(f"Failed to save compliance text: {e}")
-                raise
-
-            # Save output templates
-            templates_path = os.path.join(self.config_dir, "output_templates.json")
-            self.logger.info(f"Saving output templates to: {templates_path}")
-            try:
-                with open(templates_path, "w") as f:
-                    json.dump(self.config.get("output_templates", {}), f, indent=4)
-                    self.logger.info("Saved output templates")
-                    modified_sections.append("output_templates")
-            except (IOError, PermissionError) as e:
-                self.logger.error(f"Failed to save output templates: {e}")
-                raise
+            # Each file is only rewritten when its content changed, so saving one
+            # section doesn't rewrite (and re-timestamp) the others
+            mortgage_config = {
+                k: v
+                for k, v in self.config.items()
+                if k not in ["pmi_rates", "closing_costs", "compliance_text", "output_templates"]
+            }
+            sections = [
+                ("mortgage_config", "mortgage_config.json", mortgage_config),
+                ("pmi_rates", "pmi_rates.json", self.config.get("pmi_rates", {})),
+                ("closing_costs", "closing_costs.json", self.config.get("closing_costs", {})),
+                ("compliance_text", "compliance_text.json", self.config.get("compliance_text", {})),
+                (
+                    "output_templates",
+                    "output_templates.json",
+                    self.config.get("output_templates", {}),
+                ),
+            ]
+            with _save_lock:
+                for section, filename, data in sections:
+                    file_path = os.path.join(self.config_dir, filename)
+                    content = json.dumps(data, indent=4)
+                    if self._file_has_content(file_path, content):
+                        self.logger.debug("%s unchanged, not rewriting %s", section, file_path)
+                        continue
+
+                    self.logger.info(f"Saving {section} to: {file_path}")
+                    try:
+                        if section == "pmi_rates" and os.path.exists(file_path):
+                            # Create a backup of the PMI rates file first
+                            backup_dir = os.path.join(self.config_dir, "backups")
+                            os.makedirs(backup_dir, exist_ok=True)
+                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                            backup_file = os.path.join(
+                                backup_dir, f"pmi_rates_backup_{timestamp}.json"
+                            )
+                            with open(file_path, "r") as src, open(backup_file, "w") as dst:
+                                dst.write(src.read())
+                            self.logger.info(f"Created backup of PMI rates at {backup_file}")
+
+                        self._write_file_atomic(file_path, content)
+                        self.logger.info(f"Saved {section}")
+                        modified_sections.append(section)
+                    except (IOError, PermissionError) as e:
+                        self.logger.error(f"Failed to save {section}: {e}")
+                        raise
 
             # Track changes and create backup
             if modified_sections:
@@ -521,22 +531,13 @@ class ConfigManager:
     def get_system_health(self):
         """Get system health information."""
         try:
-            # Check config files
-            config_files = {
-                "mortgage_config": os.path.exists(
-                    os.path.join(self.config_dir, "mortgage_config.json")
-                ),
-                "pmi_rates": os.path.exists(os.path.join(self.config_dir, "pmi_rates.json")),
-                "closing_costs": os.path.exists(
-                    os.path.join(self.config_dir, "closing_costs.json")
-                ),
-                "compliance_text": os.path.exists(
-                    os.path.join(self.config_dir, "compliance_text.json")
-                ),
-                "output_templates": os.path.exists(
-                    os.path.join(self.config_dir, "output_templates.json")
-                ),
-            }
+            # Check config files with one directory scan instead of a stat per file
+            try:
+                with os.scandir(self.config_dir) as entries:
+                    present = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                present = set()
+            config_files = {section: filename in present for filename, section, _ in CONFIG_FILES}
 
             # Get backup information
             last_backup = self.get_last_backup_time()
@@ -578,19 +579,17 @@ class ConfigManager:
             if not os.path.exists(backup_dir):
                 os.makedirs(backup_dir)
 
-            # Create 10 backups in quick succession for testing
-            for i in range(10):
-                timestamp = datetime.now().strftime(f"%Y%m%d_%H%M%S_{i}")
-                backup_file = os.path.join(backup_dir, f"config_backup_{timestamp}.json")
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            backup_file = os.path.join(backup_dir, f"config_backup_{timestamp}.json")
 
-                with open(backup_file, "w") as f:
-                    json.dump(self.config, f, indent=4)
+            with open(backup_file, "w") as f:
+                json.dump(self.config, f, indent=4)
 
-                self.add_change(
-                    description="Configuration Backup",
-                    details=f"Created backup: config_backup_{timestamp}.json",
-                    user="system",
-                )
+            self.add_change(
+                description="Configuration Backup",
+                details=f"Created backup: config_backup_{timestamp}.json",
+                user="system",
+            )
 
             # Clean up old backups (keep last 10)
             backup_files = sorted(
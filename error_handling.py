@@ -376,8 +376,9 @@ def validate_request_data(required_fields: list = None, optional_fields: list =
                         f"Missing required fields: {', '.join(missing_fields)}"
                     )
             
-            # Log received fields for debugging
-            logger.debug(f"Received fields in {func.__name__}: {list(data.keys())}")
+            # Log received fields for debugging (skip building the list unless DEBUG is on)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Received fields in %s: %s", func.__name__, list(data))
             
             return func(*args, **kwargs)
         
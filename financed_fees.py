@@ -14,11 +14,13 @@ def calculate_fha_ufmip(loan_amount: float, fha_config: Dict, logger: logging.Lo
         upfront_mip = loan_amount * upfront_mip_rate
         total_financed_fees = round(upfront_mip, 2)
         logger.info(
-            f"FHA upfront MIP calculated: ${total_financed_fees:.2f} (rate: {upfront_mip_rate * 100}%)"
+            "FHA upfront MIP calculated: $%.2f (rate: %s%%)",
+            total_financed_fees,
+            upfront_mip_rate * 100,
         )
         return total_financed_fees
     except Exception as e:
-        logger.error(f"Error calculating FHA UFMIP: {e}")
+        logger.error("Error calculating FHA UFMIP: %s", e)
         raise  # Re-raise the exception
 
 
@@ -37,11 +39,13 @@ def calculate_usda_upfront_fee(
         upfront_fee = loan_amount * upfront_fee_rate
         total_financed_fees = round(upfront_fee, 2)
         logger.info(
-            f"USDA upfront guarantee fee calculated: ${total_financed_fees:.2f} (rate: {upfront_fee_rate * 100}%)"
+            "USDA upfront guarantee fee calculated: $%.2f (rate: %s%%)",
+            total_financed_fees,
+            upfront_fee_rate * 100,
         )
         return total_financed_fees
     except Exception as e:
-        logger.error(f"Error calculating USDA upfront fee: {e}")
+        logger.error("Error calculating USDA upfront fee: %s", e)
         raise  # Re-raise the exception
 
 
@@ -74,12 +78,13 @@ def calculate_va_funding_fee(
         logger.info("VA funding fee exemption applied due to disability status")
         return 0.0
 
-    logger.info(
-        f"Calculating VA funding fee with loan_amount=${loan_amount:,.2f}, "
-        f"down_payment_percentage={down_payment_percentage}%, "
-        f"service_type={service_type}, loan_usage={loan_usage}, "
-        f"disability_exempt={disability_exempt}"
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"Calculating VA funding fee with loan_amount=${loan_amount:,.2f}, "
+            f"down_payment_percentage={down_payment_percentage}%, "
+            f"service_type={service_type}, loan_usage={loan_usage}, "
+            f"disability_exempt={disability_exempt}"
+        )
 
     try:
         # Get funding fee rates from the passed config
@@ -88,7 +93,7 @@ def calculate_va_funding_fee(
             logger.error("VA funding_fee not found in provided VA config")
             raise ValueError("VA funding_fee not found in VA config")
 
-        logger.debug(f"Funding fee rates from config: {funding_fee_rates}")
+        logger.debug("Funding fee rates from config: %s", funding_fee_rates)
 
         # Normalize inputs to prevent errors
         service_type = str(service_type).lower() if service_type else "active"
@@ -96,12 +101,12 @@ def calculate_va_funding_fee(
 
         # Validate service type
         if service_type not in ["active", "reserves"]:
-            logger.warning(f"Invalid service type: {service_type}. Defaulting to 'active'")
+            logger.warning("Invalid service type: %s. Defaulting to 'active'", service_type)
             service_type = "active"
 
         # Validate loan usage
         if loan_usage not in ["first", "subsequent"]:
-            logger.warning(f"Invalid loan usage: {loan_usage}. Defaulting to 'first'")
+            logger.warning("Invalid loan usage: %s. Defaulting to 'first'", loan_usage)
             loan_usage = "first"
 
         # Determine down payment bracket
@@ -112,13 +117,13 @@ def calculate_va_funding_fee(
         else:
             dp_bracket = "10_or_more"
 
-        logger.info(f"Selected down payment bracket: {dp_bracket}")
+        logger.info("Selected down payment bracket: %s", dp_bracket)
 
         # Get the service type rates
         # Structure: funding_fee -> service_type -> dp_bracket -> loan_usage
         service_rates = funding_fee_rates.get(service_type)
         if not service_rates:
-            logger.error(f"No funding fee rates found for service type: {service_type}")
+            logger.error("No funding fee rates found for service type: %s", service_type)
             # Fallback strategy: Use 'active' if primary type not found
             service_rates = funding_fee_rates.get("active", {})
             logger.info(f"Falling back to 'active' service rates")
@@ -127,12 +132,12 @@ def calculate_va_funding_fee(
                     f"Could not find VA funding fee rates for service type '{service_type}' or fallback 'active'"
                 )
 
-        logger.info(f"Service rates found: {service_rates}")
+        logger.info("Service rates found: %s", service_rates)
 
         # Get bracket rates
         bracket_rates = service_rates.get(dp_bracket)
         if not bracket_rates:
-            logger.error(f"No funding fee rates found for down payment bracket: {dp_bracket}")
+            logger.error("No funding fee rates found for down payment bracket: %s", dp_bracket)
             # Fallback strategy: Use 'less_than_5' if primary bracket not found
             bracket_rates = service_rates.get("less_than_5", {})
             logger.info(f"Falling back to 'less_than_5' bracket rates")
@@ -141,13 +146,13 @@ def calculate_va_funding_fee(
                     f"Could not find VA funding fee rates for DP bracket '{dp_bracket}' or fallback 'less_than_5'"
                 )
 
-        logger.info(f"Bracket rates found: {bracket_rates}")
+        logger.info("Bracket rates found: %s", bracket_rates)
 
         # Get fee rate based on loan usage
         fee_rate = bracket_rates.get(loan_usage)
         if fee_rate is None:
             logger.error(
-                f"No funding fee rate found for loan usage: {loan_usage} in bracket {dp_bracket}"
+                "No funding fee rate found for loan usage: %s in bracket %s", loan_usage, dp_bracket
             )
             # Fallback strategy: Use 'first' if primary usage not found
             fee_rate = bracket_rates.get("first")
@@ -157,27 +162,37 @@ def calculate_va_funding_fee(
                     f"Could not find VA funding fee rate for usage '{loan_usage}' or fallback 'first'"
                 )
 
-        logger.info(f"Fee rate lookup for {service_type}, {dp_bracket}, {loan_usage}: {fee_rate}")
+        logger.info(
+            "Fee rate lookup for %s, %s, %s: %s", service_type, dp_bracket, loan_usage, fee_rate
+        )
 
         # Calculate fee
         fee = loan_amount * (fee_rate / 100)
         logger.info(
-            f"Calculated VA funding fee: ${fee:.2f} (rate: {fee_rate}%, loan_amount: ${loan_amount:.2f})"
+            "Calculated VA funding fee: $%.2f (rate: %s%%, loan_amount: $%.2f)",
+            fee,
+            fee_rate,
+            loan_amount,
         )
 
         return round(fee, 2)  # Ensure rounded value
 
     except Exception as e:
-        logger.error(f"Error calculating VA funding fee: {e}")
+        logger.error("Error calculating VA funding fee: %s", e)
         logger.error(
-            f"Parameters: loan_amount=${loan_amount}, down_payment={down_payment_percentage}%, "
-            f"service_type={service_type}, loan_usage={loan_usage}, disability_exempt={disability_exempt}"
+            "Parameters: loan_amount=$%s, down_payment=%s%%, "
+            "service_type=%s, loan_usage=%s, disability_exempt=%s",
+            loan_amount,
+            down_payment_percentage,
+            service_type,
+            loan_usage,
+            disability_exempt,
         )
         # Default to 2.3% (common first-time use rate for active duty, <5% down) as fallback
         # only if not disability exempt
         if not disability_exempt:
             default_fee = loan_amount * 0.023
-            logger.warning(f"Using default fee calculation due to error: ${default_fee:.2f} (2.3%)")
+            logger.warning("Using default fee calculation due to error: $%.2f (2.3%%)", default_fee)
             return round(default_fee, 2)
         else:
             # Should have been caught earlier, but safety check
@@ -7,8 +7,17 @@ bind = f"0.0.0.0:{port}"  # noqa: E231
 backlog = 2048
 
 # Worker processes
-workers = 2
-worker_class = "sync"
+# Threaded workers let requests blocked on disk/config I/O overlap within a process
+# without moving the app to an async framework. Calculations are CPU-bound and hold
+# the GIL, so they run in parallel only across processes: default to one worker per
+# CPU this process may use (at least two).
+try:
+    _available_cpus = len(os.sched_getaffinity(0))
+except AttributeError:  # not available on macOS
+    _available_cpus = os.cpu_count() or 1
+workers = int(os.environ.get("WEB_CONCURRENCY", max(2, _available_cpus)))
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 4))
 worker_connections = 1000
 timeout = 120  # Increased from 30 to 120 seconds
 keepalive = 65  # Increased from 2 to 65 seconds
@@ -19,6 +28,9 @@ certfile = None  # Handled by Render
 # ssl_version = "TLS"  # Deprecated, using ssl_context instead
 ciphers = "ECDHE-ECDSA-AES128-GCM-SHA256:ECDHE-RSA-AES128-GCM-SHA256:ECDHE-ECDSA-AES256-GCM-SHA384:ECDHE-RSA-AES256-GCM-SHA384:ECDHE-ECDSA-CHACHA20-POLY1305:ECDHE-RSA-CHACHA20-POLY1305:DHE-RSA-AES128-GCM-SHA256:DHE-RSA-AES256-GCM-SHA384"
 
+# Import the app once in the master so workers share it copy-on-write
+preload_app = True
+
 # Process naming
 proc_name = "mortgage_calc"
 pythonpath = "."
@@ -1,31 +1,36 @@
 """
 Health check endpoint for monitoring application status on Render
 """
+import json
 import os
 from datetime import datetime
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, current_app
+from flask.json.provider import DefaultJSONProvider
 
 from VERSION import FEATURES, LAST_UPDATED, VERSION
 
 health_bp = Blueprint("health", __name__)
 
+# Everything except the timestamp is fixed for the life of the process, so the
+# body is serialized once and only the timestamp is appended per request
+_HEALTH_BODY_PREFIX = json.dumps(
+    {
+        "status": "healthy",
+        "version": VERSION,
+        "features": FEATURES,
+        "last_updated": LAST_UPDATED,
+        "environment": os.environ.get("FLASK_ENV", "development"),
+    },
+    default=DefaultJSONProvider.default,
+    separators=(",", ":"),
+)[:-1]
+
 
 @health_bp.route("/health", methods=["GET"])
 def health_check():
     """
     Health check endpoint that returns application status and version information
     """
-    return (
-        jsonify(
-            {
-                "status": "healthy",
-                "version": VERSION,
-                "features": FEATURES,
-                "last_updated": LAST_UPDATED,
-                "environment": os.environ.get("FLASK_ENV", "development"),
-                "timestamp": datetime.now().isoformat(),
-            }
-        ),
-        200,
-    )
+    body = f'{_HEALTH_BODY_PREFIX},"timestamp":"{datetime.now().isoformat()}"}}'
+    return current_app.response_class(body, mimetype="application/json")
@@ -0,0 +1,101 @@
+"""orjson-backed JSON provider for the Flask application.
+
+orjson encodes and decodes several times faster than the stdlib ``json``
+module. It is optional: if the package is not installed the app keeps
+Flask's default provider.
+"""
+from flask import current_app
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+SUCCESS_BODY = b'{"success":true}'
+UNCHANGED_BODY = b'{"success":true,"unchanged":true}'
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson.
+
+    Types orjson doesn't handle natively, like dates and Decimals, fall back to
+    Flask's default conversion, so responses look the same as with the stdlib
+    provider.
+    """
+
+    def _options(self, indent=False):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        """Serialize ``obj`` to a JSON string."""
+        # Custom stdlib arguments (indent, separators, ...) keep the default path
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._options()).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a string or bytes."""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Let the stdlib decide on input orjson is stricter about (NaN, huge numbers)
+            return super().loads(s)
+
+    def response(self, *args, **kwargs):
+        """Serialize the given arguments into an ``application/json`` response."""
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        try:
+            body = orjson.dumps(obj, default=self.default, option=self._options(indent))
+        except orjson.JSONEncodeError:
+            return super().response(obj)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
+def init_json_provider(app):
+    """Install the orjson provider on ``app`` when orjson is available."""
+    if HAS_ORJSON:
+        app.json = OrjsonProvider(app)
+    return app.json
+
+
+def ok_response(unchanged=False):
+    """Return the constant ``{"success": true}`` JSON response.
+
+    The body is pre-serialized, so the many admin handlers that only report
+    success skip the encoder. A new response object is built per call because
+    ``after_request`` hooks and the session cookie mutate it.
+    """
+    body = UNCHANGED_BODY if unchanged else SUCCESS_BODY
+    return current_app.response_class(body, mimetype="application/json")
+
+
+def success_response(result):
+    """Return a ``{"success": true, "result": ...}`` JSON response.
+
+    The envelope is written around the serialized ``result`` directly, so no
+    wrapper dict is built per response.
+    """
+    body = '{"result":' + current_app.json.dumps(result) + ',"success":true}'
+    return current_app.response_class(body, mimetype="application/json")
+
+
+def error_response(message, status=400):
+    """Return a ``{"success": false, "error": message}`` JSON response."""
+    body = '{"error":' + current_app.json.dumps(message) + ',"success":false}'
+    return current_app.response_class(body, status=status, mimetype="application/json")
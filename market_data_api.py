@@ -273,6 +273,11 @@ class MarketDataAPI:
         """
         Get mortgage rates from Bankrate - a reliable financial data source
         """
+        cache_key = "bankrate_30y"
+        cached_data = self._get_cached_data(cache_key)
+        if cached_data:
+            return cached_data
+
         try:
             # Try Bankrate's mortgage rates page
             url = "https://www.bankrate.com/mortgages/mortgage-rates/"
@@ -298,7 +303,7 @@ class MarketDataAPI:
                         rate = float(match)
                         if 3.0 <= rate <= 15.0:  # Reasonable range
                             logger.info(f"Found mortgage rate from Bankrate: {rate}%")
-                            return {
+                            result = {
                                 "current_value": rate,
                                 "current_date": datetime.now().strftime("%Y-%m-%d"),
                                 "previous_value": None,
@@ -307,6 +312,8 @@ class MarketDataAPI:
                                 "updated_at": datetime.now().isoformat(),
                                 "source": "Bankrate",
                             }
+                            self._cache_data(cache_key, result)
+                            return result
                     except ValueError:
                         continue
 
@@ -322,6 +329,11 @@ class MarketDataAPI:
         Fallback method to get current mortgage rate from public sources
         when FRED API key is not available
         """
+        cache_key = "fallback_mortgage30us"
+        cached_data = self._get_cached_data(cache_key)
+        if cached_data:
+            return cached_data
+
         try:
             # Try to get rate from Mortgage News Daily (they often have current rates on their main page)
             response = self.session.get(
@@ -350,7 +362,7 @@ class MarketDataAPI:
                         rate = float(matches[0])
                         if 3.0 <= rate <= 15.0:  # Sanity check for reasonable mortgage rates
                             logger.info(f"Found current mortgage rate via fallback: {rate}%")
-                            return {
+                            result = {
                                 "current_value": rate,
                                 "current_date": datetime.now().strftime("%Y-%m-%d"),
                                 "previous_value": None,
@@ -359,6 +371,8 @@ class MarketDataAPI:
                                 "updated_at": datetime.now().isoformat(),
                                 "source": "Web Fallback",
                             }
+                            self._cache_data(cache_key, result)
+                            return result
                     except ValueError:
                         continue
 
@@ -1,11 +1,28 @@
 """Monthly mortgage insurance calculations (conventional PMI, FHA MIP, USDA fee)."""
 
 import logging
+from functools import lru_cache
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _parse_ltv_ranges(ltv_range_items):
+    """
+    Parse ``("min-max", rate)`` PMI config items into ``(min, max, rate, key)`` tuples.
+
+    The PMI table only changes with the config, so each distinct table is parsed
+    once rather than on every calculation. Keys that aren't ``min-max`` are skipped.
+    """
+    parsed = []
+    for ltv_range, rate in ltv_range_items:
+        parts = ltv_range.split("-")
+        if len(parts) == 2:
+            parsed.append((float(parts[0]), float(parts[1]), rate, ltv_range))
+    return tuple(parsed)
+
+
 def calculate_conventional_pmi(
     loan_amount: float, home_value: float, pmi_config: dict, logger: logging.Logger
 ) -> float:
@@ -16,7 +33,7 @@ def calculate_conventional_pmi(
             raise ValueError("Conventional PMI rates configuration is missing")
 
         ltv = round((loan_amount / home_value) * 100, 3)
-        logger.info(f"Conventional loan PMI calculation: LTV={ltv:.3f}%")
+        logger.info("Conventional loan PMI calculation: LTV=%.3f%%", ltv)
 
         # No PMI needed if LTV is 80% or below
         if ltv <= 80:
@@ -30,24 +47,22 @@ def calculate_conventional_pmi(
             raise ValueError("No LTV ranges defined for PMI calculation")
 
         ltv_rate = 0
-        for ltv_range, rate in ltv_ranges.items():
-            parts = ltv_range.split("-")
-            if len(parts) == 2:
-                min_ltv, max_ltv = float(parts[0]), float(parts[1])
-                if min_ltv <= ltv <= max_ltv:
-                    ltv_rate = rate / 100  # Convert from percentage to decimal
-                    logger.info(
-                        f"Selected LTV range for PMI: {ltv_range}%, rate: {round(rate, 3)}%"
-                    )
-                    break
+        parsed_ranges = _parse_ltv_ranges(tuple(ltv_ranges.items()))
+        for min_ltv, max_ltv, rate, ltv_range in parsed_ranges:
+            if min_ltv <= ltv <= max_ltv:
+                ltv_rate = rate / 100  # Convert from percentage to decimal
+                logger.info(
+                    "Selected LTV range for PMI: %s%%, rate: %s%%", ltv_range, round(rate, 3)
+                )
+                break
 
         if ltv_rate == 0:
-            logger.warning(f"No matching LTV range found for {ltv:.1f}%, using default rate")
+            logger.warning("No matching LTV range found for %.1f%%, using default rate", ltv)
             # Default to highest range if no match found
-            highest_range = max(ltv_ranges.items(), key=lambda x: float(x[0].split("-")[0]))
-            ltv_rate = highest_range[1] / 100
+            _, _, highest_rate, highest_range = max(parsed_ranges, key=lambda r: r[0])
+            ltv_rate = highest_rate / 100
             logger.info(
-                f"Using highest LTV range: {highest_range[0]}%, rate: {round(highest_range[1], 3)}%"
+                "Using highest LTV range: %s%%, rate: %s%%", highest_range, round(highest_rate, 3)
             )
 
         # Apply credit score adjustment (Currently hardcoded to 700 - consider passing if needed)
@@ -71,11 +86,11 @@ def calculate_conventional_pmi(
         monthly_pmi = (loan_amount * annual_pmi_rate) / 12
 
         rounded_pmi = round(monthly_pmi, 2)
-        logger.info(f"Final monthly PMI for conventional loan: {rounded_pmi}")
+        logger.info("Final monthly PMI for conventional loan: %s", rounded_pmi)
         return rounded_pmi
 
     except Exception as e:
-        logger.error(f"Error calculating conventional PMI: {e}")
+        logger.error("Error calculating conventional PMI: %s", e)
         raise  # Re-raise the exception to be handled by the caller
 
 
@@ -105,18 +120,19 @@ def calculate_fha_mip(
             "standard_loan_limit", 726200
         )  # Default if not in config
 
-        logger.info(
-            f"Calculating FHA MIP with loan_term={loan_term_months / 12} years, "
-            f"loan_amount=${loan_amount:,.2f}, base LTV={ltv:.2f}%"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Calculating FHA MIP with loan_term={loan_term_months / 12} years, "
+                f"loan_amount=${loan_amount:,.2f}, base LTV={ltv:.2f}%"
+            )
 
         # Determine term category
         term_category = "long_term" if loan_term_months / 12 > 15 else "short_term"
-        logger.info(f"Using {term_category} FHA MIP rates.")
+        logger.info("Using %s FHA MIP rates.", term_category)
 
         # Determine amount category (HUD bands by base loan amount)
         amount_category = "standard_amount" if ltv_basis <= standard_loan_limit else "high_amount"
-        logger.info(f"Using {amount_category} FHA MIP rates.")
+        logger.info("Using %s FHA MIP rates.", amount_category)
 
         # Determine LTV category
         ltv_category = ""
@@ -125,7 +141,7 @@ def calculate_fha_mip(
         )
 
         if not annual_mip_rate_config:
-            logger.warning(f"Missing FHA MIP rate config for {term_category}/{amount_category}")
+            logger.warning("Missing FHA MIP rate config for %s/%s", term_category, amount_category)
             # Use a reasonable default based on term if specific config is missing
             annual_mip_rate = 0.55 if term_category == "long_term" else 0.40
         else:
@@ -160,20 +176,23 @@ def calculate_fha_mip(
 
             if annual_mip_rate == 0:
                 logger.warning(
-                    f"Could not find specific FHA MIP rate for {term_category}/{amount_category}/{ltv_category}. Using default."
+                    "Could not find specific FHA MIP rate for %s/%s/%s. Using default.",
+                    term_category,
+                    amount_category,
+                    ltv_category,
                 )
                 # Fallback default rate
                 annual_mip_rate = 0.55 if term_category == "long_term" else 0.40
 
-        logger.info(f"Selected annual MIP rate: {annual_mip_rate}%")
+        logger.info("Selected annual MIP rate: %s%%", annual_mip_rate)
         annual_mip_rate_decimal = annual_mip_rate / 100
         monthly_mip = (loan_amount * annual_mip_rate_decimal) / 12
         rounded_mip = round(monthly_mip, 2)
-        logger.info(f"Final monthly MIP for FHA loan: ${rounded_mip:.2f}")
+        logger.info("Final monthly MIP for FHA loan: $%.2f", rounded_mip)
         return rounded_mip
 
     except Exception as e:
-        logger.error(f"Error calculating FHA MIP: {e}")
+        logger.error("Error calculating FHA MIP: %s", e)
         raise
 
 
@@ -187,9 +206,9 @@ def calculate_usda_fee(loan_amount: float, usda_config: dict, logger: logging.Lo
         annual_fee_rate = usda_config.get("annual_fee_rate", 0.35) / 100  # Default if not in config
         monthly_fee = (loan_amount * annual_fee_rate) / 12
         rounded_fee = round(monthly_fee, 2)
-        logger.info(f"Final monthly guarantee fee for USDA loan: ${rounded_fee:.2f}")
+        logger.info("Final monthly guarantee fee for USDA loan: $%.2f", rounded_fee)
         return rounded_fee
 
     except Exception as e:
-        logger.error(f"Error calculating USDA fee: {e}")
+        logger.error("Error calculating USDA fee: %s", e)
         raise
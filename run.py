@@ -27,8 +27,9 @@ if __name__ == "__main__":
         app.run(
             host="127.0.0.1",
             port=3000,
-            debug=True,
+            debug=os.environ.get("FLASK_DEBUG", "0") == "1",
             use_reloader=False,  # Disable reloader to prevent issues
+            threaded=True,
         )
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
@@ -47,6 +47,9 @@ class SecurityConfig:
         "Permissions-Policy": "geolocation=(), microphone=(), camera=()",
     }
 
+    # Request limits; rejects oversized bodies with 413 before they are read or parsed
+    MAX_CONTENT_LENGTH = 64 * 1024  # 64 KB
+
     # CORS settings
     CORS_ORIGINS = ["http://localhost:8013", "https://localhost:8013"]
     CORS_METHODS = ["GET", "POST"]
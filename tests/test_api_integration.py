@@ -9,6 +9,7 @@ import pytest
 import json
 import sys
 import os
+import time
 from unittest.mock import patch
 
 # Set required environment variables before importing app
@@ -86,7 +87,7 @@ class TestCalculateEndpoint:
         result = json.loads(response.data)
         
         # FHA loan should have MIP
-        assert result['monthly_pmi'] > 0
+        assert result['monthly_breakdown']['mortgage_insurance'] > 0
         # Should have upfront MIP financed
         expected_base_loan = 300000 * (1 - 0.035)
         assert result['loan_details']['loan_amount'] > expected_base_loan
@@ -115,7 +116,7 @@ class TestCalculateEndpoint:
         result = json.loads(response.data)
         
         # VA loan should not have mortgage insurance
-        assert result['monthly_pmi'] == 0
+        assert result['monthly_breakdown']['mortgage_insurance'] == 0
         assert result['loan_details']['ltv_ratio'] == 100.0
     
     def test_high_ltv_conventional_loan(self):
@@ -140,7 +141,7 @@ class TestCalculateEndpoint:
         
         # Should not error and should calculate PMI
         assert result['loan_details']['ltv_ratio'] == 95.0
-        assert result['monthly_pmi'] > 0
+        assert result['monthly_breakdown']['mortgage_insurance'] > 0
     
     def test_invalid_json_request(self):
         """Test handling of invalid JSON."""
@@ -164,6 +165,114 @@ class TestCalculateEndpoint:
         # Should return error for missing fields
         assert response.status_code >= 400
     
+    def test_repeat_calculation_uses_cached_result(self):
+        """Test that identical resubmissions are served from the calculation cache."""
+        data = {
+            'purchase_price': 350000,
+            'down_payment_percentage': 15,
+            'annual_rate': 6.25,
+            'loan_term': 30,
+            'annual_tax_rate': 1.1,
+            'annual_insurance_rate': 0.4,
+            'loan_type': 'conventional',
+            'transaction_type': 'purchase'
+        }
+
+        from app import _cached_calculation
+        _cached_calculation.cache_clear()
+
+        first = self.client.post('/calculate', data=json.dumps(data),
+                                 content_type='application/json')
+        second = self.client.post('/calculate', data=json.dumps(data),
+                                  content_type='application/json')
+
+        assert first.status_code == 200
+        assert json.loads(first.data) == json.loads(second.data)
+        assert _cached_calculation.cache_info().hits == 1
+
+    def test_cash_needed_and_credits_come_from_calculator(self):
+        """Test that /calculate passes through the calculator's cash needed and credits."""
+        from app import calculator
+        data = {
+            'purchase_price': 350000,
+            'down_payment_percentage': 15,
+            'annual_rate': 6.25,
+            'loan_term': 30,
+            'annual_tax_rate': 1.1,
+            'annual_insurance_rate': 0.4,
+            'loan_type': 'conventional',
+            'seller_credit': 2500,
+            'lender_credit': 1000,
+        }
+        response = self.client.post('/calculate', data=json.dumps(data),
+                                    content_type='application/json')
+        body = json.loads(response.data)
+
+        expected = calculator.calculate_all(**data)
+        assert response.status_code == 200
+        assert body['total_cash_needed'] == expected['total_cash_needed']
+        assert body['credits'] == expected['credits']
+        assert body['loan_details'] == {**expected['loan_details'], 'transaction_type': 'purchase'}
+
+    def test_config_change_invalidates_cached_result(self):
+        """Test that a new config version recomputes instead of reusing the cached result."""
+        from app import _cached_calculation
+        from config_manager import ConfigManager
+        data = {
+            'purchase_price': 350000,
+            'down_payment_percentage': 15,
+            'annual_rate': 6.25,
+            'loan_term': 30,
+            'annual_tax_rate': 1.1,
+            'annual_insurance_rate': 0.4,
+            'loan_type': 'conventional',
+            'transaction_type': 'purchase'
+        }
+        _cached_calculation.cache_clear()
+        self.client.post('/calculate', data=json.dumps(data), content_type='application/json')
+
+        with patch.object(ConfigManager, 'get_config_version', return_value=('changed',)):
+            response = self.client.post('/calculate', data=json.dumps(data),
+                                        content_type='application/json')
+
+        assert response.status_code == 200
+        assert _cached_calculation.cache_info().hits == 0
+        assert _cached_calculation.cache_info().misses == 2
+
+    def test_calculation_checks_config_files_once(self):
+        """Test that /calculate stats the config files once on both cache hits and misses."""
+        from app import _cached_calculation
+        from config_manager import ConfigManager
+        data = {
+            'purchase_price': 350000,
+            'down_payment_percentage': 15,
+            'annual_rate': 6.25,
+            'loan_term': 30,
+            'annual_tax_rate': 1.1,
+            'annual_insurance_rate': 0.4,
+            'loan_type': 'conventional',
+            'transaction_type': 'purchase'
+        }
+        self.client.post('/calculate', data=json.dumps(data), content_type='application/json')
+
+        with patch.object(ConfigManager, 'get_config_version', autospec=True,
+                          side_effect=ConfigManager.get_config_version) as spy:
+            response = self.client.post('/calculate', data=json.dumps(data),
+                                        content_type='application/json')
+
+        assert response.status_code == 200
+        assert spy.call_count == 1
+
+        _cached_calculation.cache_clear()
+        with patch.object(ConfigManager, 'get_config_version', autospec=True,
+                          side_effect=ConfigManager.get_config_version) as spy:
+            response = self.client.post('/calculate', data=json.dumps(data),
+                                        content_type='application/json')
+
+        assert response.status_code == 200
+        assert _cached_calculation.cache_info().misses == 1
+        assert spy.call_count == 1
+
     def test_negative_values_handling(self):
         """Test handling of negative values."""
         data = {
@@ -182,6 +291,135 @@ class TestCalculateEndpoint:
         # Currently returns 500 due to missing fields - this indicates need for better input validation
         assert response.status_code in [200, 400, 422, 500]
 
+    def test_response_gzipped_when_accepted(self):
+        """Test that /calculate responses are gzipped only for clients that accept it."""
+        import gzip
+        data = {
+            'purchase_price': 300000,
+            'down_payment_percentage': 20,
+            'annual_rate': 5.5,
+            'loan_term': 30,
+            'annual_tax_rate': 1.2,
+            'annual_insurance_rate': 0.8,
+            'loan_type': 'conventional'
+        }
+
+        plain = self.client.post('/calculate', data=json.dumps(data),
+                                 content_type='application/json')
+        compressed = self.client.post('/calculate', data=json.dumps(data),
+                                      content_type='application/json',
+                                      headers={'Accept-Encoding': 'gzip, deflate'})
+
+        assert 'Content-Encoding' not in plain.headers
+        assert compressed.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in compressed.headers['Vary']
+        assert len(compressed.data) < len(plain.data)
+        assert json.loads(gzip.decompress(compressed.data)) == json.loads(plain.data)
+
+
+class TestCalculateBatchEndpoint:
+    """Test /calculate/batch endpoint integration."""
+
+    def setup_method(self):
+        """Set up test client."""
+        app.config['TESTING'] = True
+        app.config['WTF_CSRF_ENABLED'] = False  # Disable CSRF for testing
+        self.client = app.test_client()
+        self.scenario = {
+            'purchase_price': 300000,
+            'down_payment_percentage': 20,
+            'annual_rate': 6.5,
+            'loan_term': 30,
+            'annual_tax_rate': 1.2,
+            'annual_insurance_rate': 0.35,
+            'loan_type': 'conventional',
+        }
+
+    def test_batch_matches_single_calculations(self):
+        """Test that each batch result equals the /calculate response for that scenario."""
+        scenarios = [self.scenario, {**self.scenario, 'annual_rate': 7.0}]
+
+        response = self.client.post('/calculate/batch', json={'scenarios': scenarios})
+
+        assert response.status_code == 200
+        body = json.loads(response.data)
+        assert body['success'] is True
+        for scenario, result in zip(scenarios, body['result']):
+            single = self.client.post('/calculate', json=scenario)
+            assert result == json.loads(single.data)
+
+    def test_batch_rejects_invalid_scenarios(self):
+        """Test that malformed batches are rejected with the offending scenario index."""
+        assert self.client.post('/calculate/batch', json={'scenarios': []}).status_code == 400
+
+        missing = {k: v for k, v in self.scenario.items() if k != 'loan_term'}
+        response = self.client.post('/calculate/batch',
+                                    json={'scenarios': [self.scenario, missing]})
+        assert response.status_code == 400
+        assert json.loads(response.data)['error'] == (
+            'Scenario 1: missing required fields: loan_term'
+        )
+
+        invalid = {**self.scenario, 'purchase_price': -1}
+        response = self.client.post('/calculate/batch', json={'scenarios': [invalid]})
+        assert response.status_code == 400
+        assert 'Scenario 0' in json.loads(response.data)['error']
+
+    def test_batch_rejects_malformed_bodies(self):
+        """Test that non-object bodies and unexpected input types return JSON 400s."""
+        response = self.client.post('/calculate/batch', json=[self.scenario])
+        assert response.status_code == 400
+        assert json.loads(response.data)['error'] == 'Request body must be a JSON object'
+
+        bad_type = {**self.scenario, 'loan_type': 5}
+        response = self.client.post('/calculate/batch',
+                                    json={'scenarios': [self.scenario, bad_type]})
+        assert response.status_code == 400
+        assert json.loads(response.data)['error'].startswith('Scenario 1:')
+
+
+class TestIndexPage:
+    """Test caching behaviour of the calculator page."""
+
+    def setup_method(self):
+        """Set up test client."""
+        app.config['TESTING'] = True
+        self.client = app.test_client()
+
+    def test_index_revalidates_with_etag(self):
+        """Test that the index page can be revalidated with a 304."""
+        # Freeze the clock so both requests fall in the same cache-buster bucket
+        with patch('time.time', return_value=time.time()):
+            response = self.client.get('/')
+            assert response.status_code == 200
+            assert response.headers['Cache-Control'] == 'private, max-age=0, must-revalidate'
+
+            response = self.client.get('/', headers={'If-None-Match': response.headers['ETag']})
+            assert response.status_code == 304
+
+    def test_index_etag_follows_session_state(self):
+        """Test that an admin login or a pending flash message re-renders the page."""
+        with patch('time.time', return_value=time.time()):
+            etag = self.client.get('/').headers['ETag']
+
+            with self.client.session_transaction() as sess:
+                sess['admin_logged_in'] = True
+            response = self.client.get('/', headers={'If-None-Match': etag})
+            assert response.status_code == 200
+            assert b'Admin' in response.data
+
+            etag = response.headers['ETag']
+            with self.client.session_transaction() as sess:
+                sess['_flashes'] = [('success', 'Logged out')]
+            response = self.client.get('/', headers={'If-None-Match': etag})
+            assert response.status_code == 200
+            assert b'Logged out' in response.data
+
+    def test_post_responses_are_not_stored(self):
+        """Test that mutating requests keep no-store."""
+        response = self.client.post('/', json={})
+        assert 'no-store' in response.headers['Cache-Control']
+
 
 class TestRefinanceEndpoint:
     """Test /refinance endpoint integration."""
@@ -223,6 +461,33 @@ class TestRefinanceEndpoint:
         # Should have refinance-specific structure
         assert 'result' in result or 'loan_details' in result
     
+    def test_refinance_numeric_fields_coercion(self):
+        """Test that refinance numbers use defaults for optional fields and reject bad required ones."""
+        from app import _coerce_refinance_fields
+        data = {
+            'appraised_value': '400000',
+            'original_loan_balance': 300000,
+            'original_interest_rate': 6.5,
+            'new_interest_rate': 5.75,
+            'annual_taxes': 4800,
+            'annual_insurance': 1500,
+            'new_loan_term': '15',
+            'monthly_hoa_fee': '',
+            'cash_back_amount': 'abc',
+        }
+
+        values = _coerce_refinance_fields(data)
+        assert values['appraised_value'] == 400000.0
+        assert values['new_loan_term'] == 15
+        assert values['original_loan_term'] == 30
+        assert values['monthly_hoa_fee'] == 0
+        assert values['cash_back_amount'] == 0
+
+        with pytest.raises(ValueError, match='annual_taxes'):
+            _coerce_refinance_fields({**data, 'annual_taxes': ' '})
+        with pytest.raises(ValueError, match='Invalid value for new_interest_rate'):
+            _coerce_refinance_fields({**data, 'new_interest_rate': 'low'})
+
     def test_high_ltv_refinance_allowed(self):
         """Test that high LTV refinance is allowed (critical bug fix)."""
         data = {
@@ -250,6 +515,34 @@ class TestRefinanceEndpoint:
             response_text = json.dumps(result).lower()
             assert 'mortgage insurance required for ltv > 80%' not in response_text
 
+    def test_repeat_refinance_uses_cached_result(self):
+        """Test that resubmitting identical parameters returns the same, independent result."""
+        data = {
+            'appraised_value': 400000,
+            'original_loan_balance': 300000,
+            'original_interest_rate': 7.0,
+            'original_loan_term': 30,
+            'original_closing_date': '2020-01-01',
+            'new_interest_rate': 6.0,
+            'new_loan_term': 30,
+            'annual_taxes': 4000,
+            'annual_insurance': 1500,
+            'new_closing_date': '2026-11-15',
+            'transaction_type': 'refinance'
+        }
+
+        from app import _cached_refinance
+        _cached_refinance.cache_clear()
+
+        first = self.client.post('/refinance', data=json.dumps(data),
+                                 content_type='application/json')
+        second = self.client.post('/refinance', data=json.dumps(data),
+                                  content_type='application/json')
+
+        assert first.status_code == 200
+        assert json.loads(first.data) == json.loads(second.data)
+        assert _cached_refinance.cache_info().hits == 1
+
 
 class TestMaxSellerContributionEndpoint:
     """Test /api/max_seller_contribution endpoint."""
@@ -304,6 +597,20 @@ class TestMaxSellerContributionEndpoint:
         # FHA typically has different limits than conventional
         assert isinstance(result['max_seller_contribution'], (int, float))
     
+    def test_form_encoded_seller_contribution(self):
+        """Test that form-encoded posts are accepted like JSON ones."""
+        data = {
+            'loan_type': 'conventional',
+            'purchase_price': '300000',
+            'down_payment_amount': '60000'
+        }
+
+        form_response = self.client.post('/api/max_seller_contribution', data=data)
+        json_response = self.client.post('/api/max_seller_contribution', json=data)
+
+        assert form_response.status_code == 200
+        assert json.loads(form_response.data) == json.loads(json_response.data)
+
     def test_va_loan_seller_contribution(self):
         """Test seller contribution calculation for VA loan."""
         data = {
@@ -338,6 +645,29 @@ class TestMaxSellerContributionEndpoint:
         assert response.status_code in [200, 400, 422]
 
 
+class TestHealthEndpoint:
+    """Test /health endpoint."""
+
+    def setup_method(self):
+        """Set up test client."""
+        app.config['TESTING'] = True
+        self.client = app.test_client()
+
+    def test_health_reports_version_with_fresh_timestamp(self):
+        """Test that /health returns the static status fields and a per-request timestamp."""
+        from VERSION import VERSION
+
+        first = self.client.get('/health')
+        second = self.client.get('/health')
+
+        assert first.status_code == 200
+        assert first.mimetype == 'application/json'
+        body = json.loads(first.data)
+        assert body['status'] == 'healthy'
+        assert body['version'] == VERSION
+        assert body['timestamp'] != json.loads(second.data)['timestamp']
+
+
 class TestErrorHandling:
     """Test error handling across all endpoints."""
     
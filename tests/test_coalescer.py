@@ -0,0 +1,69 @@
+"""
+Tests for coalescing of concurrent identical computations.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from coalescer import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    """Test RequestCoalescer behavior."""
+
+    def test_concurrent_duplicates_share_one_call(self):
+        """Test that concurrent callers with the same key run the function once."""
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        calls = []
+        results = []
+
+        def compute():
+            calls.append(1)
+            release.wait(timeout=5)
+            return {"total": 42}
+
+        threads = [
+            threading.Thread(target=lambda: results.append(coalescer.run("key", compute)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        # Give every thread time to join the in-flight call before it finishes
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"total": 42}] * 5
+
+    def test_sequential_calls_recompute(self):
+        """Test that completed calls are not cached."""
+        coalescer = RequestCoalescer()
+        calls = []
+
+        coalescer.run("key", lambda: calls.append(1))
+        coalescer.run("key", lambda: calls.append(1))
+
+        assert len(calls) == 2
+        assert coalescer._inflight == {}
+
+    def test_exception_propagates(self):
+        """Test that errors are raised to the caller and the key is released."""
+        coalescer = RequestCoalescer()
+
+        def fail():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            coalescer.run("key", fail)
+
+        assert coalescer._inflight == {}
@@ -11,7 +11,7 @@ import os
 import tempfile
 import time
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 # Add the parent directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -239,5 +239,247 @@ class TestConfigCaching:
             assert warm_load_time <= cold_load_time * 2  # Allow some variance
 
 
+    def test_save_config_only_rewrites_changed_files(self):
+        """Test that save_config leaves files with unchanged content untouched."""
+        with patch.object(ConfigManager, '__init__') as mock_init:
+            mock_init.return_value = None
+
+            config_manager = ConfigManager()
+            config_manager.config = {}
+            config_manager.config_dir = self.temp_dir
+            config_manager._config_cache = {}
+            config_manager._file_mod_times = {}
+            config_manager._cache_enabled = True
+            config_manager._validation_enabled = False  # Disable validation for caching tests
+            config_manager.validator = None
+            config_manager.logger = MagicMock()
+            config_manager.add_change = MagicMock()
+            config_manager.backup_config = MagicMock()
+
+            config_manager.load_config()
+            config_manager.save_config()
+
+            # Second save with identical content writes nothing
+            written_before = {
+                name: os.path.getmtime(os.path.join(self.temp_dir, name))
+                for name in os.listdir(self.temp_dir)
+                if name.endswith('.json')
+            }
+            config_manager.add_change.reset_mock()
+            with patch.object(ConfigManager, '_write_file_atomic') as mock_write:
+                config_manager.save_config()
+                assert not mock_write.called
+            config_manager.add_change.assert_not_called()
+
+            # Changing one section rewrites only that file
+            config_manager.config["compliance_text"] = {"disclaimer": "updated"}
+            with patch.object(ConfigManager, '_write_file_atomic') as mock_write:
+                config_manager.save_config()
+                written = [call.args[0] for call in mock_write.call_args_list]
+            assert written == [os.path.join(self.temp_dir, "compliance_text.json")]
+            assert all(
+                os.path.getmtime(os.path.join(self.temp_dir, name)) == mtime
+                for name, mtime in written_before.items()
+            )
+
+
+    def test_atomic_write_keeps_mode_and_unique_temp_files(self):
+        """Test that concurrent atomic writes never share a temp file and keep the file mode."""
+        import threading
+
+        file_path = os.path.join(self.temp_dir, "compliance_text.json")
+        with open(file_path, "w") as f:
+            json.dump({}, f)
+        os.chmod(file_path, 0o640)
+        started = threading.Barrier(4)
+        errors = []
+
+        def write(index):
+            started.wait()
+            try:
+                ConfigManager._write_file_atomic(file_path, json.dumps({"writer": index}))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        with open(file_path) as f:
+            assert json.load(f)["writer"] in range(4)
+        assert os.stat(file_path).st_mode & 0o777 == 0o640
+        assert not [name for name in os.listdir(self.temp_dir) if name.endswith(".tmp")]
+
+
+    def test_backup_config_writes_one_snapshot(self):
+        """Test that each backup_config call writes a single config snapshot."""
+        with patch.object(ConfigManager, '__init__') as mock_init:
+            mock_init.return_value = None
+
+            config_manager = ConfigManager()
+            config_manager.config = {"compliance_text": {"disclaimer": "text"}}
+            config_manager.config_dir = self.temp_dir
+            config_manager.logger = MagicMock()
+            config_manager.add_change = MagicMock()
+
+            assert config_manager.backup_config()
+
+            backups = os.listdir(os.path.join(self.temp_dir, "backups"))
+            assert len(backups) == 1
+            with open(os.path.join(self.temp_dir, "backups", backups[0])) as f:
+                assert json.load(f) == config_manager.config
+            config_manager.add_change.assert_called_once()
+
+    def test_system_health_reports_config_files(self):
+        """Test that get_system_health reports which config files are present."""
+        with patch.object(ConfigManager, '__init__') as mock_init:
+            mock_init.return_value = None
+
+            config_manager = ConfigManager()
+            config_manager.config_dir = self.temp_dir
+            config_manager.calculation_history = []
+            config_manager.recent_changes = []
+            config_manager.logger = MagicMock()
+            os.remove(os.path.join(self.temp_dir, "pmi_rates.json"))
+
+            health = config_manager.get_system_health()
+
+        assert health["config_files"]["mortgage_config"] is True
+        assert health["config_files"]["pmi_rates"] is False
+        assert health["status"] == "warning"
+
+
+class TestAdminDataFileCache:
+    """Test the mtime-keyed cache for the admin JSON data files."""
+
+    def setup_method(self):
+        """Point the seller contributions file at a temporary copy."""
+        import admin_routes
+
+        self.admin_routes = admin_routes
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "seller_contributions.json")
+        with open(self.path, 'w') as f:
+            json.dump({"fha": {"all_types": []}}, f)
+        self.costs_path = os.path.join(self.temp_dir, "closing_costs.json")
+        with open(self.costs_path, 'w') as f:
+            json.dump({"appraisal_fee": self.closing_cost("Appraisal Fee")}, f)
+        self.patches = [
+            patch.object(admin_routes, "SELLER_CONTRIBUTIONS_FILE", self.path),
+            patch.object(
+                admin_routes, "_seller_contributions_cache", {"stamp": None, "data": {}}
+            ),
+            patch.object(admin_routes, "CLOSING_COSTS_FILE", self.costs_path),
+            patch.object(admin_routes, "_closing_costs_cache", {"stamp": None, "data": {}}),
+        ]
+        for p in self.patches:
+            p.start()
+
+    @staticmethod
+    def closing_cost(name):
+        """Return a valid closing cost entry named ``name``."""
+        return {
+            "name": name,
+            "type": "fixed",
+            "value": 500.0,
+            "calculation_base": "fixed",
+            "description": "",
+        }
+
+    def teardown_method(self):
+        """Clean up test fixtures."""
+        for p in self.patches:
+            p.stop()
+        import shutil
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unchanged_file_is_read_once(self):
+        """Test that repeated loads reuse the parsed file."""
+        with patch("builtins.open", wraps=open) as mock_open:
+            first = self.admin_routes.load_seller_contributions()
+            second = self.admin_routes.load_seller_contributions()
+
+        assert first == {"fha": {"all_types": []}}
+        assert second is first
+        assert mock_open.call_count == 1
+
+    def test_save_and_external_edit_refresh_cache(self):
+        """Test that saves update the cache and outside edits are picked up."""
+        data = dict(self.admin_routes.load_seller_contributions())
+        data["va"] = {"all_types": []}
+        self.admin_routes.save_seller_contributions_data(data)
+        with open(self.path) as f:
+            assert json.load(f) == data
+
+        time.sleep(0.01)
+        with open(self.path, 'w') as f:
+            json.dump({"usda": {}}, f)
+
+        assert self.admin_routes.load_seller_contributions() == {"usda": {}}
+
+    def test_concurrent_misses_parse_once(self):
+        """Test that threads missing the cache together share one parse."""
+        import threading
+
+        real_load = json.load
+        started = threading.Barrier(4)
+
+        def slow_load(f):
+            time.sleep(0.05)
+            return real_load(f)
+
+        def load():
+            started.wait()
+            self.admin_routes.load_seller_contributions()
+
+        with patch.object(self.admin_routes.json, "load", side_effect=slow_load) as mock_load:
+            threads = [threading.Thread(target=load) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert mock_load.call_count == 1
+
+    def test_admin_edits_never_mutate_the_cached_dict(self):
+        """Test that closing cost edits work on a copy and are written atomically."""
+        os.environ.setdefault("SECRET_KEY", "test-secret-key-for-testing-only")
+        from app import app
+
+        app.config["TESTING"] = True
+        app.config["WTF_CSRF_ENABLED"] = False
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess["admin_logged_in"] = True
+
+        cached = self.admin_routes.load_closing_costs()
+        snapshot = json.dumps(cached, sort_keys=True)
+        with patch.object(
+            ConfigManager, "_write_file_atomic", wraps=ConfigManager._write_file_atomic
+        ) as mock_write:
+            assert client.post(
+                "/admin/closing-costs/add", json=self.closing_cost("Survey Fee")
+            ).status_code == 200
+            update = {**self.closing_cost("Appraisal Fee"), "value": 650}
+            assert client.put(
+                "/admin/closing-costs/appraisal_fee", json=update
+            ).status_code == 200
+            assert client.delete("/admin/closing-costs/survey_fee").status_code == 200
+
+        assert json.dumps(cached, sort_keys=True) == snapshot
+        assert [call.args[0] for call in mock_write.call_args_list] == [self.costs_path] * 3
+        with open(self.costs_path) as f:
+            assert json.load(f)["appraisal_fee"]["value"] == 650
+
+    def test_missing_file_returns_empty(self):
+        """Test that a missing file loads as an empty dict."""
+        os.remove(self.path)
+
+        assert self.admin_routes.load_seller_contributions() == {}
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -0,0 +1,218 @@
+"""
+Tests for the orjson-backed JSON provider.
+
+These tests verify that responses encoded with orjson match what Flask's
+default provider would produce for the types used by the application.
+"""
+
+import json
+import math
+import os
+import sys
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+# Set required environment variables before importing app
+os.environ["SECRET_KEY"] = "test-secret-key-for-testing-only"
+
+# Add the parent directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import app
+from constants import TRANSACTION_TYPE
+from json_provider import (
+    HAS_ORJSON,
+    OrjsonProvider,
+    error_response,
+    ok_response,
+    success_response,
+)
+
+pytestmark = pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed")
+
+
+class TestOrjsonProvider:
+    """Test OrjsonProvider serialization."""
+
+    def setup_method(self):
+        """Set up a bare app with both providers."""
+        self.app = Flask(__name__)
+        self.provider = OrjsonProvider(self.app)
+        self.default_provider = DefaultJSONProvider(self.app)
+
+    def test_matches_default_provider(self):
+        """Test that common payloads decode to the same values as the stdlib provider."""
+        payload = {
+            "success": True,
+            "amount": 1234.56,
+            "transaction_type": TRANSACTION_TYPE.PURCHASE,
+            "last_updated": date(2026, 7, 2),
+            "rate": Decimal("6.5"),
+            "items": [1, 2, None],
+        }
+
+        assert json.loads(self.provider.dumps(payload)) == json.loads(
+            self.default_provider.dumps(payload)
+        )
+
+    def test_loads_round_trip(self):
+        """Test that loads accepts both str and bytes."""
+        assert self.provider.loads('{"a": 1}') == {"a": 1}
+        assert self.provider.loads(b'{"a": [1.5]}') == {"a": [1.5]}
+
+    def test_falls_back_for_unsupported_values(self):
+        """Test that values orjson rejects are still encoded and decoded."""
+        big = 10**30
+        assert json.loads(self.provider.dumps({"value": big})) == {"value": big}
+        assert math.isnan(self.provider.loads('{"value": NaN}')["value"])
+
+    def test_response_is_json(self):
+        """Test that response() builds an application/json response."""
+        with self.app.app_context():
+            response = self.provider.response({"success": True})
+
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data) == {"success": True}
+
+
+class TestResponseHelpers:
+    """Test the success/error envelope helpers."""
+
+    def test_success_response(self):
+        """Test that success_response wraps the result in the standard envelope."""
+        with app.app_context():
+            response = success_response({"monthly_payment": 1234.5})
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        assert json.loads(response.data) == {
+            "success": True,
+            "result": {"monthly_payment": 1234.5},
+        }
+
+    def test_ok_response(self):
+        """Test that ok_response returns fresh responses with the constant bodies."""
+        with app.app_context():
+            first = ok_response()
+            second = ok_response()
+            unchanged = ok_response(unchanged=True)
+
+        assert first is not second
+        assert first.mimetype == "application/json"
+        assert json.loads(first.data) == {"success": True}
+        assert json.loads(unchanged.data) == {"success": True, "unchanged": True}
+
+    def test_error_response(self):
+        """Test that error_response escapes the message and sets the status."""
+        with app.app_context():
+            response = error_response('Bad "value"', 422)
+
+        assert response.status_code == 422
+        assert json.loads(response.data) == {"success": False, "error": 'Bad "value"'}
+
+
+class TestAppJsonProvider:
+    """Test that application endpoints are served by the orjson provider."""
+
+    def setup_method(self):
+        """Set up test client."""
+        app.config["TESTING"] = True
+        app.config["WTF_CSRF_ENABLED"] = False
+        self.client = app.test_client()
+
+    def test_app_uses_orjson_provider(self):
+        """Test that the app installs the orjson provider."""
+        assert isinstance(app.json, OrjsonProvider)
+
+    def test_responses_are_compact_and_unsorted(self):
+        """Test that app responses are never indented and keep insertion order."""
+        with app.test_request_context(), patch.dict(app.config, {"DEBUG": True}):
+            response = app.json.response({"b": 1, "a": [1, 2]})
+
+        assert response.data == b'{"b":1,"a":[1,2]}'
+
+    def test_calculate_response(self):
+        """Test that /calculate responses are encoded by the orjson provider."""
+        data = {
+            "purchase_price": 300000,
+            "down_payment_percentage": 20,
+            "annual_rate": 6.5,
+            "loan_term": 30,
+            "annual_tax_rate": 1.2,
+            "annual_insurance_rate": 0.35,
+            "loan_type": "conventional",
+        }
+
+        with patch.object(
+            OrjsonProvider, "response", autospec=True, side_effect=OrjsonProvider.response
+        ) as spy:
+            response = self.client.post("/calculate", json=data)
+
+        assert response.status_code == 200
+        assert spy.called
+        assert json.loads(response.data)["loan_details"]["loan_amount"] == 240000
+
+    def test_admin_mutation_response(self):
+        """Test that admin JSON responses are encoded by the orjson provider."""
+        with self.client.session_transaction() as sess:
+            sess["admin_logged_in"] = True
+
+        with patch.object(
+            OrjsonProvider, "response", autospec=True, side_effect=OrjsonProvider.response
+        ) as spy:
+            response = self.client.post("/admin/compliance/add", json={})
+
+        assert spy.called
+        assert json.loads(response.data)["success"] is False
+
+    def test_dashboard_data_response(self):
+        """Test that the admin dashboard data is encoded by the orjson provider."""
+        with self.client.session_transaction() as sess:
+            sess["admin_logged_in"] = True
+
+        with patch.object(
+            OrjsonProvider, "response", autospec=True, side_effect=OrjsonProvider.response
+        ) as spy:
+            response = self.client.get("/admin/dashboard/data")
+
+        assert spy.called
+        assert "stats" in json.loads(response.data)
+
+    def test_market_data_response(self):
+        """Test that /api/market-data returns valid JSON through the provider."""
+        with patch(
+            "market_data_api.market_data_api.get_market_summary",
+            side_effect=RuntimeError("offline"),
+        ):
+            response = self.client.get("/api/market-data")
+
+        assert response.status_code == 200
+        assert response.mimetype == "application/json"
+        result = json.loads(response.data)
+        assert result["success"] is True
+        assert "mortgage_rate_30y" in result["data"]
+
+    def test_fallback_market_data_is_reused(self):
+        """Test that repeated fallback responses reuse the serialized body."""
+        with patch(
+            "market_data_api.market_data_api.get_market_summary",
+            side_effect=RuntimeError("offline"),
+        ):
+            first = self.client.get("/api/market-data")
+            second = self.client.get("/api/market-data")
+
+        assert first.data == second.data
+
+    def test_refinance_error_response(self):
+        """Test that refinance error responses are encoded by the provider."""
+        response = self.client.post("/refinance", json={"appraised_value": ""})
+
+        assert response.status_code == 400
+        result = json.loads(response.data)
+        assert result["success"] is False
+        assert "appraised_value" in result["error"]
@@ -19,7 +19,9 @@ from unittest.mock import patch, MagicMock
 # Add the parent directory to the path so we can import the calculator
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from calculator import MortgageCalculator
+from calculator import MortgageCalculator, _amortization_factor, _parse_iso_date
+from calculations.title_insurance import _parse_rate_tiers, calculate_owners_title_insurance
+from mortgage_insurance import _parse_ltv_ranges, calculate_conventional_pmi
 
 
 class TestMortgageCalculatorBasics:
@@ -156,6 +158,20 @@ class TestLoanTypes:
         # USDA loans have guarantee fees similar to FHA MIP
         assert result['monthly_payment']['mortgage_insurance'] > 0
 
+    @pytest.mark.parametrize("loan_type,ltv,expected", [
+        ('FHA', 96.5, 18000.0),
+        ('va', 100.0, 12000.0),
+        ('usda', 100.0, 18000.0),
+        ('conventional', 95.0, 9000.0),
+        ('conventional', 90.0, 18000.0),
+        ('conventional', 80.0, 18000.0),
+        ('conventional', 75.0, 27000.0),
+        ('unknown', 60.0, 27000.0),
+    ])
+    def test_max_seller_contribution_limits(self, loan_type, ltv, expected):
+        """Test seller contribution limits by loan type and conventional LTV tier."""
+        assert self.calc._calculate_max_seller_contribution(loan_type, ltv, 300000) == expected
+
 
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
@@ -376,5 +392,84 @@ class TestPrecisionAndAccuracy:
         assert result1['loan_details']['ltv'] == result2['loan_details']['ltv']
 
 
+    def test_amortization_factor_reused_across_principals(self):
+        """Test that payments for one rate and term share the cached amortization factor."""
+        _amortization_factor.cache_clear()
+
+        payment = self.calc.calculate_monthly_payment(240000, 6.5, 30)
+        self.calc.calculate_monthly_payment(260000, 6.5, 30)
+
+        info = _amortization_factor.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert payment == 1516.96
+
+    def test_amortization_data_matches_monthly_schedule(self):
+        """Test that yearly balances match a month-by-month schedule and reach zero."""
+        principal, annual_rate, years = 240000, 6.5, 30
+        balances = self.calc.generate_amortization_data(principal, annual_rate, years)
+
+        monthly_rate = annual_rate / 12 / 100
+        payment = principal * monthly_rate / (1 - (1 + monthly_rate) ** -(years * 12))
+        balance = principal
+        expected = []
+        for month in range(1, years * 12 + 1):
+            balance -= payment - balance * monthly_rate
+            if month % 12 == 0:
+                expected.append(max(0, balance))
+
+        assert len(balances) == years
+        assert balances == pytest.approx(expected, abs=0.01)
+        assert balances[-1] == 0
+
+    def test_pmi_ltv_ranges_parsed_once(self):
+        """Test that PMI lookups reuse the parsed LTV range table."""
+        pmi_config = {"ltv_ranges": {"80.01-85.00": 0.3, "85.01-90.00": 0.49}}
+        _parse_ltv_ranges.cache_clear()
+
+        first = calculate_conventional_pmi(270000, 300000, pmi_config, MagicMock())
+        # 95% LTV is above every range, so the highest range's rate applies
+        fallback = calculate_conventional_pmi(285000, 300000, pmi_config, MagicMock())
+
+        info = _parse_ltv_ranges.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+        assert first == round(270000 * 0.0049 / 12, 2)
+        assert fallback == round(285000 * 0.0049 / 12, 2)
+
+    def test_title_rate_tiers_parsed_once(self):
+        """Test that title insurance lookups reuse the parsed tier tables."""
+        title_config = {
+            "simultaneous_issuance_fee": 150.0,
+            "total_rates_tiers": [
+                {"up_to": None, "rate_percentage": 0.425},
+                {"up_to": 100000, "rate_percentage": 0.625},
+            ],
+            "lender_rates_simultaneous_tiers": [
+                {"up_to": 100000, "rate_percentage": 0.325},
+                {"up_to": None, "rate_percentage": 0.225},
+            ],
+        }
+        _parse_rate_tiers.cache_clear()
+
+        small = calculate_owners_title_insurance(80000, 64000, True, title_config)
+        large = calculate_owners_title_insurance(400000, 320000, True, title_config)
+
+        info = _parse_rate_tiers.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+        # Unordered tiers still resolve in 'up_to' order, open-ended tier last
+        assert small == round(80000 * 0.00625 + 150 - 64000 * 0.00325, 2)
+        assert large == round(400000 * 0.00425 + 150 - 320000 * 0.00225, 2)
+
+    def test_parse_iso_date_accepts_unpadded_dates(self):
+        """Test that closing dates parse with or without zero padding."""
+        from datetime import date
+
+        assert _parse_iso_date("2025-07-04") == date(2025, 7, 4)
+        assert _parse_iso_date("2025-7-4") == date(2025, 7, 4)
+        with pytest.raises(ValueError):
+            _parse_iso_date("07/04/2025")
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file
@@ -15,6 +15,7 @@ import pytest
 import json
 import sys
 import os
+import time
 from unittest.mock import patch, MagicMock
 
 # Add the parent directory to the path
@@ -194,6 +195,18 @@ class TestInputValidation:
         # Should reject negative values
         assert response.status_code in [400, 422]
 
+    def test_oversized_request_body_rejected(self):
+        """Test that bodies above MAX_CONTENT_LENGTH are rejected before parsing."""
+        oversized = json.dumps({'padding': 'x' * (app.config['MAX_CONTENT_LENGTH'] + 1)})
+
+        with patch('flask_wtf.csrf.validate_csrf', return_value=True):
+            response = self.client.post('/refinance',
+                                        data=oversized,
+                                        content_type='application/json',
+                                        headers={'X-CSRFToken': 'valid_token'})
+
+        assert response.status_code == 413
+
 
 class TestAdminSecurity:
     """Test admin authentication and authorization."""
@@ -224,6 +237,67 @@ class TestAdminSecurity:
             # Should redirect to login or return 401/403
             assert response.status_code in [302, 401, 403]
     
+    def test_admin_page_revalidates_with_etag(self):
+        """Test that admin pages send an ETag and answer 304 for an unchanged page."""
+        with self.client.session_transaction() as sess:
+            sess['admin_logged_in'] = True
+
+        # Freeze the clock so both requests fall in the same ETag time bucket
+        with patch('time.time', return_value=time.time()):
+            response = self.client.get('/admin/fees')
+            assert response.status_code == 200
+            etag = response.headers['ETag']
+            assert 'no-store' not in response.headers['Cache-Control']
+
+            response = self.client.get('/admin/fees', headers={'If-None-Match': etag})
+            assert response.status_code == 304
+            assert response.data == b''
+
+    def test_dashboard_data_revalidates_with_etag(self):
+        """Test that unchanged dashboard polls are answered with 304."""
+        with self.client.session_transaction() as sess:
+            sess['admin_logged_in'] = True
+
+        response = self.client.get('/admin/dashboard/data')
+        assert response.status_code == 200
+        etag = response.headers['ETag']
+        assert 'no-store' not in response.headers['Cache-Control']
+
+        with patch.object(app.config_manager, 'get_system_health') as get_system_health:
+            response = self.client.get('/admin/dashboard/data', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        get_system_health.assert_not_called()
+
+    def test_mortgage_config_update_rejects_unknown_fields(self):
+        """Test that mortgage config updates ignore arbitrary keys and skip the save."""
+        with self.client.session_transaction() as sess:
+            sess['admin_logged_in'] = True
+
+        with patch.dict(app.config, {'WTF_CSRF_ENABLED': False}), patch.object(
+            app.config_manager, 'save_config'
+        ) as save_config:
+            response = self.client.post(
+                '/admin/mortgage-config/update', json={'secret_key': 'overwritten'}
+            )
+
+        assert response.status_code == 400
+        assert 'secret_key' not in app.config_manager.config
+        save_config.assert_not_called()
+
+    def test_admin_dispatchers_reject_missing_entries(self):
+        """Test that the compliance and template dispatchers 404 on unknown entries."""
+        with self.client.session_transaction() as sess:
+            sess['admin_logged_in'] = True
+
+        with patch.dict(app.config, {'WTF_CSRF_ENABLED': False}):
+            edit = self.client.post(
+                '/admin/compliance/edit/no_such_section', json={'text': 'updated'}
+            )
+            delete = self.client.post('/admin/templates/delete/no_such_template')
+
+        assert edit.status_code == 404
+        assert delete.status_code == 404
+
     def test_admin_login_rate_limiting(self):
         """Test that admin login has some form of rate limiting or delay."""
         # Attempt multiple failed logins
@@ -320,6 +394,14 @@ class TestResponseHeaders:
         assert "'self'" in csp
         assert "script-src" in csp
     
+    def test_static_responses_skip_security_headers(self):
+        """Test that static files are served without the dynamic-page headers."""
+        response = self.client.get('/static/css/styles.css')
+
+        assert response.status_code == 200
+        assert 'Content-Security-Policy' not in response.headers
+        response.close()
+
     def test_no_sensitive_information_in_headers(self):
         """Test that headers don't leak sensitive information."""
         response = self.client.get('/')